@@ -1,212 +1,212 @@
-# '东港', '老虎滩', '营口', '鲅鱼圈', '葫芦岛', '芷锚湾', '秦皇岛', '曹妃甸', '塘沽', '歧口', '黄骅',
-#    '滨州港', '东营港', '孤东', '羊角沟', '潍坊', '龙口', '蓬莱', '芝罘岛', '成山头', '石岛', '乳山口',
-#    '五码头', '小麦岛', '日照', '连云港', '燕尾', '滨海', '外磕角', '吕泗', '堡镇', '吴淞', '高桥',
-#    '芦潮港', '大戢山', '金山嘴', '滩浒岛', '乍浦', '澉浦', '岱山', '定海', '镇海', '沈家门', '石浦',
-#    '健跳', '海门Z', '坎门', '温州S', '瑞安S', '鳌江S', '沙埕', '三沙', '北茭', '琯头', '梅花',
-#    '平潭', '崇武', '厦门', '东山', '云澳', '汕头S', '汕头H', '海门G', '汕尾', '南沙', '遮浪',
-#    '盐田', '赤湾', '珠海', '灯笼山', '三灶', '涠洲', '北津', '防城港', '石头埠', '闸坡', '白龙尾',
-#    '北海', '水东', '湛江S', '硇洲', '南渡', '海安', '秀英', '清澜', '东方', '港北', '乌场', '三亚',
-#    '惠州', '黄埔', '雷州'
-station_code_dicts = {
-    '汕尾': 'SHW',
-    '惠州': 'HZO',
-    '盐田': 'YTA',
-    '深圳东山': 'SDS',
-    '深圳南澳': 'NAO',
-    '大梅沙': 'DMS',
-    '蛇口': 'SHK',
-    '赤湾': 'CWH',
-    '前海湾': 'QHW',
-    '深圳机场': 'SZJ',
-    '平潭': 'PTN',
-    '福清核电': 'FQH',
-    '石城': 'SHC',
-    '峰尾': 'FHW',
-    '崇武': 'CHW',
-    '晋江': 'JJH',
-    '石井': 'SJH',
-    '厦门': 'XMN',
-    '旧镇': 'JZH',
-    '古雷': 'GUL',
-    '东山': 'DSH',
-    '赤石湾': 'CSW',
-    '云澳': 'YAO',
-    '汕头S': 'STO',
-    '海门G': 'HMN',
-    '惠来': 'HLA',
-    '陆丰': 'LFG',
-    '遮浪': 'ZHL',
-    '南沙': 'NSA',
-    '黄埔': 'HPU',
-    '珠海': 'ZHU',
-    '灯笼山': 'DLS',
-    '三灶': 'SZA',
-    '北津': 'BJI',
-    '闸坡': 'ZHP',
-    '水东': 'SHD',
-    '湛江S': 'ZJS',
-    '湛江H': 'ZJH',
-    '硇洲': 'NAZ',
-    '南渡': 'NAD',
-    '海安': 'HAN',
-    '秀英': 'XYG',
-    '清澜': 'QLN',
-    '博鳌': 'BAO',
-    '港北': 'GBE',
-    '三亚': 'SYA',
-    '东方': 'DFG',
-    '石头埠': 'STP',
-    '涠洲': 'WZH',
-    '北海': 'BHI',
-    '钦州': 'QZH',
-    '防城港': 'FCG',
-    '乌场': 'WCH',
-    '莺歌海': 'YGH',
-    '芦潮港': 'LCG',
-    '大戢山': 'DJS',
-    '金山嘴': 'JSZ',
-    '滩浒': 'TXU',
-    '乍浦': 'ZPU',
-    '澉浦': 'GPU',
-    '嵊山': 'SHS',
-    '定海': 'DHI',
-    '镇海': 'ZHI',
-    '沈家门': 'SJM',
-    '岱山': 'DAI',
-    '北仑': 'BLN',
-    '乌沙山': 'WSH',
-    '石浦': 'SPU',
-    '健跳': 'JAT',
-    '海门Z': 'HMZ',
-    '大陈': 'DCH',
-    '坎门': 'KMN',
-    '温州S': 'WZS',
-    '瑞安S': 'RAS',
-    '鳌江S': 'AJS',
-    '沙埕': 'SCS',  # - 23-09-15 此处修改文件中的中文索引为: 沙埕
-    '秦屿': 'QYU',
-    '三沙': 'SHA',
-    '北礵': 'BSH',
-    '城澳': 'CAO',
-    '青屿': 'QGY',
-    '北茭': 'BJA',
-    '琯头': 'GTO',
-    '梅花': 'MHA',
-    '白岩潭': 'BYT',
-    # '赤湾H': 'CHH',
-    # '南沙': 'GNS',
-    '东港': 'DGG',
-    '小长山': 'XCS',
-    '老虎滩': 'LHT',
-    '鲅鱼圈': 'BYQ',
-    '营口': 'YKO',
-    '葫芦岛': 'HLD',
-    '芷锚湾': 'ZMW',
-    '秦皇岛': 'QHD',
-    '塘沽': 'TGU',
-    '曹妃甸': 'CFD',
-    '黄骅': 'HHA',
-    '滨州港': 'BZG',
-    '东营港': 'DYG',
-    '羊角沟': 'YJG',
-    '潍坊': 'WFG',
-    '龙口': 'LKO',
-    '蓬莱': 'PLI',
-    '烟台': 'YTI',
-    '成山头': 'CST',
-    '文登': 'WDG',
-    '石岛': 'SID',
-    '千里岩': 'QLY',
-    '五码头': 'WMT',
-    '小麦岛': 'XMD',
-    '日照': 'RZH',
-    '岚山': 'LSH',
-    '连云港': 'LYG',
-    '燕尾': 'YWI',
-    '洋口港': 'YKG',
-    '吕泗': 'LSI',
-    '堡镇': 'BZH',
-    '吴淞': 'WSG',
-    '高桥': 'GQA',
-    '崇明': 'CMG',
-    '广东省': 'GUANGDONG',
-    '汕头市': 'SHANTOU',
-    '揭阳市': 'JIEYANG',
-    '汕尾市': 'SHANWEI',
-    '惠州市': 'HUIZHOU',
-    '深圳市': 'SHENZHEN',
-    '东莞市': 'DONGGUAN',
-    '广州市': 'GUANGZHOU',
-    '中山市': 'ZHONGSHAN',
-    '珠海市': 'ZHUHAI',
-    '江门市': 'JIANGMEN',
-    '阳江市': 'YANGJIANG',
-    '茂名市': 'MAOMING',
-    '湛江市': 'ZHANJIANG',
-    '饶平': 'RPG',
-    '横门': 'HGM',
-    '妈阁': 'MGE',
-    '台山': 'TSH',
-    # '北津': 'BJN',
-    '雷州': 'LZH',
-    '洞头': 'DTO',
-    '龙湾': 'LGW',
-    '长门': 'CGM',
-    '潭头': 'TNT',
-    '丹东市': 'DANDONGSHI',
-    '大连市': 'DALIANSHI',
-    '营口市': 'YINGKOUSHI',
-    '辽宁省': 'LIAONINGSHENG',
-    '锦州市': 'PANJINSHI',
-    '秦皇岛市': 'QINGHUANGDAOSHI',
-    '河北省': 'HEBEISHENG',
-    '唐山市': 'TANGSHANSHI',
-    '沧州市': 'CANGZHOUSHI',
-    '葫芦岛市': 'HULUDAOSHI',
-    '天津': 'TIANJIN',
-    '天津市': 'TIANJINSHI',
-    '滨州市': 'BINZHOUSHI',
-    '山东省': 'SHANDONGSHENG',
-    '东营市': 'DONGYINGSHI',
-    '潍坊市': 'WEIFANGSHI',
-    '烟台市': 'YANTAISHI',
-    '威海市': 'WEIHAISHI',
-    '青岛市': 'QINGDAOSHI',
-    '日照市': 'RIZHAOSHI',
-    '江苏省': 'JIANGSU',
-    '连云港市': 'LIANYUNGANGSHI',
-    '盐城市': 'YANCHENGSHI',
-    '南通市': 'NANTONGSHI',
-    '上海': 'SHANGHAI',
-    '浙江': 'ZHEJIANGSHENG',
-    '舟山市': 'ZHOUSHANSHI',
-    '嘉兴市': 'JIAXINGSHI',
-    '宁波市': 'NINGBOSHI',
-    '台州市': 'TAIZHOUSHI',
-    '温州市': 'WENZHOUSHI',
-    '福建': 'FUJIANSHENG',
-    '宁德市': 'NINGDESHI',
-    '福州市': 'FUZHOUSHI',
-    '莆田市': 'PUTIANSHI',
-    '泉州市': 'QUANZHOUSHI',
-    '厦门市': 'XIAMENSHI',
-    '漳州市': 'ZHANGZHOUSHI',
-    '潮州市': 'CHAOZHOUSHI',
-    '海南省': 'HAINANSHENG',
-    '海口市': 'HAIKOUSHI',
-    '文昌市': 'WENCHANGSHI',
-    '琼海市': 'QIONGHAISHI',
-    '万宁市': 'WANNINGSHI',
-    '三亚市': 'SANYASHI',
-    '乐东县': 'LEDONGXIAN',
-    '三沙市': 'SANSHASHI',
-    '东方市': 'DONGFANGSHI',
-    '广西省': 'GUANGXISHENG',
-    '钦州市': 'QINZHOUSHI',
-    '北海市': 'BEIHAISHI',
-    '防城港市': 'FANGCHENGGANGSHI',
-    # - 23-09-15
-    '孤东': 'GUD',
-    '芝罘岛': 'ZFD',
-
-}
+# '东港', '老虎滩', '营口', '鲅鱼圈', '葫芦岛', '芷锚湾', '秦皇岛', '曹妃甸', '塘沽', '歧口', '黄骅',
+#    '滨州港', '东营港', '孤东', '羊角沟', '潍坊', '龙口', '蓬莱', '芝罘岛', '成山头', '石岛', '乳山口',
+#    '五码头', '小麦岛', '日照', '连云港', '燕尾', '滨海', '外磕角', '吕泗', '堡镇', '吴淞', '高桥',
+#    '芦潮港', '大戢山', '金山嘴', '滩浒岛', '乍浦', '澉浦', '岱山', '定海', '镇海', '沈家门', '石浦',
+#    '健跳', '海门Z', '坎门', '温州S', '瑞安S', '鳌江S', '沙埕', '三沙', '北茭', '琯头', '梅花',
+#    '平潭', '崇武', '厦门', '东山', '云澳', '汕头S', '汕头H', '海门G', '汕尾', '南沙', '遮浪',
+#    '盐田', '赤湾', '珠海', '灯笼山', '三灶', '涠洲', '北津', '防城港', '石头埠', '闸坡', '白龙尾',
+#    '北海', '水东', '湛江S', '硇洲', '南渡', '海安', '秀英', '清澜', '东方', '港北', '乌场', '三亚',
+#    '惠州', '黄埔', '雷州'
+station_code_dicts = {
+    '汕尾': 'SHW',
+    '惠州': 'HZO',
+    '盐田': 'YTA',
+    '深圳东山': 'SDS',
+    '深圳南澳': 'NAO',
+    '大梅沙': 'DMS',
+    '蛇口': 'SHK',
+    '赤湾': 'CWH',
+    '前海湾': 'QHW',
+    '深圳机场': 'SZJ',
+    '平潭': 'PTN',
+    '福清核电': 'FQH',
+    '石城': 'SHC',
+    '峰尾': 'FHW',
+    '崇武': 'CHW',
+    '晋江': 'JJH',
+    '石井': 'SJH',
+    '厦门': 'XMN',
+    '旧镇': 'JZH',
+    '古雷': 'GUL',
+    '东山': 'DSH',
+    '赤石湾': 'CSW',
+    '云澳': 'YAO',
+    '汕头S': 'STO',
+    '海门G': 'HMN',
+    '惠来': 'HLA',
+    '陆丰': 'LFG',
+    '遮浪': 'ZHL',
+    '南沙': 'NSA',
+    '黄埔': 'HPU',
+    '珠海': 'ZHU',
+    '灯笼山': 'DLS',
+    '三灶': 'SZA',
+    '北津': 'BJI',
+    '闸坡': 'ZHP',
+    '水东': 'SHD',
+    '湛江S': 'ZJS',
+    '湛江H': 'ZJH',
+    '硇洲': 'NAZ',
+    '南渡': 'NAD',
+    '海安': 'HAN',
+    '秀英': 'XYG',
+    '清澜': 'QLN',
+    '博鳌': 'BAO',
+    '港北': 'GBE',
+    '三亚': 'SYA',
+    '东方': 'DFG',
+    '石头埠': 'STP',
+    '涠洲': 'WZH',
+    '北海': 'BHI',
+    '钦州': 'QZH',
+    '防城港': 'FCG',
+    '乌场': 'WCH',
+    '莺歌海': 'YGH',
+    '芦潮港': 'LCG',
+    '大戢山': 'DJS',
+    '金山嘴': 'JSZ',
+    '滩浒': 'TXU',
+    '乍浦': 'ZPU',
+    '澉浦': 'GPU',
+    '嵊山': 'SHS',
+    '定海': 'DHI',
+    '镇海': 'ZHI',
+    '沈家门': 'SJM',
+    '岱山': 'DAI',
+    '北仑': 'BLN',
+    '乌沙山': 'WSH',
+    '石浦': 'SPU',
+    '健跳': 'JAT',
+    '海门Z': 'HMZ',
+    '大陈': 'DCH',
+    '坎门': 'KMN',
+    '温州S': 'WZS',
+    '瑞安S': 'RAS',
+    '鳌江S': 'AJS',
+    '沙埕': 'SCS',  # - 23-09-15 此处修改文件中的中文索引为: 沙埕
+    '秦屿': 'QYU',
+    '三沙': 'SHA',
+    '北礵': 'BSH',
+    '城澳': 'CAO',
+    '青屿': 'QGY',
+    '北茭': 'BJA',
+    '琯头': 'GTO',
+    '梅花': 'MHA',
+    '白岩潭': 'BYT',
+    # '赤湾H': 'CHH',
+    # '南沙': 'GNS',
+    '东港': 'DGG',
+    '小长山': 'XCS',
+    '老虎滩': 'LHT',
+    '鲅鱼圈': 'BYQ',
+    '营口': 'YKO',
+    '葫芦岛': 'HLD',
+    '芷锚湾': 'ZMW',
+    '秦皇岛': 'QHD',
+    '塘沽': 'TGU',
+    '曹妃甸': 'CFD',
+    '黄骅': 'HHA',
+    '滨州港': 'BZG',
+    '东营港': 'DYG',
+    '羊角沟': 'YJG',
+    '潍坊': 'WFG',
+    '龙口': 'LKO',
+    '蓬莱': 'PLI',
+    '烟台': 'YTI',
+    '成山头': 'CST',
+    '文登': 'WDG',
+    '石岛': 'SID',
+    '千里岩': 'QLY',
+    '五码头': 'WMT',
+    '小麦岛': 'XMD',
+    '日照': 'RZH',
+    '岚山': 'LSH',
+    '连云港': 'LYG',
+    '燕尾': 'YWI',
+    '洋口港': 'YKG',
+    '吕泗': 'LSI',
+    '堡镇': 'BZH',
+    '吴淞': 'WSG',
+    '高桥': 'GQA',
+    '崇明': 'CMG',
+    '广东省': 'GUANGDONG',
+    '汕头市': 'SHANTOU',
+    '揭阳市': 'JIEYANG',
+    '汕尾市': 'SHANWEI',
+    '惠州市': 'HUIZHOU',
+    '深圳市': 'SHENZHEN',
+    '东莞市': 'DONGGUAN',
+    '广州市': 'GUANGZHOU',
+    '中山市': 'ZHONGSHAN',
+    '珠海市': 'ZHUHAI',
+    '江门市': 'JIANGMEN',
+    '阳江市': 'YANGJIANG',
+    '茂名市': 'MAOMING',
+    '湛江市': 'ZHANJIANG',
+    '饶平': 'RPG',
+    '横门': 'HGM',
+    '妈阁': 'MGE',
+    '台山': 'TSH',
+    # '北津': 'BJN',
+    '雷州': 'LZH',
+    '洞头': 'DTO',
+    '龙湾': 'LGW',
+    '长门': 'CGM',
+    '潭头': 'TNT',
+    '丹东市': 'DANDONGSHI',
+    '大连市': 'DALIANSHI',
+    '营口市': 'YINGKOUSHI',
+    '辽宁省': 'LIAONINGSHENG',
+    '锦州市': 'PANJINSHI',
+    '秦皇岛市': 'QINGHUANGDAOSHI',
+    '河北省': 'HEBEISHENG',
+    '唐山市': 'TANGSHANSHI',
+    '沧州市': 'CANGZHOUSHI',
+    '葫芦岛市': 'HULUDAOSHI',
+    '天津': 'TIANJIN',
+    '天津市': 'TIANJINSHI',
+    '滨州市': 'BINZHOUSHI',
+    '山东省': 'SHANDONGSHENG',
+    '东营市': 'DONGYINGSHI',
+    '潍坊市': 'WEIFANGSHI',
+    '烟台市': 'YANTAISHI',
+    '威海市': 'WEIHAISHI',
+    '青岛市': 'QINGDAOSHI',
+    '日照市': 'RIZHAOSHI',
+    '江苏省': 'JIANGSU',
+    '连云港市': 'LIANYUNGANGSHI',
+    '盐城市': 'YANCHENGSHI',
+    '南通市': 'NANTONGSHI',
+    '上海': 'SHANGHAI',
+    '浙江': 'ZHEJIANGSHENG',
+    '舟山市': 'ZHOUSHANSHI',
+    '嘉兴市': 'JIAXINGSHI',
+    '宁波市': 'NINGBOSHI',
+    '台州市': 'TAIZHOUSHI',
+    '温州市': 'WENZHOUSHI',
+    '福建': 'FUJIANSHENG',
+    '宁德市': 'NINGDESHI',
+    '福州市': 'FUZHOUSHI',
+    '莆田市': 'PUTIANSHI',
+    '泉州市': 'QUANZHOUSHI',
+    '厦门市': 'XIAMENSHI',
+    '漳州市': 'ZHANGZHOUSHI',
+    '潮州市': 'CHAOZHOUSHI',
+    '海南省': 'HAINANSHENG',
+    '海口市': 'HAIKOUSHI',
+    '文昌市': 'WENCHANGSHI',
+    '琼海市': 'QIONGHAISHI',
+    '万宁市': 'WANNINGSHI',
+    '三亚市': 'SANYASHI',
+    '乐东县': 'LEDONGXIAN',
+    '三沙市': 'SANSHASHI',
+    '东方市': 'DONGFANGSHI',
+    '广西省': 'GUANGXISHENG',
+    '钦州市': 'QINZHOUSHI',
+    '北海市': 'BEIHAISHI',
+    '防城港市': 'FANGCHENGGANGSHI',
+    # - 23-09-15
+    '孤东': 'GUD',
+    '芝罘岛': 'ZFD',
+
+}
@@ -15,6 +15,13 @@ DATABASES = {
         'OPTIONS': {
             "init_command": "SET foreign_key_checks = 0;",
         },
+        # 连接池配置(进程内共享同一个 engine)
+        'POOL': {
+            'pool_size': 5,
+            'max_overflow': 10,
+            'pool_recycle': 3600,  # 单位s
+            'pool_pre_ping': True,
+        },
     },
 
     'mongo': {
@@ -50,3 +57,40 @@ DB_TABLE_SPLIT_OPTIONS = {
         'tab_split_name': 'station_realdata_specific'
     }
 }
+
+# 批量入库配置
+DB_BULK_OPTIONS = {
+    'station': {
+        # 每批次 INSERT ... ON DUPLICATE KEY UPDATE 写入的行数
+        'batch_size': 2000
+    }
+}
+
+# + 24-06-17 站点增水汇总(station_surge_summary)的超阈值等级，exceed_level 为最大增水超过的阈值个数
+# TODO:[-] 24-06-30 注意: 此处为全部站点共用的增水阈值(单位与 surge 一致)，并非各站点的四色警戒潮位
+#   - 站点警戒潮位由 station-base 服务提供(仅 server 端可访问)，后台入库流程中没有警戒潮位数据源，因此以统一阈值代替
+#   - 局限: 不区分站点，且比较的是增水而非总潮位(增水+天文潮)，exceed_level 只用于粗略排序/筛选，
+#           不能作为站点是否超过警戒潮位的依据(需由 server 端结合天文潮及警戒潮位判断)
+SURGE_EXCEED_THRESHOLDS = [50, 100, 150, 200]
+
+# + 24-06-25 栅格产品写出配置
+COVERAGE_WRITE_OPTIONS = {
+    # nc: zlib + shuffle 压缩，chunk 按维度名称设置(超出维度长度时取维度长度)
+    'NC': {
+        'zlib': True,
+        'complevel': 4,
+        'shuffle': True,
+        'chunk_sizes': {'time': 1, 'lat': 128, 'lon': 128}
+    },
+    # tif: 分块(tile)存储并压缩，块大小需为 16 的倍数
+    'TIF': {
+        'tiled': True,
+        'blockxsize': 128,
+        'blockysize': 128,
+        'compress': 'DEFLATE'
+    },
+    # + 24-06-26 风场逐时 tif 并行写出的进程数(为 None 时为 cpu 核数)
+    'WIND_TIF': {
+        'max_workers': None
+    }
+}
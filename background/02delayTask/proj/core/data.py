@@ -1,844 +1,1027 @@
-import abc
-import datetime
-import pathlib
-
-import xarray
-from sqlalchemy.ext.automap import automap_base
-from sqlalchemy import distinct, select, update
-from sqlalchemy import ForeignKey, Sequence, MetaData, Table
-from sqlalchemy import Column, Date, Float, ForeignKey, Integer, text
-from sqlalchemy.dialects.mysql import DATETIME, INTEGER, TINYINT, VARCHAR
-from arrow import Arrow
-import arrow
-import shutil
-from typing import Optional, List, Dict
-
-from pandas import Series
-import pandas as pd
-import numpy as np
-import xarray as xr
-import rioxarray
-
-# ftp 库
-import ftplib
-
-from common.default import DEFAULT_FK_STR
-from conf._privacy import FTP_LIST
-from core.db import DbFactory
-from core.files import StationRealDataFile, CoverageFile
-from conf.settings import DOWNLOAD_OPTIONS
-from core.task import TaskFile
-from model.mid_models import FtpClientMidModel
-from model.station import StationForecastRealDataModel
-from model.coverage import GeoCoverageFileModel
-from util.decorators import decorator_job
-from util.util import get_relative_path, FtpFactory
-from common.enums import JobStepsEnum, CoverageTypeEnum
-from common.comm_dicts import station_code_dicts
-
-
-class IFileInfo:
-
-    def __init__(self, now: Arrow):
-        self.now: Arrow = now
-        self.session = DbFactory().Session
-
-    def get_nearly_forecast_dt(self) -> Arrow:
-        """
-            预报文件生成的时间
-                预报时间: 00Z  发布时间 09-8=01 15-01
-                        12Z          23-8=15 01-15
-            此部分与 StationRealData 中重复
-        :return:
-        """
-        # 2023-05-22T07:58:43.111279+00:00
-        # 对应的本地时间为 2023-05-22T15:58:43.111279
-        now_utc: Arrow = self.now
-        stamp_hour = self.now.time().hour
-        forecast_dt: Arrow = Arrow(now_utc.date().year, now_utc.date().month, now_utc.date().day, 12, 0)
-        # 判断是 00Z 还是 12Z
-        # local time : [8,23)
-        if stamp_hour >= 0 and stamp_hour < 15:
-            now_utc = now_utc.shift(days=-1)
-            # [1,15]
-            forecast_dt: Arrow = Arrow(now_utc.date().year, now_utc.date().month, now_utc.date().day, 12, 0)
-        # local time : [23,9)
-        elif stamp_hour >= 15:
-            forecast_dt: Arrow = Arrow(now_utc.date().year, now_utc.date().month, now_utc.date().day, 0, 0)
-        # lcoal time: [8,8)
-        elif stamp_hour < 0:
-            now_utc = now_utc.shift(hours=-1)
-            forecast_dt: Arrow = Arrow(now_utc.date().year, now_utc.date().month, now_utc.date().day, 0, 0)
-        return forecast_dt
-
-    @abc.abstractmethod
-    def get_file_name(self):
-        pass
-
-    @abc.abstractmethod
-    def download(self, dir_path: str, copy_dir_path: str) -> StationRealDataFile:
-        pass
-
-
-class IFtpInfo:
-    """
-        + 23-09-20 新加入了ftp下载 info
-    """
-
-    def __init__(self, root_path: str, remote_path: str, now_arrow: Arrow):
-        self.root_path = root_path
-        self.remote_path = remote_path
-        # self.file_name = file_name
-        # utc 的当前时间
-        self.now_arrow: Arrow = now_arrow
-        self.session = DbFactory().Session
-
-    def get_nearly_forecast_dt(self) -> Arrow:
-        """
-            风场生成逻辑:
-            以 nwp 为例:
-                        nwp_high_res_wind_2023091600.nc | 23/09/16 17:52 [16日 当日 18 - 次日 05] local
-                        nwp_high_res_wind_2023091612.nc | 23/09/17 05:53 [17日 06 - 17日 18]  local
-                        ---
-                        nwp_high_res_wind_2023091600.nc | 23/09/16 17:52 [16日 当日 18 - 次日 05] local
-                        nwp_high_res_wind_2023091612.nc | 23/09/17 05:53 [17日 06 - 17日 18]  local
-                        utc : 00时 -> 17-8 =9
-                        utc : 12时 -> 5-8  =21
-                        23,0,1,2,3,4,5 -8 =
-            获取预报的utc时间
-
-        @return: 获取当前 self.now_arrow(utc)对应的预报时间(utc)
-        """
-        # 小时
-        stamp_hour = self.now_arrow.time().hour
-        now_utc: Arrow = self.now_arrow
-        # 预报基准时间(utc)
-        # 00,12
-        forecast_dt: Arrow = Arrow(now_utc.date().year, now_utc.date().month, now_utc.date().day, 0, 0)
-        # 16 6 -> 18
-        if stamp_hour >= 9 and stamp_hour <= 21:
-            # 预报时间是 前一日 12时
-            # 15
-            forecast_dt = forecast_dt
-        elif stamp_hour < 9:
-            # [0-5]
-            forecast_dt = forecast_dt.shift(hours=-12)
-        elif stamp_hour > 21:
-            forecast_dt = forecast_dt.shift(hours=12)
-        return forecast_dt
-
-    @abc.abstractmethod
-    def get_file_name(self) -> str:
-        pass
-
-
-class WindCoverageData(IFtpInfo):
-    """
-        风场栅格数据
-    """
-    # 经纬度范围
-    lat_range: List[float] = [16.1, 41.0]
-    lon_range: List[float] = [105.0, 126.9]
-
-    def __init__(self, root_path: str, remote_path: str, now_arrow: Arrow):
-        super(WindCoverageData, self).__init__(root_path, remote_path, now_arrow)
-
-    def get_file_name(self) -> str:
-        """
-            对应的文件名称
-        @return:
-        """
-        forecast_dt: Arrow = self.get_nearly_forecast_dt()
-        date_name: str = forecast_dt.format("YYYYMMDDHH")
-        file_name: str = f'nwp_high_res_wind_{date_name}.nc'
-        return file_name
-
-    def get_relative_path(self) -> str:
-        """
-            获取相对路径
-            * 统一根据 get_nearly_forecast_dt -> now_arrow 获取相对路径
-        @return:
-        """
-        forecast_dt: Arrow = self.get_nearly_forecast_dt()
-        return get_relative_path(forecast_dt)
-
-    def get_store_path(self) -> str:
-        """
-            获取存储路径
-            root_path/relative_path
-            * 统一根据 get_nearly_forecast_dt -> now_arrow 获取相对路径 relative_path
-        @return:
-        """
-        forecast_dt: Arrow = self.get_nearly_forecast_dt()
-        # 本地存储的相对路径(相对于root路径)
-        relative_path: str = self.get_relative_path()
-        store_path: str = str(pathlib.Path(self.root_path) / relative_path)
-        return store_path
-
-    def get_local_full_path(self) -> str:
-        """
-            下载到本地的文件全路径
-        @return:
-        """
-        return str(pathlib.Path(self.get_store_path()) / self.get_file_name())
-
-    def standard_ds(self, dir_path: str) -> bool:
-        """
-            将栅格文件标准化
-        @param dir_path:
-        @return:
-        """
-        return False
-
-    def download(self, ftp_client: FtpFactory, local_path: str, relative_path: str, key: str, pid=-1,
-                 file_ext: str = '.nc') -> \
-            Optional[CoverageFile]:
-        """
-            下载并返回下载后的 coverage file
-        @return:
-        """
-
-        # local_path: str = ftp_opt.get('LOCAL_PATH')
-        # relative_path: str = ftp_opt.get('RELATIVE_PATH')
-        #
-        target_file_name: str = self.get_file_name()
-        local_copy_full_path: str = self.get_local_full_path()
-        is_ok = True
-        # TODO:[*] 23-09-26 FileExistsError: [WinError 183] 当文件已存在时，无法创建该文件。: 'E:\\05DATA\\06wind'
-        # 'E:\\05DATA\\06wind\\2023\\09\\nwp_high_res_wind_2023092412.nc'
-        if pathlib.Path(local_copy_full_path).parent.exists():
-            pass
-        else:
-            pathlib.Path(local_copy_full_path).parent.mkdir(parents=True)
-        is_ok: bool = ftp_client.down_load_file_bycwd(local_copy_full_path, relative_path, target_file_name)
-        # is_ok: bool = True
-        download_file: Optional[CoverageFile] = None
-        if is_ok:
-            download_file: CoverageFile = CoverageFile(self.root_path, self.get_relative_path(), target_file_name)
-            # TODO:[-] 23-09-25 to db
-            if download_file is not None:
-                coverage_file_model: GeoCoverageFileModel = GeoCoverageFileModel(task_id=key,
-                                                                                 relative_path=download_file.relative_path,
-                                                                                 file_name=download_file.file_name,
-                                                                                 coverage_type=CoverageTypeEnum.NWP_SOURCE_COVERAGE_FILE.value,
-                                                                                 forecast_dt=download_file.forecast_dt_start.datetime,
-                                                                                 forecast_ts=download_file.forecast_dt_start.int_timestamp,
-                                                                                 issue_dt=download_file.forecast_dt_start.datetime,
-                                                                                 issue_ts=download_file.forecast_dt_start.int_timestamp,
-                                                                                 file_ext=file_ext,
-                                                                                 pid=pid
-                                                                                 )
-                try:
-                    self.session.add(coverage_file_model)
-                    self.session.commit()
-                except Exception as ex:
-                    self.session.close()
-
-        return download_file
-
-    def split_2_coverage(self, coverage_file: CoverageFile, key: str, pid=-1, file_ext: str = '.nc', ) -> Optional[
-        CoverageFile]:
-        """
-            按需裁剪风场文件
-            将下载后的风场文件切割并存储为新的nc文件
-        @return:
-        """
-        coverage_full_path: str = coverage_file.full_path
-        # TODO:[*] 23-09-26 暂时修改为 win 路径
-        # coverage_full_path = r'../data/nwp_high_res_wind_2023092512.nc'
-        # coverage_full_path = r'E:/05DATA/06wind/2023/09/nwp_high_res_wind_2023092512.nc'
-        root_path: str = coverage_file.root_path
-        relative_path: str = coverage_file.relative_path
-        file_name: str = coverage_file.file_name_only
-        saved_coverage_file: Optional[CoverageFile] = None
-        if pathlib.Path(coverage_full_path).exists():
-            # TODO:[-] 由于 win 路径的转义字符的问题造成读取bug
-            # nwp_high_res_wind_2023092512.nc
-            # '/data/local/2023/09/nwp_high_res_wind_2023092512.nc'
-            # 在docker中出现:AttributeError: 'EntryPoints' object has no attribute 'get'
-            # docker xarray 版本: '0.20.2'
-            #
-            print(f'读取风场文件目录:{coverage_full_path}')
-            ds_xr: xarray.Dataset = xarray.open_dataset(coverage_full_path)
-            # 获取经纬度的范围
-            min_lon: float = min(self.lon_range)
-            max_lon: float = max(self.lon_range)
-            min_lat: float = min(self.lat_range)
-            max_lat: float = max(self.lat_range)
-            mask_lon = (ds_xr.lon >= min_lon) & (ds_xr.lon <= max_lon)
-            mask_lat = (ds_xr.lat >= min_lat) & (ds_xr.lat <= max_lat)
-            # 根据经纬度范围裁剪生成新的 dataset
-            cropped_ds = ds_xr.where(mask_lon & mask_lat, drop=True)
-            save_name: str = f'{file_name}_output.nc'
-            save_full_path: str = str(pathlib.Path(root_path) / relative_path / save_name)
-            try:
-                # 已解决
-                cropped_ds.to_netcdf(save_full_path, format='NETCDF4', mode='w')
-                saved_coverage_file = CoverageFile(root_path, relative_path, save_name)
-                if saved_coverage_file is not None:
-                    # TODO:[-] 23-09-25 to db
-                    coverage_file_model: GeoCoverageFileModel = GeoCoverageFileModel(task_id=key,
-                                                                                     relative_path=relative_path,
-                                                                                     file_name=saved_coverage_file.file_name,
-                                                                                     coverage_type=CoverageTypeEnum.NWP_SPLIT_COVERAGE_FILE.value,
-                                                                                     forecast_dt=saved_coverage_file.forecast_dt_start.datetime,
-                                                                                     forecast_ts=saved_coverage_file.forecast_dt_start.int_timestamp,
-                                                                                     issue_dt=saved_coverage_file.forecast_dt_start.datetime,
-                                                                                     issue_ts=saved_coverage_file.forecast_dt_start.int_timestamp,
-                                                                                     file_ext=file_ext,
-                                                                                     pid=pid
-                                                                                     )
-                    try:
-                        self.session.add(coverage_file_model)
-                        self.session.commit()
-                        self.session.close()
-                    except Exception as ex:
-                        self.session.close()
-            except Exception as ex:
-                print(f'切分原始风场文件错误:{ex.args}')
-                self.session.close()
-        return saved_coverage_file
-
-    def convert_2_tif(self, coverage_file: CoverageFile, field_name: str, key: str, pid: int = -1, file_ext='.tif'):
-        """
-            将 nc -> 提取为 tif
-        @param ds:
-        @param field_name: 提取的字段名称
-        @return:
-        """
-        coord_time: str = 'time'
-        # TODO:[*] 23-10-09 线上部署时出错
-        print(f'读取:{coverage_file.full_path}并切分为tif ing')
-        # entrypoints = entry_points().get("xarray.backends", ())
-        # AttributeError: 'EntryPoints' object has no attribute 'get'
-        ds = xarray.open_dataset(coverage_file.full_path)
-        # 从 ds 中提取所有的时间维度
-        for index, temp_dt64 in enumerate(ds.coords[field_name].values):
-            # <xarray.DataArray 'time' ()>
-            # array('2023-09-25T12:00:00.000000000', dtype='datetime64[ns]')
-            # Coordinates:
-            #     time     datetime64[ns] 2023-09-25T12:00:00
-            # temp_dt: datetime.datetime = temp_dt64.astype(datetime.datetime)
-            # pd.to_datetime(temp_dt).to_pydatetime()
-            # dataarray datetime64 -> arrow
-            temp_dt_arrow: Arrow = arrow.get(pd.to_datetime(temp_dt64))
-            temp_split_ds: xr.Dataset = ds.isel(time=0)
-            # tif 栅格文件
-            tif_coverage_file: CoverageFile = self._loop_2_tif(coverage_file, temp_split_ds, index, temp_dt_arrow,
-                                                               field_name)
-            # TODO:[-] 23-09-25 to db
-            if tif_coverage_file is not None:
-                coverage_file_model: GeoCoverageFileModel = GeoCoverageFileModel(task_id=key,
-                                                                                 relative_path=tif_coverage_file.relative_path,
-                                                                                 file_name=tif_coverage_file.file_name,
-                                                                                 coverage_type=CoverageTypeEnum.NWP_TIF_FILE.value,
-                                                                                 forecast_dt=temp_dt_arrow.datetime,
-                                                                                 forecast_ts=temp_dt_arrow.int_timestamp,
-                                                                                 issue_dt=tif_coverage_file.forecast_dt_start.datetime,
-                                                                                 issue_ts=tif_coverage_file.forecast_dt_start.int_timestamp,
-                                                                                 file_ext=file_ext,
-                                                                                 pid=pid
-                                                                                 )
-                self.session.add(coverage_file_model)
-                self.session.commit()
-                self.session.close()
-        pass
-
-    def _loop_2_tif(self, coverage_file: CoverageFile, ds: xr.Dataset, index: int, forecast_dt: Arrow,
-                    field_name: str) -> Optional[CoverageFile]:
-        ds.rio.write_crs("epsg:4326", inplace=True)
-        ds_field_ds = xr.Dataset({field_name: ds[field_name]})
-        ds = ds.rio.set_spatial_dims('lat', 'lon')
-        ds = ds.rename_dims({'lat': 'latitude', 'lon': 'longitude'})
-        # 存储为 geotiff
-        geotiff_file_name: str = f'{coverage_file.file_name_only}_{index}.tif'
-        dir_path: pathlib.Path = pathlib.Path(
-            coverage_file.root_path) / coverage_file.relative_path
-        output_file: str = str(dir_path / geotiff_file_name)
-        output_file: CoverageFile = CoverageFile(coverage_file.root_path, coverage_file.relative_path,
-                                                 geotiff_file_name)
-        # 若不纯在指定目录则创建
-        if dir_path.exists() is False:
-            dir_path.mkdir()
-        try:
-            ds.rio.to_raster(output_file.full_path)
-        except Exception as ex:
-            print(f'生成文件:{output_file}出错!')
-        return output_file
-
-
-class StationRealData(IFileInfo):
-    def __init__(self, now: Arrow):
-        super(StationRealData, self).__init__(now)
-        # self.now: Arrow = now
-        # self.session = DbFactory().Session
-
-    @decorator_job(JobStepsEnum.DOWNLOAD_STATION)
-    def download(self, dir_path: str, copy_dir_path: str, key: str) -> Optional[StationRealDataFile]:
-        """
-            根据 self.now 进行文件下载
-        @param dir_path: 原始路径
-        @param copy_dir_path: 存储路径
-        @return: StationRealDataFile 海洋站预报潮位文件
-        """
-
-        now_year_str: str = self.now.format('YYYY')
-        now_month_str: str = self.now.format('MM')
-        file_name_str: str = self.get_file_name()
-        # TODO:[-] 23-09-06 '/data/remote/NMF_TRN_OSTZSS_CSDT_2023090512_168h_SS_staSurge.txt'
-        source_full_path: str = str(pathlib.Path(dir_path) / file_name_str)
-        copy_path: str = f'{copy_dir_path}/{now_year_str}/{now_month_str}'
-        relative_path: str = f'{now_year_str}/{now_month_str}'
-        copy_full_path: str = str(pathlib.Path(copy_path) / file_name_str)
-        # TODO:[*] 23-05-22 加入判断
-        # '/data/remote/NMF_TRN_OSTZSS_CSDT_2023052212_168h_SS_staSurge.txt'
-        # NMF_TRN_OSTZSS_CSDT_2023052212_168h_SS_staSurge.txt
-        # NMF_TRN_OSTZSS_CSDT_2023052112_168h_SS_staSurge.txt
-        if pathlib.Path(source_full_path).is_file():
-            if pathlib.Path(copy_path).exists():
-                pass
-            else:
-                pathlib.Path(copy_path).mkdir(parents=True, exist_ok=False)
-            shutil.copyfile(source_full_path, copy_full_path)
-            task_file = TaskFile(copy_path, file_name_str, key)
-            # TODO:[*] 23-05-22
-            # sqlalchemy.exc.IntegrityError: (MySQLdb._exceptions.IntegrityError) (1062, "Duplicate entry '-1' for key 'PRIMARY'")
-            # [SQL: INSERT INTO task_files (file_name, relative_path, id, is_del, gmt_create_time, gmt_modify_time, task_id) VALUES (%s, %s, %s, %s, %s, %s, %s)]
-            # [parameters: ('NMF_TRN_OSTZSS_CSDT_2023052112_168h_SS_staSurge.txt', 'D:\\05DATA\\NGINX_PATH\\TIDE\\local/2023/05', -1, 0, datetime.datetime(2023, 5, 22, 12, 54, 56, 896541), datetime.datetime(2023, 5, 22, 12, 54, 56, 896541), '1b51de5c')]
-            # (Background on this error at: https://sqlalche.me/e/20/gkpj)
-            task_file.add()
-            return StationRealDataFile(copy_dir_path, relative_path, file_name_str)
-        else:
-            return None
-
-    def __get_nearly_station_surge_list(self):
-        """
-            根据 self.now 获取临近的时间的文件路径，并读取该文件获取对应的站点预报集合
-        :return:
-        """
-        # file_name: NMF_TRN_OSTZSS_CSDT_2023051612_168h_SS_staSurge.txt
-
-    def __check_exist_tab(self, tab_name: str) -> bool:
-        """
-            判断指定表是否存在
-        @param tab_name:
-        @return:
-        """
-        is_exist = False
-        auto_base = automap_base()
-        db_factory = DbFactory()
-        session = db_factory.Session
-        engine = db_factory.engine
-        auto_base.prepare(engine, reflect=True)
-        list_tabs = auto_base.classes
-        if tab_name in list_tabs:
-            is_exist = True
-        return is_exist
-
-    def __create_realdata_tab(self, tab_name: str) -> bool:
-        is_ok = False
-        meta_data = MetaData()
-        now_utc: Arrow = arrow.utcnow()
-        Table(tab_name, meta_data, Column('id', Integer, primary_key=True),
-              Column('is_del', TINYINT(1), nullable=False, server_default=text("'0'"), default=0),
-              Column('station_code', VARCHAR(200), nullable=False, index=True),
-              Column('surge', Float, nullable=False),
-              Column('task_id', VARCHAR(8), nullable=False, index=True),
-              Column('forecast_ts', Integer, nullable=False, default=now_utc.int_timestamp),
-              Column('issue_ts', Integer, nullable=False, default=now_utc.int_timestamp),
-              Column('forecast_dt', DATETIME(fsp=6), default=now_utc.datetime),
-              Column('issue_dt', DATETIME(fsp=6), default=now_utc.datetime))
-        db_factory = DbFactory()
-        session = db_factory.Session
-        engine = db_factory.engine
-        with engine.connect() as conn:
-            # result_proxy = conn.execute(sql_str)
-            # result = result_proxy.fetchall()
-            try:
-                meta_data.create_all(engine)
-                is_ok = True
-            except Exception as ex:
-                print(ex.args)
-        return is_ok
-
-    def get_file_name(self):
-        forecast_dt: Arrow = self.get_nearly_forecast_dt()
-        date_str: str = forecast_dt.format("YYYYMMDDHH")
-        file_name: str = f'NMF_TRN_OSTZSS_CSDT_{date_str}_168h_SS_staSurge.txt'
-        return file_name
-
-    @decorator_job(JobStepsEnum.STORE_DB_STATION)
-    def to_db(self, station_file: StationRealDataFile, key: int, overwrite: bool = True):
-        """
-            持久化保存
-            将 station_file 中的站点潮位数据写入 db
-        @param station_file:
-        @param key: * 必填参数，装饰器更新 task job 使用
-        @param overwrite: - 默认为 True
-        @return:
-        """
-        # AttributeError: 'NoneType' object has no attribute 'get_station_realdata_list'
-        dict_station_list: Dict[str, Series] = station_file.get_station_realdata_list()
-
-        for temp_key in dict_station_list:
-            temp_forecast_start_dt: Arrow = station_file.forecast_dt_start
-            temp_code: str = temp_key
-            surge_list: Series = dict_station_list[temp_code]
-            StationForecastRealDataModel.set_split_tab_name(self.get_nearly_forecast_dt())
-            # 判断分表名称
-            tab_name: str = StationForecastRealDataModel.get_split_tab_name(self.get_nearly_forecast_dt())
-            if self.__check_exist_tab(tab_name) == False:
-                self.__create_realdata_tab(tab_name)
-            # TODO:[-] 23-09-19 注意温带风暴潮会提前输出一天的预报，需要跳过1天前的数据[25:]
-            # TODO:[-] 23-09-21 若168个时刻是 ec;192个时刻是中心风场
-            if len(surge_list) == 168 or len(surge_list) == 169:
-                split_surge_list = surge_list
-            else:
-                split_surge_list = surge_list[25:]
-            for index, temp_surge in enumerate(split_surge_list):
-
-                temp_dt: Arrow = temp_forecast_start_dt.shift(hours=index)
-                # TODO:[*] 23-10-27 加入判断是否数据库中已经存在此集合
-                # TODO:[*] 23-11-01 循环矩阵较为耗时(1min+)可能导致连接被锁
-                # SELECT station_realdata_2023.id, station_realdata_2023.is_del, station_realdata_2023.forecast_dt, station_realdata_2023.forecast_ts, station_realdata_2023.issue_dt, station_realdata_2023.issue_ts, station_realdata_2023.station_code, station_realdata_2023.surge, station_realdata_2023.task_id
-                # FROM station_realdata_2023
-                # WHERE station_realdata_2023.station_code = :station_code_1 AND station_realdata_2023.forecast_dt = :forecast_dt_1 AND station_realdata_2023.issue_ts = :issue_ts_1
-                stmt = select(StationForecastRealDataModel).where(
-                    StationForecastRealDataModel.station_code == temp_code,
-                    StationForecastRealDataModel.forecast_ts == temp_dt.int_timestamp,
-                    StationForecastRealDataModel.issue_ts == self.get_nearly_forecast_dt().int_timestamp)
-                filter_res = self.session.execute(stmt).fetchall()
-                # TODO:[-] 24-05-15 注意此处有可能会出现由于原始数据存在Nan导致的错误,需要过滤掉nan数据
-                if temp_surge == np.nan or temp_surge == None or np.isnan(temp_surge):
-                    continue
-                elif len(filter_res) > 0:
-                    update_stmt = (update(StationForecastRealDataModel).where(
-                        StationForecastRealDataModel.station_code == temp_code,
-                        StationForecastRealDataModel.forecast_ts == temp_dt.int_timestamp,
-                        StationForecastRealDataModel.issue_ts == self.get_nearly_forecast_dt().int_timestamp).values(
-                        surge=temp_surge,
-                        station_code=temp_code,
-                        forecast_dt=temp_dt.datetime,
-                        forecast_ts=temp_dt.int_timestamp,
-                        issue_dt=self.get_nearly_forecast_dt().datetime,
-                        issue_ts=self.get_nearly_forecast_dt().int_timestamp,
-                        task_id=key))
-                    self.session.execute(update_stmt)
-
-                # elif temp_surge == np.nan or temp_surge == None:
-                #     continue
-                # pd.isna(temp_surge)
-                else:
-                    temp_station_model: StationForecastRealDataModel = StationForecastRealDataModel(surge=temp_surge,
-                                                                                                    station_code=temp_code,
-                                                                                                    forecast_dt=temp_dt.datetime,
-                                                                                                    forecast_ts=temp_dt.int_timestamp,
-                                                                                                    issue_dt=self.get_nearly_forecast_dt().datetime,
-                                                                                                    issue_ts=self.get_nearly_forecast_dt().int_timestamp,
-                                                                                                    task_id=key
-                                                                                                    )
-
-                    self.session.add(temp_station_model)
-            # TODO:[*] 23-11-01 注意在每次循环时均加入 commit 操作
-            self.session.commit()
-            self.session.close()
-            pass
-
-
-class CoverageData(IFileInfo):
-    #
-    root_path: str = r''
-
-    def __init__(self, now: Arrow):
-        super(CoverageData, self).__init__(now)
-        # self.now: Arrow = now
-        # self.session = DbFactory().Session
-
-    def get_nearly_forecast_dt(self) -> Arrow:
-        """
-            预报文件生成的时间
-                预报时间: 00Z  发布时间 09-8=01 15-01
-                        12Z          23-8=15 01-15
-            此部分与 StationRealData 中重复
-        :return:
-        """
-        # 2023-05-22T07:58:43.111279+00:00
-        # 对应的本地时间为 2023-05-22T15:58:43.111279
-        now_utc: Arrow = self.now
-        stamp_hour = self.now.time().hour
-        forecast_dt: Arrow = Arrow(now_utc.date().year, now_utc.date().month, now_utc.date().day, 12, 0)
-        # 判断是 00Z 还是 12Z
-        # local time : [9,23)
-        if stamp_hour >= 0 and stamp_hour < 15:
-            now_utc = now_utc.shift(days=-1)
-            # [1,15]
-            forecast_dt: Arrow = Arrow(now_utc.date().year, now_utc.date().month, now_utc.date().day, 12, 0)
-        # local time : [23,9)
-        elif stamp_hour >= 15:
-            forecast_dt: Arrow = Arrow(now_utc.date().year, now_utc.date().month, now_utc.date().day, 0, 0)
-        # lcoal time: [8,9)
-        elif stamp_hour < 0:
-            now_utc = now_utc.shift(hours=-1)
-            forecast_dt: Arrow = Arrow(now_utc.date().year, now_utc.date().month, now_utc.date().day, 0, 0)
-        return forecast_dt
-
-    @decorator_job(JobStepsEnum.DOWNLOAD_COVERAGE)
-    def download(self, dir_path: str, copy_dir_path: str, key: str) -> Optional[CoverageFile]:
-        """
-            根据 self.now 进行文件下载
-        @param key: task_id
-        @param dir_path: 原始路径
-        @param copy_dir_path: 存储路径
-        @return: StationRealDataFile 海洋站预报潮位文件
-        """
-        # TODO:[-] 23-09-01 注意 copy path 需要与 convert 的相对路径一致
-        nearly_forecast_arrow: Arrow = self.get_nearly_forecast_dt()
-        # now_year_str: str = self.now.format('YYYY')
-        # now_month_str: str = self.now.format('MM')
-        now_year_str: str = nearly_forecast_arrow.format('YYYY')
-        now_month_str: str = nearly_forecast_arrow.format('MM')
-        file_name_str: str = self.get_file_name('txt')
-        source_full_path: str = str(pathlib.Path(dir_path) / file_name_str)
-        copy_path: str = f'{copy_dir_path}/{now_year_str}/{now_month_str}'
-        relative_path: str = f'{now_year_str}/{now_month_str}'
-        copy_full_path: str = str(pathlib.Path(copy_path) / file_name_str)
-        # TODO:[*] 23-05-22 加入判断
-        # '/data/remote/NMF_TRN_OSTZSS_CSDT_2023052212_168h_SS_staSurge.txt'
-        # NMF_TRN_OSTZSS_CSDT_2023052212_168h_SS_staSurge.txt
-        # NMF_TRN_OSTZSS_CSDT_2023052112_168h_SS_staSurge.txt
-        if pathlib.Path(source_full_path).is_file():
-            if pathlib.Path(copy_path).exists():
-                pass
-            else:
-                pathlib.Path(copy_path).mkdir(parents=True, exist_ok=False)
-            shutil.copyfile(source_full_path, copy_full_path)
-            task_file = TaskFile(copy_path, file_name_str, key)
-            task_file.add()
-            return CoverageFile(copy_path, get_relative_path(self.get_nearly_forecast_dt()), file_name_str)
-        else:
-            return None
-
-    def get_file_name(self, file_ext: str) -> str:
-        """
-            根据当前时间获取最近的预报时刻生成对应的文件名称
-        @param file_ext: 文件后缀
-        @return:
-        """
-        forecast_dt: Arrow = self.get_nearly_forecast_dt()
-        date_str: str = forecast_dt.format("YYYYMMDDHH")
-        file_name: str = f'NMF_TRN_OSTZSS_CSDT_{date_str}_168h_SS_maxSurge.{file_ext}'
-        return file_name
-
-    def standard_ds(self, dir_path: str) -> xr.Dataset:
-        root_path: str = DOWNLOAD_OPTIONS.get('remote_root_path')
-        relative_path: str = get_relative_path(
-            self.get_nearly_forecast_dt())
-        file_name_nc: str = self.get_file_name('nc')
-        file_full_path: str = str(pathlib.Path(dir_path) / relative_path / file_name_nc)
-
-        # 将 txt => nc
-        # step-1: 判断文件是否存在
-        if pathlib.Path(file_full_path).exists():
-            # step-2: 读取txt文件并加载至 DataFrame 中
-            with open(file_full_path, 'rb') as f:
-                # pandas.core.frame.DataFrame
-                data: pd.DataFrame = pd.read_csv(f, encoding='gbk', sep='\s+', header=None,
-                                                 infer_datetime_format=False)
-                # 此处需要加入对原矩阵的转置操作
-                data_T: pd.DataFrame = data.transpose()
-                # step-3: 生成经纬度集合
-                # 定义经纬度数组
-                # 注意经纬度网格的 长宽 无问题，但是范围有问题
-                # 220
-                lon = np.arange(105, 127, 0.1)
-                # 250
-                lat = np.arange(16, 41, 0.1)
-                # step-4: 创建当前定义的经纬度坐标系的新的DataFrame
-                da = xr.DataArray(data_T, coords=[lat, lon], dims=['lat', 'lon'])
-                # step-5: DataFrame => Dataset
-                ds: xr.Dataset = xr.Dataset({'max_surge': da})
-                # step-6-1: 对 lat 进行倒叙排列——[0,0] 位置的 lat是max
-                ds_sorted_y: xr.Dataset = ds.sortby('lat', ascending=False)
-                # step-6-2: 对经纬度信息进行标准化
-                ds_sorted_y['lat'].attrs['axis'] = 'Y'
-                ds_sorted_y['lat'].attrs['units'] = 'degrees_north'
-                ds_sorted_y['lat'].attrs['long_name'] = 'latitude'
-                ds_sorted_y['lat'].attrs['standard_name'] = 'latitude'
-                ds_sorted_y['lon'].attrs['axis'] = 'X'
-                ds_sorted_y['lon'].attrs['units'] = 'degrees_east'
-                ds_sorted_y['lon'].attrs['long_name'] = 'longitude'
-                ds_sorted_y['lon'].attrs['standard_name'] = 'longitude'
-                # step-6-3: 定义crs
-                ds_sorted_y = ds_sorted_y.rio.write_crs("epsg:4326", inplace=True)
-                # step-7: 转存为新的 nc文件，并返回文件
-                nc_full_path: str = str(pathlib.Path(dir_path) / relative_path / file_name_nc)
-                ds_sorted_y.to_netcdf(nc_full_path, format='NETCDF4', mode='w')
-                return CoverageFile(dir_path, relative_path, file_name_nc)
-
-            pass
-        else:
-            return None
-            pass
-
-    @decorator_job(JobStepsEnum.STANDARD_COVERAGE)
-    def stand_2_dataset(self, dir_path: str, key: str) -> Optional[xr.Dataset]:
-        """
-            将 dir_path 为根目录根据当前的时间获取对应的文件并标准化后返回 Dataset
-            並不存储为新文件
-            读取时对于 utc 31d 会从 31日目录中读取
-        @param dir_path:
-        @return:
-        """
-        # TODO:[*] 23-09-01 注意此处的相对路径为 23/08 此路径下并为存储对应文件
-        # '/data/local/2023/08/NMF_TRN_OSTZSS_CSDT_2023083112_168h_SS_maxSurge.txt'
-        relative_path: str = get_relative_path(
-            self.get_nearly_forecast_dt())
-        file_name_nc: str = self.get_file_name('txt')
-        file_full_path: str = str(pathlib.Path(dir_path) / relative_path / file_name_nc)
-
-        # 将 txt => nc
-        # step-1: 判断文件是否存在
-        if pathlib.Path(file_full_path).exists():
-            # step-2: 读取txt文件并加载至 DataFrame 中
-            with open(file_full_path, 'rb') as f:
-                # pandas.core.frame.DataFrame
-                data: pd.DataFrame = pd.read_csv(f, encoding='gbk', sep='\s+', header=None,
-                                                 infer_datetime_format=False)
-                # 此处需要加入对原矩阵的转置操作
-                data_T: pd.DataFrame = data.transpose()
-                data_T = data_T[data_T != 999.0]
-                # step-3: 生成经纬度集合
-                # 定义经纬度数组
-                # 注意经纬度网格的 长宽 无问题，但是范围有问题
-                # 220
-                lon = np.arange(105, 127, 0.1)
-                # 250
-                lat = np.arange(41, 16, -0.1)
-                # step-4: 创建当前定义的经纬度坐标系的新的DataFrame
-                da = xr.DataArray(data_T, coords=[lat, lon], dims=['lat', 'lon'])
-                # step-5: DataFrame => Dataset
-                ds: xr.Dataset = xr.Dataset({'max_surge': da})
-                # step-6-1: 对 lat 进行倒叙排列——[0,0] 位置的 lat是max
-                ds_sorted_y: xr.Dataset = ds.sortby('lat', ascending=False)
-                # step-6-2: 对经纬度信息进行标准化
-                ds_sorted_y['lat'].attrs['axis'] = 'Y'
-                ds_sorted_y['lat'].attrs['units'] = 'degrees_north'
-                ds_sorted_y['lat'].attrs['long_name'] = 'latitude'
-                ds_sorted_y['lat'].attrs['standard_name'] = 'latitude'
-                ds_sorted_y['lon'].attrs['axis'] = 'X'
-                ds_sorted_y['lon'].attrs['units'] = 'degrees_east'
-                ds_sorted_y['lon'].attrs['long_name'] = 'longitude'
-                ds_sorted_y['lon'].attrs['standard_name'] = 'longitude'
-                # step-6-3: 定义crs
-                ds_sorted_y = ds_sorted_y.rio.write_crs("epsg:4326", inplace=True)
-                return ds_sorted_y
-            pass
-        else:
-            return None
-            pass
-
-    @decorator_job(JobStepsEnum.CONVERT_COVERAGE_NC)
-    def convert_2_coverage(self, dir_path: str, ds: xr.Dataset, key: str) -> Optional[CoverageFile]:
-        root_path: str = DOWNLOAD_OPTIONS.get('remote_root_path')
-        relative_path: str = get_relative_path(
-            self.get_nearly_forecast_dt())
-        file_name_nc: str = self.get_file_name('nc')
-        file_full_path: str = str(pathlib.Path(dir_path) / relative_path / file_name_nc)
-        if ds is not None:
-            # step-7: 转存为新的 nc文件，并返回文件
-            nc_full_path: str = str(pathlib.Path(dir_path) / relative_path / file_name_nc)
-            # TODO:[-] 23-05-29 ValueError: cannot read or write netCDF files without netCDF4-python or scipy installed
-            # docker 环境:
-            # xarray: 0.20.2
-            # pandas: 1.3.5
-            # numpy: 1.21.5
-            # scipy: None
-            # netCDF4: None
-            # pydap: None
-            # h5netcdf: None
-            # h5py: None
-            # Nio: None
-            # zarr: None
-            # -----
-            # xarray: 0.17.0
-            # pandas: 1.2.3
-            # numpy: 1.20.2
-            # scipy: 1.6.2
-            # netCDF4: 1.5.6
-            # pydap: None
-            # h5netcdf: None
-            # h5py: None
-            # Nio: None
-            # zarr: None
-            ds.to_netcdf(nc_full_path, format='NETCDF4', mode='w')
-            return CoverageFile(dir_path, relative_path, file_name_nc)
-        else:
-            return None
-
-    @decorator_job(JobStepsEnum.CONVERT_COVERAGE_TIF)
-    def convert_2_tif(self, ds: xr.Dataset, nc_file: CoverageFile, key: str) -> CoverageFile:
-        """
-            将 转换后的 nc -> tif
-        @param ds:
-        @param nc_file: nc文件
-        @return:
-        """
-        file_name: str = f'{nc_file.file_name_only}.tif'
-        tif_full_path: str = str(pathlib.Path(nc_file.root_path) / nc_file.relative_path / file_name)
-        ds.rio.to_raster(tif_full_path)
-        return CoverageFile(nc_file.root_path, nc_file.relative_path, file_name)
-
-    @decorator_job(JobStepsEnum.STORE_DB_COVERAGE)
-    def to_db(self, task_id: str, coverage_file: CoverageFile, coverage_type: CoverageTypeEnum, pid=-1, file_ext='.nc',
-              key: str = DEFAULT_FK_STR, overwirte: bool = True):
-        """
-            记录当前 coverage_file to db
-            TODO:[*] 23-10-27 注意此处需要加入唯一性判断，写入时需要先判断数据库中是否已经存在指定issue的同类型 coverage file 信息，若存在则更新?
-        @param task_id:
-        @param coverage_file:
-        @param coverage_type:
-        @param pid:
-        @param file_ext: 文件后缀 (默认 =.nc)
-        @param overwirte: 是否覆盖已经存在的记录
-        @return:
-        """
-        if coverage_file is not None:
-            stmt = select(GeoCoverageFileModel).where(
-                GeoCoverageFileModel.issue_ts == coverage_file.forecast_dt_start.int_timestamp,
-                GeoCoverageFileModel.coverage_type == coverage_type.value)
-            filter_res = self.session.execute(stmt).fetchall()
-            if len(filter_res) > 0:
-                # 若存在指定记录则更新即可
-                update_stmt = (update(GeoCoverageFileModel).where(
-                    GeoCoverageFileModel.issue_ts == coverage_file.forecast_dt_start.int_timestamp,
-                    GeoCoverageFileModel.coverage_type == coverage_type.value).values(task_id=task_id,
-                                                                                      relative_path=coverage_file.relative_path,
-                                                                                      file_name=coverage_file.file_name,
-                                                                                      coverage_type=coverage_type.value,
-                                                                                      forecast_dt=coverage_file.forecast_dt_start.datetime,
-                                                                                      forecast_ts=coverage_file.forecast_dt_start.int_timestamp,
-                                                                                      issue_dt=coverage_file.forecast_dt_start.datetime,
-                                                                                      issue_ts=coverage_file.forecast_dt_start.int_timestamp,
-                                                                                      file_ext=file_ext,
-                                                                                      pid=pid
-                                                                                      ))
-                self.session.execute(update_stmt)
-                pass
-
-            else:
-                coverage_file_model: GeoCoverageFileModel = GeoCoverageFileModel(task_id=task_id,
-                                                                                 relative_path=coverage_file.relative_path,
-                                                                                 file_name=coverage_file.file_name,
-                                                                                 coverage_type=coverage_type.value,
-                                                                                 forecast_dt=coverage_file.forecast_dt_start.datetime,
-                                                                                 forecast_ts=coverage_file.forecast_dt_start.int_timestamp,
-                                                                                 issue_dt=coverage_file.forecast_dt_start.datetime,
-                                                                                 issue_ts=coverage_file.forecast_dt_start.int_timestamp,
-                                                                                 file_ext=file_ext,
-                                                                                 pid=pid
-                                                                                 )
-                self.session.add(coverage_file_model)
-            # TODO:[*] 23-11-01 此处误将commit放在了else中导致上面的update操作导致连接超时
-            self.session.commit()
-            self.session.close()
-            pass
+import os
+import abc
+import multiprocessing
+import datetime
+import pathlib
+import time
+
+import xarray
+from sqlalchemy import distinct, select, update, case, delete, insert
+from sqlalchemy import ForeignKey, Sequence, MetaData, Table
+from sqlalchemy import Column, Date, Float, ForeignKey, Integer, text
+from sqlalchemy.dialects.mysql import DATETIME, INTEGER, TINYINT, VARCHAR
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from arrow import Arrow
+import arrow
+import shutil
+from typing import Optional, List, Dict, Tuple, Set
+
+from pandas import Series
+import pandas as pd
+import numpy as np
+import xarray as xr
+import rioxarray
+
+try:
+    # 可选依赖: 按块读取风场
+    import dask
+except ImportError:
+    dask = None
+
+# ftp 库
+import ftplib
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+from common.default import DEFAULT_FK_STR
+from conf._privacy import FTP_LIST
+from core.db import DbFactory
+from core.files import StationRealDataFile, CoverageFile, MAX_SURGE_LATS, MAX_SURGE_LONS
+from conf.settings import DOWNLOAD_OPTIONS, DB_BULK_OPTIONS, SURGE_EXCEED_THRESHOLDS, COVERAGE_WRITE_OPTIONS
+from core.task import TaskFile, TaskLog
+from core.tables import station_tab_registry
+from model.mid_models import FtpClientMidModel
+from model.station import StationForecastRealDataModel, StationSurgeSummaryModel, StationLatestSurgeModel
+from model.coverage import GeoCoverageFileModel
+from util.decorators import decorator_job
+from util.util import get_relative_path, FtpFactory, get_nc_encoding, get_peak_rss_mb
+from common.enums import JobStepsEnum, CoverageTypeEnum, LogLevelEnum
+from common.comm_dicts import station_code_dicts
+
+
+class IFileInfo:
+
+    def __init__(self, now: Arrow):
+        self.now: Arrow = now
+        self.session = DbFactory().Session
+
+    def get_nearly_forecast_dt(self) -> Arrow:
+        """
+            预报文件生成的时间
+                预报时间: 00Z  发布时间 09-8=01 15-01
+                        12Z          23-8=15 01-15
+            此部分与 StationRealData 中重复
+        :return:
+        """
+        # 2023-05-22T07:58:43.111279+00:00
+        # 对应的本地时间为 2023-05-22T15:58:43.111279
+        now_utc: Arrow = self.now
+        stamp_hour = self.now.time().hour
+        forecast_dt: Arrow = Arrow(now_utc.date().year, now_utc.date().month, now_utc.date().day, 12, 0)
+        # 判断是 00Z 还是 12Z
+        # local time : [8,23)
+        if stamp_hour >= 0 and stamp_hour < 15:
+            now_utc = now_utc.shift(days=-1)
+            # [1,15]
+            forecast_dt: Arrow = Arrow(now_utc.date().year, now_utc.date().month, now_utc.date().day, 12, 0)
+        # local time : [23,9)
+        elif stamp_hour >= 15:
+            forecast_dt: Arrow = Arrow(now_utc.date().year, now_utc.date().month, now_utc.date().day, 0, 0)
+        # lcoal time: [8,8)
+        elif stamp_hour < 0:
+            now_utc = now_utc.shift(hours=-1)
+            forecast_dt: Arrow = Arrow(now_utc.date().year, now_utc.date().month, now_utc.date().day, 0, 0)
+        return forecast_dt
+
+    @abc.abstractmethod
+    def get_file_name(self):
+        pass
+
+    @abc.abstractmethod
+    def download(self, dir_path: str, copy_dir_path: str) -> StationRealDataFile:
+        pass
+
+
+class IFtpInfo:
+    """
+        + 23-09-20 新加入了ftp下载 info
+    """
+
+    def __init__(self, root_path: str, remote_path: str, now_arrow: Arrow):
+        self.root_path = root_path
+        self.remote_path = remote_path
+        # self.file_name = file_name
+        # utc 的当前时间
+        self.now_arrow: Arrow = now_arrow
+        self.session = DbFactory().Session
+
+    def get_nearly_forecast_dt(self) -> Arrow:
+        """
+            风场生成逻辑:
+            以 nwp 为例:
+                        nwp_high_res_wind_2023091600.nc | 23/09/16 17:52 [16日 当日 18 - 次日 05] local
+                        nwp_high_res_wind_2023091612.nc | 23/09/17 05:53 [17日 06 - 17日 18]  local
+                        ---
+                        nwp_high_res_wind_2023091600.nc | 23/09/16 17:52 [16日 当日 18 - 次日 05] local
+                        nwp_high_res_wind_2023091612.nc | 23/09/17 05:53 [17日 06 - 17日 18]  local
+                        utc : 00时 -> 17-8 =9
+                        utc : 12时 -> 5-8  =21
+                        23,0,1,2,3,4,5 -8 =
+            获取预报的utc时间
+
+        @return: 获取当前 self.now_arrow(utc)对应的预报时间(utc)
+        """
+        # 小时
+        stamp_hour = self.now_arrow.time().hour
+        now_utc: Arrow = self.now_arrow
+        # 预报基准时间(utc)
+        # 00,12
+        forecast_dt: Arrow = Arrow(now_utc.date().year, now_utc.date().month, now_utc.date().day, 0, 0)
+        # 16 6 -> 18
+        if stamp_hour >= 9 and stamp_hour <= 21:
+            # 预报时间是 前一日 12时
+            # 15
+            forecast_dt = forecast_dt
+        elif stamp_hour < 9:
+            # [0-5]
+            forecast_dt = forecast_dt.shift(hours=-12)
+        elif stamp_hour > 21:
+            forecast_dt = forecast_dt.shift(hours=12)
+        return forecast_dt
+
+    @abc.abstractmethod
+    def get_file_name(self) -> str:
+        pass
+
+
+class WindCoverageData(IFtpInfo):
+    """
+        风场栅格数据
+    """
+    # 经纬度范围
+    lat_range: List[float] = [16.1, 41.0]
+    lon_range: List[float] = [105.0, 126.9]
+
+    def __init__(self, root_path: str, remote_path: str, now_arrow: Arrow):
+        super(WindCoverageData, self).__init__(root_path, remote_path, now_arrow)
+
+    def get_file_name(self) -> str:
+        """
+            对应的文件名称
+        @return:
+        """
+        forecast_dt: Arrow = self.get_nearly_forecast_dt()
+        date_name: str = forecast_dt.format("YYYYMMDDHH")
+        file_name: str = f'nwp_high_res_wind_{date_name}.nc'
+        return file_name
+
+    def get_relative_path(self) -> str:
+        """
+            获取相对路径
+            * 统一根据 get_nearly_forecast_dt -> now_arrow 获取相对路径
+        @return:
+        """
+        forecast_dt: Arrow = self.get_nearly_forecast_dt()
+        return get_relative_path(forecast_dt)
+
+    def get_store_path(self) -> str:
+        """
+            获取存储路径
+            root_path/relative_path
+            * 统一根据 get_nearly_forecast_dt -> now_arrow 获取相对路径 relative_path
+        @return:
+        """
+        forecast_dt: Arrow = self.get_nearly_forecast_dt()
+        # 本地存储的相对路径(相对于root路径)
+        relative_path: str = self.get_relative_path()
+        store_path: str = str(pathlib.Path(self.root_path) / relative_path)
+        return store_path
+
+    def get_local_full_path(self) -> str:
+        """
+            下载到本地的文件全路径
+        @return:
+        """
+        return str(pathlib.Path(self.get_store_path()) / self.get_file_name())
+
+    def standard_ds(self, dir_path: str) -> bool:
+        """
+            将栅格文件标准化
+        @param dir_path:
+        @return:
+        """
+        return False
+
+    def download(self, ftp_client: FtpFactory, local_path: str, relative_path: str, key: str, pid=-1,
+                 file_ext: str = '.nc') -> \
+            Optional[CoverageFile]:
+        """
+            下载并返回下载后的 coverage file
+        @return:
+        """
+
+        # local_path: str = ftp_opt.get('LOCAL_PATH')
+        # relative_path: str = ftp_opt.get('RELATIVE_PATH')
+        #
+        target_file_name: str = self.get_file_name()
+        local_copy_full_path: str = self.get_local_full_path()
+        is_ok = True
+        # TODO:[*] 23-09-26 FileExistsError: [WinError 183] 当文件已存在时，无法创建该文件。: 'E:\\05DATA\\06wind'
+        # 'E:\\05DATA\\06wind\\2023\\09\\nwp_high_res_wind_2023092412.nc'
+        if pathlib.Path(local_copy_full_path).parent.exists():
+            pass
+        else:
+            pathlib.Path(local_copy_full_path).parent.mkdir(parents=True)
+        is_ok: bool = ftp_client.down_load_file_bycwd(local_copy_full_path, relative_path, target_file_name)
+        # is_ok: bool = True
+        download_file: Optional[CoverageFile] = None
+        if is_ok:
+            download_file: CoverageFile = CoverageFile(self.root_path, self.get_relative_path(), target_file_name)
+            # TODO:[-] 23-09-25 to db
+            if download_file is not None:
+                coverage_file_model: GeoCoverageFileModel = GeoCoverageFileModel(task_id=key,
+                                                                                 relative_path=download_file.relative_path,
+                                                                                 file_name=download_file.file_name,
+                                                                                 coverage_type=CoverageTypeEnum.NWP_SOURCE_COVERAGE_FILE.value,
+                                                                                 forecast_dt=download_file.forecast_dt_start.datetime,
+                                                                                 forecast_ts=download_file.forecast_dt_start.int_timestamp,
+                                                                                 issue_dt=download_file.forecast_dt_start.datetime,
+                                                                                 issue_ts=download_file.forecast_dt_start.int_timestamp,
+                                                                                 file_ext=file_ext,
+                                                                                 pid=pid
+                                                                                 )
+                # TODO:[-] 24-06-28 进程内共享连接池，正常提交后同样需要 close 归还连接
+                try:
+                    self.session.add(coverage_file_model)
+                    self.session.commit()
+                except Exception as ex:
+                    self.session.rollback()
+                    print(f'[!]写入风场原始文件记录出错:{ex.args}')
+                finally:
+                    self.session.close()
+
+        return download_file
+
+    def split_2_coverage(self, coverage_file: CoverageFile, key: str, pid=-1, file_ext: str = '.nc', ) -> Optional[
+        CoverageFile]:
+        """
+            按需裁剪风场文件
+            将下载后的风场文件切割并存储为新的nc文件
+        @return:
+        """
+        coverage_full_path: str = coverage_file.full_path
+        # TODO:[*] 23-09-26 暂时修改为 win 路径
+        # coverage_full_path = r'../data/nwp_high_res_wind_2023092512.nc'
+        # coverage_full_path = r'E:/05DATA/06wind/2023/09/nwp_high_res_wind_2023092512.nc'
+        root_path: str = coverage_file.root_path
+        relative_path: str = coverage_file.relative_path
+        file_name: str = coverage_file.file_name_only
+        saved_coverage_file: Optional[CoverageFile] = None
+        if pathlib.Path(coverage_full_path).exists():
+            # TODO:[-] 由于 win 路径的转义字符的问题造成读取bug
+            # nwp_high_res_wind_2023092512.nc
+            # '/data/local/2023/09/nwp_high_res_wind_2023092512.nc'
+            # 在docker中出现:AttributeError: 'EntryPoints' object has no attribute 'get'
+            # docker xarray 版本: '0.20.2'
+            #
+            print(f'读取风场文件目录:{coverage_full_path}')
+            start_time: float = time.perf_counter()
+            # TODO:[-] 24-06-27 安装 dask 时按时次分块读取，写出时逐块读取，不再一次性加载整个全球风场
+            open_kwargs: Dict = {'chunks': {'time': 1}} if dask is not None else {}
+            ds_xr: xarray.Dataset = xarray.open_dataset(coverage_full_path, **open_kwargs)
+            # 获取经纬度的范围
+            min_lon: float = min(self.lon_range)
+            max_lon: float = max(self.lon_range)
+            min_lat: float = min(self.lat_range)
+            max_lat: float = max(self.lat_range)
+            # TODO:[-] 24-06-27 由 where(mask, drop=True)(加载全部数据、生成广播后的掩码并将 dtype 提升为 float64)
+            #                   修改为按坐标切片，只读取经纬度范围内的数据且保留原始 dtype
+            cropped_ds = ds_xr.sel(lat=get_coord_slice(ds_xr.lat.values, min_lat, max_lat),
+                                   lon=get_coord_slice(ds_xr.lon.values, min_lon, max_lon))
+            save_name: str = f'{file_name}_output.nc'
+            save_full_path: str = str(pathlib.Path(root_path) / relative_path / save_name)
+            try:
+                # 已解决
+                cropped_ds.to_netcdf(save_full_path, format='NETCDF4', mode='w',
+                                     encoding=get_nc_encoding(cropped_ds, COVERAGE_WRITE_OPTIONS.get('NC')))
+                ds_xr.close()
+                # 记录裁剪耗时及进程峰值内存
+                peak_rss: Optional[float] = get_peak_rss_mb()
+                peak_rss_str: str = f'{peak_rss:.1f}MB' if peak_rss is not None else '-'
+                TaskLog(key).add(f'裁剪风场:{save_name},耗时:{time.perf_counter() - start_time:.2f}s,'
+                                 f'进程峰值内存:{peak_rss_str}', LogLevelEnum.INFO)
+                saved_coverage_file = CoverageFile(root_path, relative_path, save_name)
+                if saved_coverage_file is not None:
+                    # TODO:[-] 23-09-25 to db
+                    coverage_file_model: GeoCoverageFileModel = GeoCoverageFileModel(task_id=key,
+                                                                                     relative_path=relative_path,
+                                                                                     file_name=saved_coverage_file.file_name,
+                                                                                     coverage_type=CoverageTypeEnum.NWP_SPLIT_COVERAGE_FILE.value,
+                                                                                     forecast_dt=saved_coverage_file.forecast_dt_start.datetime,
+                                                                                     forecast_ts=saved_coverage_file.forecast_dt_start.int_timestamp,
+                                                                                     issue_dt=saved_coverage_file.forecast_dt_start.datetime,
+                                                                                     issue_ts=saved_coverage_file.forecast_dt_start.int_timestamp,
+                                                                                     file_ext=file_ext,
+                                                                                     pid=pid
+                                                                                     )
+                    try:
+                        self.session.add(coverage_file_model)
+                        self.session.commit()
+                    except Exception as ex:
+                        self.session.rollback()
+                        print(f'[!]写入风场裁剪文件记录出错:{ex.args}')
+                    finally:
+                        self.session.close()
+                    # TODO:[-] 24-06-28 裁剪后的风场文件入库后更新该 issue 的入库版本，api 据此使对应的响应缓存失效
+                    station_tab_registry.touch_issue_version(saved_coverage_file.forecast_dt_start.int_timestamp)
+            except Exception as ex:
+                print(f'切分原始风场文件错误:{ex.args}')
+                ds_xr.close()
+                self.session.close()
+        return saved_coverage_file
+
+    def convert_2_tif(self, coverage_file: CoverageFile, field_name: str, key: str, pid: int = -1, file_ext='.tif'):
+        """
+            将 nc -> 按时次提取为 tif
+            TODO:[-] 24-06-26 修复每个时次均通过 isel(time=0) 提取导致所有 tif 均为第一个时次的问题;
+                              各时次 tif 在进程池中并行写出(crs 及空间维度在每个子进程中只设置一次)，
+                              全部写出后一次批量写入 GeoCoverageFileModel
+        @param coverage_file:
+        @param field_name: 时间维度名称
+        @param key:
+        @param pid:
+        @param file_ext:
+        @return:
+        """
+        # TODO:[*] 23-10-09 线上部署时出错
+        print(f'读取:{coverage_file.full_path}并切分为tif ing')
+        # entrypoints = entry_points().get("xarray.backends", ())
+        # AttributeError: 'EntryPoints' object has no attribute 'get'
+        with xarray.open_dataset(coverage_file.full_path) as ds:
+            # dataarray datetime64 -> arrow
+            list_forecast_arrow: List[Arrow] = [arrow.get(pd.to_datetime(temp_dt64)) for temp_dt64 in
+                                                ds.coords[field_name].values]
+        dir_path: pathlib.Path = pathlib.Path(coverage_file.root_path) / coverage_file.relative_path
+        # 若不纯在指定目录则创建
+        dir_path.mkdir(parents=True, exist_ok=True)
+        list_tif_files: List[CoverageFile] = [
+            CoverageFile(coverage_file.root_path, coverage_file.relative_path,
+                         f'{coverage_file.file_name_only}_{index}.tif') for index in range(len(list_forecast_arrow))]
+        tif_options: Dict = COVERAGE_WRITE_OPTIONS.get('TIF')
+        max_workers: int = COVERAGE_WRITE_OPTIONS.get('WIND_TIF').get('max_workers') or os.cpu_count() or 1
+        max_workers = max(min(max_workers, len(list_tif_files)), 1)
+        list_models: List[Dict] = []
+        # 定时任务在多线程中执行，使用 spawn 创建子进程(避免 fork 时复制其他线程持有的锁)
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_wind_tif_worker,
+                                 initargs=(coverage_file.full_path, field_name)) as executor:
+            futures = [executor.submit(_write_wind_tif, index, tif_file.full_path, tif_options) for index, tif_file in
+                       enumerate(list_tif_files)]
+            for tif_file, forecast_arrow, future in zip(list_tif_files, list_forecast_arrow, futures):
+                try:
+                    future.result()
+                except Exception as ex:
+                    print(f'生成文件:{tif_file.full_path}出错!{ex.args}')
+                    continue
+                list_models.append(dict(task_id=key, relative_path=tif_file.relative_path,
+                                        file_name=tif_file.file_name,
+                                        coverage_type=CoverageTypeEnum.NWP_TIF_FILE.value,
+                                        forecast_dt=forecast_arrow.datetime,
+                                        forecast_ts=forecast_arrow.int_timestamp,
+                                        issue_dt=tif_file.forecast_dt_start.datetime,
+                                        issue_ts=tif_file.forecast_dt_start.int_timestamp,
+                                        file_ext=file_ext, pid=pid))
+        issue_ts: int = coverage_file.forecast_dt_start.int_timestamp
+        if len(list_models) > 0:
+            try:
+                # 重复执行时先删除该 issue 已有的 tif 记录
+                self.session.execute(delete(GeoCoverageFileModel).where(
+                    GeoCoverageFileModel.issue_ts == issue_ts,
+                    GeoCoverageFileModel.coverage_type == CoverageTypeEnum.NWP_TIF_FILE.value))
+                self.session.execute(insert(GeoCoverageFileModel), list_models)
+                self.session.commit()
+            except Exception as ex:
+                self.session.rollback()
+                print(f'[!]写入风场tif记录出错:{ex.args}')
+            finally:
+                self.session.close()
+        # TODO:[-] 24-06-19 风场逐时 tif 全部入库后更新该 issue 的入库版本，api 据此使对应的响应缓存失效
+        station_tab_registry.touch_issue_version(issue_ts)
+
+
+def get_coord_slice(coord_vals: np.ndarray, min_val: float, max_val: float) -> slice:
+    """
+        + 24-06-27 根据坐标的排列方向生成 [min_val, max_val] 的切片(降序排列的坐标需要 slice(max, min))
+    @param coord_vals:
+    @param min_val:
+    @param max_val:
+    @return:
+    """
+    if len(coord_vals) > 1 and coord_vals[0] > coord_vals[-1]:
+        return slice(max_val, min_val)
+    return slice(min_val, max_val)
+
+
+# + 24-06-26 风场 tif 子进程中已完成 crs 及空间维度设置的 Dataset(每个子进程只打开并设置一次)
+_wind_tif_ds: Optional[xr.Dataset] = None
+_wind_tif_time_name: str = 'time'
+
+
+def _init_wind_tif_worker(nc_full_path: str, time_name: str):
+    """
+        + 24-06-26 风场 tif 进程池的子进程初始化: 打开 nc 并设置 crs 及空间维度
+    @param nc_full_path:
+    @param time_name: 时间维度名称
+    @return:
+    """
+    global _wind_tif_ds, _wind_tif_time_name
+    ds: xr.Dataset = xarray.open_dataset(nc_full_path)
+    ds.rio.write_crs("epsg:4326", inplace=True)
+    ds = ds.rio.set_spatial_dims('lat', 'lon')
+    ds = ds.rename_dims({'lat': 'latitude', 'lon': 'longitude'})
+    _wind_tif_ds = ds
+    _wind_tif_time_name = time_name
+
+
+def _write_wind_tif(index: int, output_path: str, tif_options: Dict):
+    """
+        + 24-06-26 在子进程中将第 index 个时次写出为 tif
+    @param index: 时次下标
+    @param output_path:
+    @param tif_options: COVERAGE_WRITE_OPTIONS['TIF']
+    @return:
+    """
+    _wind_tif_ds.isel({_wind_tif_time_name: index}).rio.to_raster(output_path, **tif_options)
+
+
+class StationRealData(IFileInfo):
+    def __init__(self, now: Arrow):
+        super(StationRealData, self).__init__(now)
+        # self.now: Arrow = now
+        # self.session = DbFactory().Session
+
+    @decorator_job(JobStepsEnum.DOWNLOAD_STATION)
+    def download(self, dir_path: str, copy_dir_path: str, key: str) -> Optional[StationRealDataFile]:
+        """
+            根据 self.now 进行文件下载
+        @param dir_path: 原始路径
+        @param copy_dir_path: 存储路径
+        @return: StationRealDataFile 海洋站预报潮位文件
+        """
+
+        now_year_str: str = self.now.format('YYYY')
+        now_month_str: str = self.now.format('MM')
+        file_name_str: str = self.get_file_name()
+        # TODO:[-] 23-09-06 '/data/remote/NMF_TRN_OSTZSS_CSDT_2023090512_168h_SS_staSurge.txt'
+        source_full_path: str = str(pathlib.Path(dir_path) / file_name_str)
+        copy_path: str = f'{copy_dir_path}/{now_year_str}/{now_month_str}'
+        relative_path: str = f'{now_year_str}/{now_month_str}'
+        copy_full_path: str = str(pathlib.Path(copy_path) / file_name_str)
+        # TODO:[*] 23-05-22 加入判断
+        # '/data/remote/NMF_TRN_OSTZSS_CSDT_2023052212_168h_SS_staSurge.txt'
+        # NMF_TRN_OSTZSS_CSDT_2023052212_168h_SS_staSurge.txt
+        # NMF_TRN_OSTZSS_CSDT_2023052112_168h_SS_staSurge.txt
+        if pathlib.Path(source_full_path).is_file():
+            if pathlib.Path(copy_path).exists():
+                pass
+            else:
+                pathlib.Path(copy_path).mkdir(parents=True, exist_ok=False)
+            shutil.copyfile(source_full_path, copy_full_path)
+            task_file = TaskFile(copy_path, file_name_str, key)
+            # TODO:[*] 23-05-22
+            # sqlalchemy.exc.IntegrityError: (MySQLdb._exceptions.IntegrityError) (1062, "Duplicate entry '-1' for key 'PRIMARY'")
+            # [SQL: INSERT INTO task_files (file_name, relative_path, id, is_del, gmt_create_time, gmt_modify_time, task_id) VALUES (%s, %s, %s, %s, %s, %s, %s)]
+            # [parameters: ('NMF_TRN_OSTZSS_CSDT_2023052112_168h_SS_staSurge.txt', 'D:\\05DATA\\NGINX_PATH\\TIDE\\local/2023/05', -1, 0, datetime.datetime(2023, 5, 22, 12, 54, 56, 896541), datetime.datetime(2023, 5, 22, 12, 54, 56, 896541), '1b51de5c')]
+            # (Background on this error at: https://sqlalche.me/e/20/gkpj)
+            task_file.add()
+            return StationRealDataFile(copy_dir_path, relative_path, file_name_str)
+        else:
+            return None
+
+    def __get_nearly_station_surge_list(self):
+        """
+            根据 self.now 获取临近的时间的文件路径，并读取该文件获取对应的站点预报集合
+        :return:
+        """
+        # file_name: NMF_TRN_OSTZSS_CSDT_2023051612_168h_SS_staSurge.txt
+
+    def get_file_name(self):
+        forecast_dt: Arrow = self.get_nearly_forecast_dt()
+        date_str: str = forecast_dt.format("YYYYMMDDHH")
+        file_name: str = f'NMF_TRN_OSTZSS_CSDT_{date_str}_168h_SS_staSurge.txt'
+        return file_name
+
+    @decorator_job(JobStepsEnum.STORE_DB_STATION)
+    def to_db(self, station_file: StationRealDataFile, key: int, overwrite: bool = True) -> List[Dict]:
+        """
+            持久化保存
+            将 station_file 中的站点潮位数据写入 db
+            TODO:[-] 24-06-03 由逐站逐时次 select + update|add 修改为整体转换为长表后分批 INSERT ... ON DUPLICATE KEY UPDATE
+        @param station_file:
+        @param key: * 必填参数，装饰器更新 task job 使用
+        @param overwrite: - 默认为 True，为 False 时不更新已存在的记录
+        @return: 各批次写入统计 [{'batch': 批次, 'rows': 写入行数, 'elapsed': 耗时(s)}]
+        """
+        # AttributeError: 'NoneType' object has no attribute 'get_station_realdata_list'
+        # TODO:[-] 24-06-23 直接读取为 float32 二维数组[时次, 站点]
+        codes, matrix = station_file.get_station_realdata_matrix()
+        issue_arrow: Arrow = self.get_nearly_forecast_dt()
+        # TODO:[-] 24-06-06 分表是否存在由 station_tab_registry 判断并缓存(每个进程只查询一次 information_schema)
+        station_tab_registry.ensure_by_dt(issue_arrow)
+        df_realdata: pd.DataFrame = self.__to_realdata_frame(codes, matrix, station_file.forecast_dt_start,
+                                                             issue_arrow, key)
+        # TODO:[-] 24-06-07 按照 issue 年份获取对应的分表，不再修改全局的 __table__.name
+        split_tab: Table = StationForecastRealDataModel.get_split_table(issue_arrow)
+        list_stats: List[Dict] = self.__bulk_upsert(split_tab, df_realdata, overwrite)
+        # TODO:[-] 24-06-17 入库时同时计算各站点本次发布的最大增水等汇总信息并写入 station_surge_summary
+        station_tab_registry.ensure_summary_tab()
+        df_summary: pd.DataFrame = self.__to_summary_frame(df_realdata, issue_arrow, key)
+        self.__upsert_summary(df_summary)
+        # TODO:[-] 24-06-18 更新各站点最新状态(station_latest)
+        self.__upsert_latest(df_summary)
+        # TODO:[-] 24-06-19 更新该 issue 的入库版本，api 据此使对应的响应缓存失效
+        station_tab_registry.touch_issue_version(issue_arrow.int_timestamp)
+        return list_stats
+
+    def __to_realdata_frame(self, codes: List[str], matrix: np.ndarray, forecast_start_arrow: Arrow,
+                            issue_arrow: Arrow, key: int) -> pd.DataFrame:
+        """
+            将站点增水二维数组一次性转换为待入库的长表
+        @param codes: get_station_realdata_matrix 返回的 station_code 集合
+        @param matrix: get_station_realdata_matrix 返回的二维数组[时次, 站点]
+        @param forecast_start_arrow: 预报起始时间(utc)
+        @param issue_arrow: 发布时间(utc)
+        @param key: task_id
+        @return: columns: station_code|surge|forecast_ts|forecast_dt|issue_ts|issue_dt|task_id
+        """
+        columns: List[str] = ['station_code', 'surge', 'forecast_ts', 'forecast_dt', 'issue_ts', 'issue_dt', 'task_id']
+        if len(codes) == 0:
+            return pd.DataFrame(columns=columns)
+        # 行:时次 列:station_code
+        df_wide: pd.DataFrame = pd.DataFrame(matrix, columns=codes)
+        # TODO:[-] 23-09-19 注意温带风暴潮会提前输出一天的预报，需要跳过1天前的数据[25:]
+        # TODO:[-] 23-09-21 若168个时刻是 ec;192个时刻是中心风场
+        if len(df_wide) not in (168, 169):
+            df_wide = df_wide.iloc[25:]
+        df_wide.index = forecast_start_arrow.int_timestamp + np.arange(len(df_wide), dtype=np.int64) * 3600
+        df_wide.index.name = 'forecast_ts'
+        # 宽表 -> 长表
+        # - 24-06-28 stack(dropna=...) 在 pandas 2.1 中已弃用(新实现不再丢弃 nan)，改为 stack 后显式 dropna
+        df_long: pd.DataFrame = df_wide.stack().dropna().rename('surge').reset_index()
+        df_long.rename(columns={'level_1': 'station_code'}, inplace=True)
+        # TODO:[-] 24-05-15 注意此处有可能会出现由于原始数据存在Nan导致的错误,需要过滤掉nan数据
+        # - 24-06-23 float32 -> float64(mysqldb 无法转义 numpy.float32)
+        df_long['surge'] = pd.to_numeric(df_long['surge'], errors='coerce').astype(np.float64)
+        df_long = df_long[df_long['surge'].notna()].copy()
+        # 注意 pd.Timestamp 无法直接被 mysqldb 转义，需转为 datetime
+        df_long['forecast_dt'] = pd.Series(pd.to_datetime(df_long['forecast_ts'], unit='s').dt.to_pydatetime(),
+                                           index=df_long.index, dtype=object)
+        df_long['issue_ts'] = issue_arrow.int_timestamp
+        df_long['issue_dt'] = issue_arrow.naive
+        df_long['task_id'] = key
+        return df_long[columns]
+
+    def __to_summary_frame(self, df_realdata: pd.DataFrame, issue_arrow: Arrow, key: int) -> pd.DataFrame:
+        """
+            + 24-06-17 由长表计算各站点的最大增水、最大增水时刻、最后时刻增水及超阈值等级
+        @param df_realdata: __to_realdata_frame 生成的长表
+        @param issue_arrow: 发布时间(utc)
+        @param key: task_id
+        @return: columns: station_code|max_surge|max_forecast_ts|max_forecast_dt|last_surge|last_forecast_ts|
+                          last_forecast_dt|exceed_level|issue_ts|issue_dt|task_id
+        """
+        if len(df_realdata) == 0:
+            return pd.DataFrame()
+        df_sorted: pd.DataFrame = df_realdata.sort_values(['station_code', 'forecast_ts'])
+        grouped = df_sorted.groupby('station_code', sort=False)
+        surge_columns: List[str] = ['station_code', 'surge', 'forecast_ts', 'forecast_dt']
+        df_max: pd.DataFrame = df_sorted.loc[grouped['surge'].idxmax(), surge_columns].rename(
+            columns={'surge': 'max_surge', 'forecast_ts': 'max_forecast_ts', 'forecast_dt': 'max_forecast_dt'})
+        df_last: pd.DataFrame = grouped.tail(1)[surge_columns].rename(
+            columns={'surge': 'last_surge', 'forecast_ts': 'last_forecast_ts', 'forecast_dt': 'last_forecast_dt'})
+        df_summary: pd.DataFrame = df_max.merge(df_last, on='station_code')
+        df_summary['exceed_level'] = np.searchsorted(np.asarray(SURGE_EXCEED_THRESHOLDS, dtype=np.float64),
+                                                     df_summary['max_surge'].to_numpy(), side='right')
+        df_summary['issue_ts'] = issue_arrow.int_timestamp
+        df_summary['issue_dt'] = issue_arrow.naive
+        df_summary['task_id'] = key
+        return df_summary
+
+    def __upsert_summary(self, df_summary: pd.DataFrame):
+        """
+            + 24-06-17 写入站点增水汇总表，唯一键:(station_code, issue_ts)
+        @param df_summary: __to_summary_frame 生成的汇总
+        @return:
+        """
+        if len(df_summary) == 0:
+            return
+        tab: Table = StationSurgeSummaryModel.__table__
+        records: List[Dict] = df_summary.to_dict('records')
+        update_columns: List[str] = [name for name in df_summary.columns if name not in ('station_code', 'issue_ts')]
+        stmt = mysql_insert(tab)
+        stmt = stmt.on_duplicate_key_update({name: stmt.inserted[name] for name in update_columns})
+        try:
+            self.session.execute(stmt, records)
+            self.session.commit()
+            print(f'[-]写入{tab.name}:{len(records)}个站点')
+        except Exception as ex:
+            self.session.rollback()
+            print(f'[!]写入{tab.name}出错:{ex.args}')
+            raise ex
+        finally:
+            self.session.close()
+
+    def __upsert_latest(self, df_summary: pd.DataFrame):
+        """
+            + 24-06-18 更新站点最新状态表，唯一键:station_code
+            只有当写入的 issue_ts 不早于已有记录时才更新(补算历史 issue 时不会覆盖最新状态)
+        @param df_summary: __to_summary_frame 生成的汇总
+        @return:
+        """
+        if len(df_summary) == 0:
+            return
+        tab: Table = StationLatestSurgeModel.__table__
+        df_latest: pd.DataFrame = df_summary[
+            ['station_code', 'last_surge', 'last_forecast_ts', 'last_forecast_dt', 'issue_ts', 'issue_dt',
+             'task_id']].rename(
+            columns={'last_surge': 'surge', 'last_forecast_ts': 'forecast_ts', 'last_forecast_dt': 'forecast_dt'})
+        records: List[Dict] = df_latest.to_dict('records')
+        stmt = mysql_insert(tab)
+        is_newer = stmt.inserted.issue_ts >= tab.c.issue_ts
+        # 注意 mysql 按顺序执行赋值，issue_ts 需要放在最后更新
+        update_columns: List[str] = ['surge', 'forecast_ts', 'forecast_dt', 'issue_dt', 'task_id', 'issue_ts']
+        stmt = stmt.on_duplicate_key_update(
+            [(name, case((is_newer, stmt.inserted[name]), else_=tab.c[name])) for name in update_columns])
+        try:
+            self.session.execute(stmt, records)
+            self.session.commit()
+        except Exception as ex:
+            self.session.rollback()
+            print(f'[!]写入{tab.name}出错:{ex.args}')
+            raise ex
+        finally:
+            self.session.close()
+
+    def __bulk_upsert(self, tab: Table, df_realdata: pd.DataFrame, overwrite: bool = True) -> List[Dict]:
+        """
+            将长表按照 batch_size 分批写入指定分表
+            唯一键:(station_code, forecast_ts, issue_ts)
+        @param tab: 待写入的分表
+        @param df_realdata: __to_realdata_frame 生成的长表
+        @param overwrite: 为 True 时重复记录更新 surge 等字段，否则保留原记录
+        @return:
+        """
+        batch_size: int = DB_BULK_OPTIONS.get('station').get('batch_size')
+        records: List[Dict] = df_realdata.to_dict('records')
+        list_stats: List[Dict] = []
+        for batch_index, batch_start in enumerate(range(0, len(records), batch_size)):
+            batch_records: List[Dict] = records[batch_start:batch_start + batch_size]
+            start_time: float = time.perf_counter()
+            stmt = mysql_insert(tab)
+            if overwrite:
+                stmt = stmt.on_duplicate_key_update(surge=stmt.inserted.surge,
+                                                    forecast_dt=stmt.inserted.forecast_dt,
+                                                    issue_dt=stmt.inserted.issue_dt,
+                                                    task_id=stmt.inserted.task_id)
+            else:
+                stmt = stmt.on_duplicate_key_update(surge=tab.c.surge)
+            try:
+                self.session.execute(stmt, batch_records)
+                self.session.commit()
+            except Exception as ex:
+                self.session.rollback()
+                self.session.close()
+                print(f'[!]写入{tab.name}第{batch_index}批次出错:{ex.args}')
+                raise ex
+            elapsed: float = time.perf_counter() - start_time
+            list_stats.append({'batch': batch_index, 'rows': len(batch_records), 'elapsed': elapsed})
+            print(f'[-]写入{tab.name}第{batch_index}批次:{len(batch_records)}行,耗时{elapsed:.3f}s')
+        self.session.close()
+        return list_stats
+
+
+class CoverageData(IFileInfo):
+    #
+    root_path: str = r''
+
+    def __init__(self, now: Arrow):
+        super(CoverageData, self).__init__(now)
+        # self.now: Arrow = now
+        # self.session = DbFactory().Session
+
+    def get_nearly_forecast_dt(self) -> Arrow:
+        """
+            预报文件生成的时间
+                预报时间: 00Z  发布时间 09-8=01 15-01
+                        12Z          23-8=15 01-15
+            此部分与 StationRealData 中重复
+        :return:
+        """
+        # 2023-05-22T07:58:43.111279+00:00
+        # 对应的本地时间为 2023-05-22T15:58:43.111279
+        now_utc: Arrow = self.now
+        stamp_hour = self.now.time().hour
+        forecast_dt: Arrow = Arrow(now_utc.date().year, now_utc.date().month, now_utc.date().day, 12, 0)
+        # 判断是 00Z 还是 12Z
+        # local time : [9,23)
+        if stamp_hour >= 0 and stamp_hour < 15:
+            now_utc = now_utc.shift(days=-1)
+            # [1,15]
+            forecast_dt: Arrow = Arrow(now_utc.date().year, now_utc.date().month, now_utc.date().day, 12, 0)
+        # local time : [23,9)
+        elif stamp_hour >= 15:
+            forecast_dt: Arrow = Arrow(now_utc.date().year, now_utc.date().month, now_utc.date().day, 0, 0)
+        # lcoal time: [8,9)
+        elif stamp_hour < 0:
+            now_utc = now_utc.shift(hours=-1)
+            forecast_dt: Arrow = Arrow(now_utc.date().year, now_utc.date().month, now_utc.date().day, 0, 0)
+        return forecast_dt
+
+    @decorator_job(JobStepsEnum.DOWNLOAD_COVERAGE)
+    def download(self, dir_path: str, copy_dir_path: str, key: str) -> Optional[CoverageFile]:
+        """
+            根据 self.now 进行文件下载
+        @param key: task_id
+        @param dir_path: 原始路径
+        @param copy_dir_path: 存储路径
+        @return: StationRealDataFile 海洋站预报潮位文件
+        """
+        # TODO:[-] 23-09-01 注意 copy path 需要与 convert 的相对路径一致
+        nearly_forecast_arrow: Arrow = self.get_nearly_forecast_dt()
+        # now_year_str: str = self.now.format('YYYY')
+        # now_month_str: str = self.now.format('MM')
+        now_year_str: str = nearly_forecast_arrow.format('YYYY')
+        now_month_str: str = nearly_forecast_arrow.format('MM')
+        file_name_str: str = self.get_file_name('txt')
+        source_full_path: str = str(pathlib.Path(dir_path) / file_name_str)
+        copy_path: str = f'{copy_dir_path}/{now_year_str}/{now_month_str}'
+        relative_path: str = f'{now_year_str}/{now_month_str}'
+        copy_full_path: str = str(pathlib.Path(copy_path) / file_name_str)
+        # TODO:[*] 23-05-22 加入判断
+        # '/data/remote/NMF_TRN_OSTZSS_CSDT_2023052212_168h_SS_staSurge.txt'
+        # NMF_TRN_OSTZSS_CSDT_2023052212_168h_SS_staSurge.txt
+        # NMF_TRN_OSTZSS_CSDT_2023052112_168h_SS_staSurge.txt
+        if pathlib.Path(source_full_path).is_file():
+            if pathlib.Path(copy_path).exists():
+                pass
+            else:
+                pathlib.Path(copy_path).mkdir(parents=True, exist_ok=False)
+            shutil.copyfile(source_full_path, copy_full_path)
+            task_file = TaskFile(copy_path, file_name_str, key)
+            task_file.add()
+            return CoverageFile(copy_path, get_relative_path(self.get_nearly_forecast_dt()), file_name_str)
+        else:
+            return None
+
+    def get_file_name(self, file_ext: str) -> str:
+        """
+            根据当前时间获取最近的预报时刻生成对应的文件名称
+        @param file_ext: 文件后缀
+        @return:
+        """
+        forecast_dt: Arrow = self.get_nearly_forecast_dt()
+        date_str: str = forecast_dt.format("YYYYMMDDHH")
+        file_name: str = f'NMF_TRN_OSTZSS_CSDT_{date_str}_168h_SS_maxSurge.{file_ext}'
+        return file_name
+
+    def standard_ds(self, dir_path: str) -> xr.Dataset:
+        root_path: str = DOWNLOAD_OPTIONS.get('remote_root_path')
+        relative_path: str = get_relative_path(
+            self.get_nearly_forecast_dt())
+        file_name_nc: str = self.get_file_name('nc')
+        # TODO:[-] 24-06-24 由 CoverageFile.get_max_surge_grid 读取
+        grid: Optional[np.ndarray] = CoverageFile(dir_path, relative_path, file_name_nc).get_max_surge_grid()
+        if grid is None:
+            return None
+        # 此处原文件首行对应 lat 的 min，倒序后 [0] 位置的 lat 为 max
+        ds: xr.Dataset = self.__to_max_surge_ds(grid[::-1], np.arange(16, 41, 0.1)[::-1])
+        # 转存为新的 nc文件，并返回文件
+        nc_full_path: str = str(pathlib.Path(dir_path) / relative_path / file_name_nc)
+        ds.to_netcdf(nc_full_path, format='NETCDF4', mode='w')
+        return CoverageFile(dir_path, relative_path, file_name_nc)
+
+    @decorator_job(JobStepsEnum.STANDARD_COVERAGE)
+    def stand_2_dataset(self, dir_path: str, key: str) -> Optional[xr.Dataset]:
+        """
+            将 dir_path 为根目录根据当前的时间获取对应的文件并标准化后返回 Dataset
+            並不存储为新文件
+            读取时对于 utc 31d 会从 31日目录中读取
+        @param dir_path:
+        @return:
+        """
+        # TODO:[*] 23-09-01 注意此处的相对路径为 23/08 此路径下并为存储对应文件
+        # '/data/local/2023/08/NMF_TRN_OSTZSS_CSDT_2023083112_168h_SS_maxSurge.txt'
+        relative_path: str = get_relative_path(
+            self.get_nearly_forecast_dt())
+        file_name_nc: str = self.get_file_name('txt')
+        # TODO:[-] 24-06-24 不再通过 pd.read_csv(sep='\s+') -> 转置 -> DataFrame 过滤 999.0，
+        #                   由 CoverageFile.get_max_surge_grid 直接读取为 float32 二维数组[lat, lon]
+        grid: Optional[np.ndarray] = CoverageFile(dir_path, relative_path, file_name_nc).get_max_surge_grid()
+        if grid is None:
+            return None
+        # [0] 位置的 lat 为 max，无需再 sortby
+        return self.__to_max_surge_ds(grid, MAX_SURGE_LATS)
+
+    def __to_max_surge_ds(self, grid: np.ndarray, lats: np.ndarray) -> xr.Dataset:
+        """
+            + 24-06-24 将最大增水场二维数组[lat, lon]转换为标准化后的 Dataset
+        @param grid:
+        @param lats: 与 grid 行对应的 lat
+        @return:
+        """
+        ds: xr.Dataset = xr.Dataset({'max_surge': (('lat', 'lon'), grid)},
+                                    coords={'lat': lats, 'lon': MAX_SURGE_LONS})
+        # 对经纬度信息进行标准化
+        ds['lat'].attrs['axis'] = 'Y'
+        ds['lat'].attrs['units'] = 'degrees_north'
+        ds['lat'].attrs['long_name'] = 'latitude'
+        ds['lat'].attrs['standard_name'] = 'latitude'
+        ds['lon'].attrs['axis'] = 'X'
+        ds['lon'].attrs['units'] = 'degrees_east'
+        ds['lon'].attrs['long_name'] = 'longitude'
+        ds['lon'].attrs['standard_name'] = 'longitude'
+        # 定义crs
+        ds = ds.rio.write_crs("epsg:4326", inplace=True)
+        return ds
+
+    @decorator_job(JobStepsEnum.CONVERT_COVERAGE_NC)
+    def convert_2_coverage(self, dir_path: str, ds: xr.Dataset, key: str) -> Optional[CoverageFile]:
+        root_path: str = DOWNLOAD_OPTIONS.get('remote_root_path')
+        relative_path: str = get_relative_path(
+            self.get_nearly_forecast_dt())
+        file_name_nc: str = self.get_file_name('nc')
+        file_full_path: str = str(pathlib.Path(dir_path) / relative_path / file_name_nc)
+        if ds is not None:
+            # step-7: 转存为新的 nc文件，并返回文件
+            nc_full_path: str = str(pathlib.Path(dir_path) / relative_path / file_name_nc)
+            # TODO:[-] 23-05-29 ValueError: cannot read or write netCDF files without netCDF4-python or scipy installed
+            # docker 环境:
+            # xarray: 0.20.2
+            # pandas: 1.3.5
+            # numpy: 1.21.5
+            # scipy: None
+            # netCDF4: None
+            # pydap: None
+            # h5netcdf: None
+            # h5py: None
+            # Nio: None
+            # zarr: None
+            # -----
+            # xarray: 0.17.0
+            # pandas: 1.2.3
+            # numpy: 1.20.2
+            # scipy: 1.6.2
+            # netCDF4: 1.5.6
+            # pydap: None
+            # h5netcdf: None
+            # h5py: None
+            # Nio: None
+            # zarr: None
+            ds.to_netcdf(nc_full_path, format='NETCDF4', mode='w')
+            return CoverageFile(dir_path, relative_path, file_name_nc)
+        else:
+            return None
+
+    @decorator_job(JobStepsEnum.CONVERT_COVERAGE_TIF)
+    def convert_2_tif(self, ds: xr.Dataset, nc_file: CoverageFile, key: str) -> CoverageFile:
+        """
+            将 转换后的 nc -> tif
+        @param ds:
+        @param nc_file: nc文件
+        @return:
+        """
+        file_name: str = f'{nc_file.file_name_only}.tif'
+        tif_full_path: str = str(pathlib.Path(nc_file.root_path) / nc_file.relative_path / file_name)
+        ds.rio.to_raster(tif_full_path)
+        return CoverageFile(nc_file.root_path, nc_file.relative_path, file_name)
+
+    @decorator_job(JobStepsEnum.CONVERT_COVERAGE_PRODUCTS)
+    def convert_2_products(self, dir_path: str, ds: xr.Dataset, key: str) -> Tuple[
+        Optional[CoverageFile], Optional[CoverageFile]]:
+        """
+            + 24-06-25 由标准化后的增水场同时写出 nc(zlib+shuffle 压缩并分块) 及 tif(分块压缩)
+            替代 convert_2_coverage -> convert_2_tif 两个步骤，两个文件在线程池中并发写出
+        @param dir_path: 本地存储根目录
+        @param ds: stand_2_dataset 生成的标准化 Dataset
+        @param key:
+        @return: (nc_file, tif_file)，写出失败的文件为 None
+        """
+        if ds is None:
+            return None, None
+        relative_path: str = get_relative_path(self.get_nearly_forecast_dt())
+        nc_file: CoverageFile = CoverageFile(dir_path, relative_path, self.get_file_name('nc'))
+        tif_file: CoverageFile = CoverageFile(dir_path, relative_path, f'{nc_file.file_name_only}.tif')
+        pathlib.Path(nc_file.dir_path).mkdir(parents=True, exist_ok=True)
+        nc_options: Dict = COVERAGE_WRITE_OPTIONS.get('NC')
+        tif_options: Dict = COVERAGE_WRITE_OPTIONS.get('TIF')
+
+        def write_nc():
+            ds.to_netcdf(nc_file.full_path, format='NETCDF4', mode='w', encoding=get_nc_encoding(ds, nc_options))
+
+        def write_tif():
+            ds.rio.to_raster(tif_file.full_path, **tif_options)
+
+        list_res: List[Optional[CoverageFile]] = []
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(write_nc), executor.submit(write_tif)]
+            for coverage_file, future in zip((nc_file, tif_file), futures):
+                try:
+                    future.result()
+                    list_res.append(coverage_file)
+                except Exception as ex:
+                    print(f'[!]写出{coverage_file.full_path}出错:{ex.args}')
+                    list_res.append(None)
+        return list_res[0], list_res[1]
+
+    @decorator_job(JobStepsEnum.STORE_DB_COVERAGE)
+    def to_db(self, task_id: str, coverage_file: CoverageFile, coverage_type: CoverageTypeEnum, pid=-1, file_ext='.nc',
+              key: str = DEFAULT_FK_STR, overwirte: bool = True):
+        """
+            记录当前 coverage_file to db
+            TODO:[*] 23-10-27 注意此处需要加入唯一性判断，写入时需要先判断数据库中是否已经存在指定issue的同类型 coverage file 信息，若存在则更新?
+        @param task_id:
+        @param coverage_file:
+        @param coverage_type:
+        @param pid:
+        @param file_ext: 文件后缀 (默认 =.nc)
+        @param overwirte: 是否覆盖已经存在的记录
+        @return:
+        """
+        if coverage_file is not None:
+            # TODO:[*] 23-11-01 此处误将commit放在了else中导致上面的update操作导致连接超时
+            # TODO:[-] 24-06-28 出错时同样需要 close 归还连接(进程内共享连接池)
+            try:
+                self.__merge_coverage_file(task_id, coverage_file, coverage_type, pid, file_ext)
+                self.session.commit()
+            except Exception as ex:
+                self.session.rollback()
+                print(f'[!]写入coverage file出错:{ex.args}')
+                raise ex
+            finally:
+                self.session.close()
+            # TODO:[-] 24-06-19 更新该 issue 的入库版本，api 据此使对应的响应缓存失效
+            station_tab_registry.touch_issue_version(coverage_file.forecast_dt_start.int_timestamp)
+            pass
+
+    @decorator_job(JobStepsEnum.STORE_DB_COVERAGE)
+    def to_db_batch(self, task_id: str, list_files: List[Tuple[CoverageFile, CoverageTypeEnum, str]], pid=-1,
+                    key: str = DEFAULT_FK_STR):
+        """
+            + 24-06-25 一次提交记录多个 coverage_file to db
+        @param task_id:
+        @param list_files: [(coverage_file, coverage_type, file_ext)]，coverage_file 为 None 时跳过
+        @param pid:
+        @return:
+        """
+        list_issue_ts: Set[int] = set()
+        try:
+            for coverage_file, coverage_type, file_ext in list_files:
+                if coverage_file is None:
+                    continue
+                self.__merge_coverage_file(task_id, coverage_file, coverage_type, pid, file_ext)
+                list_issue_ts.add(coverage_file.forecast_dt_start.int_timestamp)
+            self.session.commit()
+        except Exception as ex:
+            self.session.rollback()
+            print(f'[!]写入coverage file出错:{ex.args}')
+            raise ex
+        finally:
+            self.session.close()
+        for issue_ts in list_issue_ts:
+            station_tab_registry.touch_issue_version(issue_ts)
+
+    def __merge_coverage_file(self, task_id: str, coverage_file: CoverageFile, coverage_type: CoverageTypeEnum,
+                              pid=-1, file_ext='.nc'):
+        """
+            若数据库中已存在指定 issue 的同类型 coverage file 则更新，否则新增(不提交)
+        @param task_id:
+        @param coverage_file:
+        @param coverage_type:
+        @param pid:
+        @param file_ext:
+        @return:
+        """
+        stmt = select(GeoCoverageFileModel).where(
+            GeoCoverageFileModel.issue_ts == coverage_file.forecast_dt_start.int_timestamp,
+            GeoCoverageFileModel.coverage_type == coverage_type.value)
+        filter_res = self.session.execute(stmt).fetchall()
+        if len(filter_res) > 0:
+            # 若存在指定记录则更新即可
+            update_stmt = (update(GeoCoverageFileModel).where(
+                GeoCoverageFileModel.issue_ts == coverage_file.forecast_dt_start.int_timestamp,
+                GeoCoverageFileModel.coverage_type == coverage_type.value).values(task_id=task_id,
+                                                                                  relative_path=coverage_file.relative_path,
+                                                                                  file_name=coverage_file.file_name,
+                                                                                  coverage_type=coverage_type.value,
+                                                                                  forecast_dt=coverage_file.forecast_dt_start.datetime,
+                                                                                  forecast_ts=coverage_file.forecast_dt_start.int_timestamp,
+                                                                                  issue_dt=coverage_file.forecast_dt_start.datetime,
+                                                                                  issue_ts=coverage_file.forecast_dt_start.int_timestamp,
+                                                                                  file_ext=file_ext,
+                                                                                  pid=pid
+                                                                                  ))
+            self.session.execute(update_stmt)
+            pass
+
+        else:
+            coverage_file_model: GeoCoverageFileModel = GeoCoverageFileModel(task_id=task_id,
+                                                                             relative_path=coverage_file.relative_path,
+                                                                             file_name=coverage_file.file_name,
+                                                                             coverage_type=coverage_type.value,
+                                                                             forecast_dt=coverage_file.forecast_dt_start.datetime,
+                                                                             forecast_ts=coverage_file.forecast_dt_start.int_timestamp,
+                                                                             issue_dt=coverage_file.forecast_dt_start.datetime,
+                                                                             issue_ts=coverage_file.forecast_dt_start.int_timestamp,
+                                                                             file_ext=file_ext,
+                                                                             pid=pid
+                                                                             )
+            self.session.add(coverage_file_model)
@@ -1,6 +1,11 @@
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.automap import automap_base
-from sqlalchemy.orm import sessionmaker, scoped_session
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
 #
 from sqlalchemy import Column, Date, Float, ForeignKey, Integer, text
 from sqlalchemy.dialects.mysql import DATETIME, INTEGER, TINYINT, VARCHAR
@@ -9,10 +14,103 @@ from sqlalchemy import ForeignKey, Sequence, MetaData, Table
 from datetime import datetime
 from conf.settings import DATABASES
 
+# 连接池默认配置，可在 DATABASES[db_mapping]['POOL'] 中覆盖
+DEFAULT_POOL_OPTIONS = {
+    'pool_size': 5,
+    'max_overflow': 10,
+    'pool_recycle': 3600,
+    'pool_pre_ping': True,
+    'pool_timeout': 30,
+}
+
+# + 24-06-04 进程内共享的 engine 及 session 工厂注册表
+# key: 连接 url，同一 url 在整个进程内只创建一次 engine(连接池)
+_engine_registry: Dict[str, Engine] = {}
+_session_factory_registry: Dict[str, sessionmaker] = {}
+_registry_lock = threading.Lock()
+
+
+def _get_db_options(db_mapping: str, **kwargs) -> dict:
+    """
+        获取 db_mapping 对应的配置，kwargs 中不为 None 的项会覆盖配置文件中的同名配置项
+    """
+    db_options: dict = dict(DATABASES.get(db_mapping))
+    db_options.update({k: v for k, v in kwargs.items() if v is not None})
+    return db_options
+
+
+def _get_db_url(db_options: dict) -> str:
+    return f"mysql+{db_options.get('ENGINE')}://{db_options.get('USER')}:{db_options.get('PASSWORD')}@" \
+           f"{db_options.get('HOST')}:{db_options.get('POST')}/{db_options.get('NAME')}"
+
+
+def _register(db_options: dict) -> str:
+    """
+        若当前 url 尚未创建 engine 则创建并注册 engine 与 session 工厂
+    @param db_options:
+    @return: 注册表的 key(url)
+    """
+    url: str = _get_db_url(db_options)
+    if url not in _engine_registry:
+        with _registry_lock:
+            if url not in _engine_registry:
+                pool_options: dict = dict(DEFAULT_POOL_OPTIONS)
+                pool_options.update(db_options.get('POOL', {}))
+                # TypeError: Invalid argument(s) 'encoding' sent to create_engine(), using configuration MySQLDialect_mysqldb/QueuePool/Engine.  Please check that the keyword arguments are appropriate for this combination of components.
+                engine: Engine = create_engine(url, future=True, echo=False, **pool_options)
+                _session_factory_registry[url] = sessionmaker(bind=engine)
+                _engine_registry[url] = engine
+    return url
+
+
+def get_engine(db_mapping: str = 'default', **kwargs) -> Engine:
+    """
+        + 24-06-04 获取 db_mapping 对应的进程内共享 engine(懒加载)
+    @param db_mapping: 配置文件中 DATABASES 的配置项名称
+    @param kwargs: ENGINE|HOST|POST|NAME|USER|PASSWORD 覆盖配置文件中的同名配置项
+    @return:
+    """
+    url: str = _register(_get_db_options(db_mapping, **kwargs))
+    return _engine_registry[url]
+
+
+def get_session_factory(db_mapping: str = 'default', **kwargs) -> sessionmaker:
+    """
+        + 24-06-04 获取绑定了共享 engine 的 session 工厂
+    @param db_mapping:
+    @param kwargs:
+    @return:
+    """
+    url: str = _register(_get_db_options(db_mapping, **kwargs))
+    return _session_factory_registry[url]
+
+
+@contextmanager
+def session_scope(db_mapping: str = 'default') -> Iterator[Session]:
+    """
+        + 24-06-04 通过上下文管理器获取 session
+        正常退出时 commit，出现异常时 rollback，最终均会 close 并将连接归还至连接池
+        eg:
+            with session_scope() as session:
+                session.add(model)
+    @param db_mapping:
+    @return:
+    """
+    session: Session = get_session_factory(db_mapping)()
+    try:
+        yield session
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
 
 class DbFactory:
     """
         数据库工厂
+        TODO:[-] 24-06-04 不再为每个实例创建 engine，统一使用 get_engine 获取进程内共享的 engine
     """
 
     def __init__(self, db_mapping: str = 'default', engine_str: str = None, host: str = None, port: str = None,
@@ -36,13 +134,12 @@ class DbFactory:
         self.db_name = db_name if db_name else db_options.get('NAME')
         self.user = user if user else db_options.get('USER')
         self.password = pwd if pwd else db_options.get('PASSWORD')
-        # TypeError: Invalid argument(s) 'encoding' sent to create_engine(), using configuration MySQLDialect_mysqldb/QueuePool/Engine.  Please check that the keyword arguments are appropriate for this combination of components.
-        self.engine = create_engine(
-            f"mysql+{self.engine_str}://{self.user}:{self.password}@{self.host}:{self.port}/{self.db_name}",
-            pool_pre_ping=True, future=True, echo=False)
+        db_kwargs: dict = dict(ENGINE=self.engine_str, HOST=self.host, POST=self.port, NAME=self.db_name,
+                               USER=self.user, PASSWORD=self.password)
+        self.engine = get_engine(db_mapping, **db_kwargs)
         # TODO:[-] 23-03-03 通过 scoped_session 来提供现成安全的全局session
         # 参考: https://juejin.cn/post/6844904164141580302
-        self._session_def = scoped_session(sessionmaker(bind=self.engine))
+        self._session_def = scoped_session(get_session_factory(db_mapping, **db_kwargs))
 
     @property
     def Session(self) -> sessionmaker:
@@ -1,161 +1,216 @@
-import abc
-import typing
-from typing import List, Dict
-from abc import ABCMeta, abstractmethod, abstractproperty
-from arrow import Arrow
-import arrow
-import pathlib
-import pandas as pd
-from pandas import Series, DataFrame
-
-from common.comm_dicts import station_code_dicts
-from common.default import DEFAULT_ARROW
-
-
-class IBaseFile(metaclass=ABCMeta):
-    def __init__(self, root_path: str, relative_path: str, file_name: str):
-        self.root_path = root_path
-        self.relative_path = relative_path
-
-        self.file_name = file_name
-
-    @property
-    def dir_path(self) -> str:
-        return str(pathlib.Path(self.root_path) / self.relative_path)
-
-    @property
-    def name_split(self) -> List[str]:
-        """
-            三种数据:
-                站点:NMF_TRN_OSTZSS_CSDT_2023051612_168h_SS_staSurge.txt
-                增水场:NMF_TRN_OSTZSS_CSDT_2023051612_168h_SS_maxSurge.txt
-
-        :return:
-        """
-        list_split: List[str] = []
-        split_stamp: str = '_'  # 分隔符
-        if self.file_name:
-            full_name_remove_ext: str = self.file_name[:self.file_name.find('.')]  # 移除了后缀的文件名
-            list_split = full_name_remove_ext.split(split_stamp)[1:]  # ['TY2022', '2021010416', 'c0', 'p', '05']
-        return list_split
-
-    @property
-    def file_name_only(self) -> str:
-        """
-            不含后缀的文件名
-            站点:NMF_TRN_OSTZSS_CSDT_2023051612_168h_SS_staSurge.txt
-            增水场:NMF_TRN_OSTZSS_CSDT_2023051612_168h_SS_maxSurge.txt
-        :return:
-        """
-        return self.file_name.split('.')[0]
-
-    @property
-    def full_path(self) -> str:
-        file_full_path: str = str(pathlib.Path(self.dir_path) / self.file_name)
-        return file_full_path
-
-    def _check_exist(self):
-        """
-            判断当前 file 是否存在
-        :return:
-        """
-        file_full_path: str = str(pathlib.Path(self.dir_path) / self.file_name)
-        if pathlib.Path(file_full_path).exists():
-            return True
-        return False
-
-
-class StationRealDataFile(IBaseFile):
-    """
-        海洋站实况 file
-        NMF_TRN_OSTZSS_CSDT_2023051612_168h_SS_staSurge.txt
-        ----
-        0 NMF_
-        1 TRN_
-        2 OSTZSS_
-        3 CSDT_
-        4 2023051612_
-        5 168h_
-        6 SS_
-        7 staSurge.txt
-    """
-
-    @property
-    def forecast_dt_start(self) -> Arrow:
-        """
-            预报的起始时间(utc)
-            self.name_split[4] : 2023051612 -> arrow.Arrow
-        :return:
-        """
-        arrow_start: Arrow = DEFAULT_ARROW
-        if len(self.name_split) > 4:
-            arrow_start = arrow.get(self.name_split[3], 'YYYYMMDDHH')
-            pass
-        return arrow_start
-
-    def get_station_realdata_list(self) -> Dict[str, Series]:
-        """
-            获取 code:series 字典
-        :return:
-        """
-        dict_station = {}
-        if self._check_exist():
-            with open(self.full_path, 'rb') as f:
-                df: DataFrame = pd.read_table(f, encoding='gbk', sep='\s+',
-                                              header=0, infer_datetime_format=False)
-                columns = df.columns
-                # TODO:[*] 23-05-23 缺少的站点
-                # ['歧口', '孤东', '芝罘岛', '乳山口', '滨海', '外磕角', '滩浒岛', '沙埕', '崇武', '汕头H', '赤湾', '白龙尾']
-                # 已修改数据库的站点:
-                # ['赤湾','滩浒岛]
-                # 目前仍缺失的站点
-                # ['歧口', '孤东', '芝罘岛', '乳山口', '滨海', '外磕角', '沙埕', '崇武', '汕头H',  '白龙尾']
-                for temp_row in columns:
-                    temp_code = station_code_dicts.get(temp_row)
-                    if temp_code is None:
-                        continue
-                    else:
-                        dict_station[temp_code] = df[temp_row]
-                # no_exist_codes: List[str] = []
-                # for temp_key in columns:
-                #     name = station_code_dicts.get(temp_key)
-                #     if name is None:
-                #         no_exist_codes.append(temp_key)
-            pass
-        return dict_station
-
-
-class CoverageFile(IBaseFile):
-    """
-        NMF_TRN_OSTZSS_CSDT_2023052100_168h_SS_maxSurge.txt
-        NMF             0
-        _TRN            1
-        _OSTZSS         2
-        _CSDT           3
-        _2023052100     4
-        _168h
-        _SS
-        _maxSurge.txt
-        西北太风场:
-        nwp_high_res_wind_2023092112.nc
-        nwp             0
-        high            1
-        res             2
-        wind            3
-        2023092112.nc   4
-    """
-
-    @property
-    def forecast_dt_start(self) -> Arrow:
-        """
-            预报的起始时间(utc)
-            self.name_split[4] : 2023051612 -> arrow.Arrow
-        :return:
-        """
-        arrow_start: Arrow = DEFAULT_ARROW
-        if len(self.name_split) > 4:
-            arrow_start = arrow.get(self.name_split[3], 'YYYYMMDDHH')
-            pass
-        return arrow_start
-
-    pass
+import io
+import abc
+import typing
+from typing import List, Dict, Tuple, Optional
+from abc import ABCMeta, abstractmethod, abstractproperty
+from arrow import Arrow
+import arrow
+import pathlib
+import numpy as np
+import pandas as pd
+from pandas import Series, DataFrame
+
+from common.comm_dicts import station_code_dicts
+from common.default import DEFAULT_ARROW
+
+# + 24-06-24 最大增水场(maxSurge.txt)网格的经纬度(模块级缓存，不再每次读取时重新生成)
+# 220
+MAX_SURGE_LONS: np.ndarray = np.arange(105, 127, 0.1)
+# 250，[0] 位置的 lat 为 max
+MAX_SURGE_LATS: np.ndarray = np.arange(41, 16, -0.1)
+# 最大增水场中的无效值
+MAX_SURGE_INVALID_VAL: float = 999.0
+
+
+class IBaseFile(metaclass=ABCMeta):
+    def __init__(self, root_path: str, relative_path: str, file_name: str):
+        self.root_path = root_path
+        self.relative_path = relative_path
+
+        self.file_name = file_name
+
+    @property
+    def dir_path(self) -> str:
+        return str(pathlib.Path(self.root_path) / self.relative_path)
+
+    @property
+    def name_split(self) -> List[str]:
+        """
+            三种数据:
+                站点:NMF_TRN_OSTZSS_CSDT_2023051612_168h_SS_staSurge.txt
+                增水场:NMF_TRN_OSTZSS_CSDT_2023051612_168h_SS_maxSurge.txt
+
+        :return:
+        """
+        list_split: List[str] = []
+        split_stamp: str = '_'  # 分隔符
+        if self.file_name:
+            full_name_remove_ext: str = self.file_name[:self.file_name.find('.')]  # 移除了后缀的文件名
+            list_split = full_name_remove_ext.split(split_stamp)[1:]  # ['TY2022', '2021010416', 'c0', 'p', '05']
+        return list_split
+
+    @property
+    def file_name_only(self) -> str:
+        """
+            不含后缀的文件名
+            站点:NMF_TRN_OSTZSS_CSDT_2023051612_168h_SS_staSurge.txt
+            增水场:NMF_TRN_OSTZSS_CSDT_2023051612_168h_SS_maxSurge.txt
+        :return:
+        """
+        return self.file_name.split('.')[0]
+
+    @property
+    def full_path(self) -> str:
+        file_full_path: str = str(pathlib.Path(self.dir_path) / self.file_name)
+        return file_full_path
+
+    def _check_exist(self):
+        """
+            判断当前 file 是否存在
+        :return:
+        """
+        file_full_path: str = str(pathlib.Path(self.dir_path) / self.file_name)
+        if pathlib.Path(file_full_path).exists():
+            return True
+        return False
+
+
+class StationRealDataFile(IBaseFile):
+    """
+        海洋站实况 file
+        NMF_TRN_OSTZSS_CSDT_2023051612_168h_SS_staSurge.txt
+        ----
+        0 NMF_
+        1 TRN_
+        2 OSTZSS_
+        3 CSDT_
+        4 2023051612_
+        5 168h_
+        6 SS_
+        7 staSurge.txt
+    """
+
+    @property
+    def forecast_dt_start(self) -> Arrow:
+        """
+            预报的起始时间(utc)
+            self.name_split[4] : 2023051612 -> arrow.Arrow
+        :return:
+        """
+        arrow_start: Arrow = DEFAULT_ARROW
+        if len(self.name_split) > 4:
+            arrow_start = arrow.get(self.name_split[3], 'YYYYMMDDHH')
+            pass
+        return arrow_start
+
+    def get_station_realdata_matrix(self) -> Tuple[List[str], np.ndarray]:
+        """
+            + 24-06-23 读取站点增水为二维数组
+            表头(站点名称)只按 gbk 解码一次并通过 station_code_dicts 转换为 code(未收录的站点跳过)，
+            数值部分通过 np.fromstring 整体解析为 float32 二维数组(不再通过 sep='\s+' 逐列生成 object Series)
+        :return: (station_code 集合, 二维数组[时次, 站点])
+        """
+        codes: List[str] = []
+        matrix: np.ndarray = np.empty((0, 0), dtype=np.float32)
+        if not self._check_exist():
+            return codes, matrix
+        with open(self.full_path, 'rb') as f:
+            header: bytes = f.readline()
+            body: bytes = f.read()
+        names: List[str] = header.decode('gbk').split()
+        first_line: bytes = body.lstrip().split(b'\n', 1)[0]
+        col_count: int = len(first_line.split())
+        if col_count == 0:
+            return codes, matrix
+        tokens_count: int = len(body.split())
+        vals: np.ndarray = np.fromstring(body.decode('ascii', errors='replace'), dtype=np.float32, sep=' ')
+        if vals.size == tokens_count and tokens_count % col_count == 0:
+            data: np.ndarray = vals.reshape(-1, col_count)
+        else:
+            # 存在无法解析的字符(eg: 缺测标识)时，按列转换为数值(无法转换的视为 nan)
+            df: DataFrame = pd.read_csv(io.BytesIO(body), delim_whitespace=True, header=None)
+            data = df.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float32)
+        # 数据列比表头多一列时，首列为行索引(与 pd.read_table(header=0) 的处理一致)
+        if data.shape[1] == len(names) + 1:
+            data = data[:, 1:]
+        # TODO:[*] 23-05-23 缺少的站点
+        # ['歧口', '孤东', '芝罘岛', '乳山口', '滨海', '外磕角', '滩浒岛', '沙埕', '崇武', '汕头H', '赤湾', '白龙尾']
+        # 已修改数据库的站点:
+        # ['赤湾','滩浒岛]
+        # 目前仍缺失的站点
+        # ['歧口', '孤东', '芝罘岛', '乳山口', '滨海', '外磕角', '沙埕', '崇武', '汕头H',  '白龙尾']
+        dict_index: Dict[str, int] = {}
+        for index, name in enumerate(names[:data.shape[1]]):
+            temp_code = station_code_dicts.get(name)
+            if temp_code is not None:
+                dict_index[temp_code] = index
+        codes = list(dict_index.keys())
+        matrix = data[:, list(dict_index.values())]
+        return codes, matrix
+
+    def get_station_realdata_list(self) -> Dict[str, Series]:
+        """
+            获取 code:series 字典
+            TODO:[-] 24-06-23 由 get_station_realdata_matrix 读取
+        :return:
+        """
+        codes, matrix = self.get_station_realdata_matrix()
+        return {code: Series(matrix[:, index]) for index, code in enumerate(codes)}
+
+
+class CoverageFile(IBaseFile):
+    """
+        NMF_TRN_OSTZSS_CSDT_2023052100_168h_SS_maxSurge.txt
+        NMF             0
+        _TRN            1
+        _OSTZSS         2
+        _CSDT           3
+        _2023052100     4
+        _168h
+        _SS
+        _maxSurge.txt
+        西北太风场:
+        nwp_high_res_wind_2023092112.nc
+        nwp             0
+        high            1
+        res             2
+        wind            3
+        2023092112.nc   4
+    """
+
+    @property
+    def forecast_dt_start(self) -> Arrow:
+        """
+            预报的起始时间(utc)
+            self.name_split[4] : 2023051612 -> arrow.Arrow
+        :return:
+        """
+        arrow_start: Arrow = DEFAULT_ARROW
+        if len(self.name_split) > 4:
+            arrow_start = arrow.get(self.name_split[3], 'YYYYMMDDHH')
+            pass
+        return arrow_start
+
+    def get_max_surge_grid(self) -> Optional[np.ndarray]:
+        """
+            + 24-06-24 读取最大增水场(maxSurge.txt)为 float32 二维数组[lat, lon]
+            原文件每行为同一经度的各纬度值，整体解析后转置为 [lat, lon](与 MAX_SURGE_LATS, MAX_SURGE_LONS 对应)，
+            无效值 999.0 原地替换为 nan
+        :return: 文件不存在时返回 None
+        """
+        if not self._check_exist():
+            return None
+        with open(self.full_path, 'rb') as f:
+            body: bytes = f.read()
+        first_line: bytes = body.lstrip().split(b'\n', 1)[0]
+        col_count: int = len(first_line.split())
+        tokens_count: int = len(body.split())
+        vals: np.ndarray = np.fromstring(body.decode('ascii', errors='replace'), dtype=np.float32, sep=' ')
+        if col_count == 0 or vals.size != tokens_count or tokens_count % col_count != 0:
+            # 存在无法解析的字符时，按列转换为数值(无法转换的视为 nan)
+            df: DataFrame = pd.read_csv(io.BytesIO(body), delim_whitespace=True, header=None)
+            vals = df.apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float32)
+            col_count = vals.shape[1]
+        grid: np.ndarray = np.ascontiguousarray(vals.reshape(-1, col_count).T)
+        grid[grid == MAX_SURGE_INVALID_VAL] = np.nan
+        return grid
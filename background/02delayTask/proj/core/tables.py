@@ -0,0 +1,240 @@
+# 分表相关模块
+import threading
+from typing import Set, List
+
+import arrow
+from arrow import Arrow
+from sqlalchemy import MetaData, Table, Column, Float, Integer, UniqueConstraint, Index, Computed, text, func
+from sqlalchemy.dialects.mysql import DATETIME, TINYINT, VARCHAR
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.engine import Engine
+
+from core.db import get_engine
+from model.station import StationForecastRealDataModel, StationSurgeSummaryModel, StationLatestSurgeModel
+from model.task import IssueVersionModel
+
+# 批量 upsert 依赖的唯一键
+REALDATA_UNIQUE_KEY: str = 'uix_station_forecast_issue'
+# + 24-06-08 按 issue_ts + station_code 查询时间序列使用的复合索引
+REALDATA_QUERY_INDEX: str = 'idx_issue_station_forecast'
+# + 24-06-08 是否为整点的存储生成列，替代 DATE_FORMAT(forecast_dt,'%i:%s')='00:00'
+REALDATA_HOURLY_COLUMN: str = 'is_hourly'
+REALDATA_HOURLY_EXPR: str = 'forecast_ts % 3600 = 0'
+
+
+class StationRealDataTableRegistry:
+    """
+        + 24-06-06 station_realdata_YYYY 分表注册表
+        通过 information_schema 判断分表是否存在并在进程内缓存结果，
+        替代每次写入前通过 automap_base 反射整个库的方式
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # 已确认存在(且包含唯一键)的分表
+        self._exist_tabs: Set[str] = set()
+
+    @property
+    def engine(self) -> Engine:
+        return get_engine()
+
+    def is_exist(self, tab_name: str) -> bool:
+        """
+            判断指定表是否存在(只读取 information_schema，不反射表结构)
+        @param tab_name:
+        @return:
+        """
+        if tab_name in self._exist_tabs:
+            return True
+        check_sql = text("SELECT COUNT(1) FROM information_schema.tables "
+                         "WHERE table_schema=DATABASE() AND table_name=:tab_name")
+        with self.engine.connect() as conn:
+            return conn.execute(check_sql, {'tab_name': tab_name}).scalar() > 0
+
+    def ensure(self, tab_name: str) -> bool:
+        """
+            确保指定分表存在(不存在则创建)，结果在进程内缓存
+            - 24-06-28 已存在的分表不再执行 ALTER TABLE(补建唯一键、索引及 STORED 生成列会重建整张表)，
+                       只检查是否已迁移并提示，迁移只通过 migrate_all(RunTypeEnmum.MIGRATE_SPLIT_TAB)执行
+        @param tab_name:
+        @return:
+        """
+        if tab_name in self._exist_tabs:
+            return True
+        with self._lock:
+            if tab_name in self._exist_tabs:
+                return True
+            is_ok: bool = False
+            if self.is_exist(tab_name):
+                if not self.is_migrated(tab_name):
+                    print(f'[!]分表{tab_name}缺少唯一键、复合索引或整点生成列，请执行 MIGRATE_SPLIT_TAB 迁移')
+                is_ok = True
+            else:
+                is_ok = self._create_tab(tab_name)
+            if is_ok:
+                self._exist_tabs.add(tab_name)
+            return is_ok
+
+    def ensure_by_dt(self, dt_arrow: Arrow) -> bool:
+        """
+            确保 dt_arrow 所在年份的分表存在
+        @param dt_arrow: 产品 issue_dt 时间
+        @return:
+        """
+        return self.ensure(StationForecastRealDataModel.get_split_tab_name(dt_arrow))
+
+    def prepare(self, now_arrow: Arrow = None) -> bool:
+        """
+            预先创建当年及次年的分表，避免跨年后首次入库时在写入流程中执行 DDL
+            - 24-06-28 只创建不存在的分表，已存在的分表不执行 ALTER(迁移见 migrate_all)
+        @param now_arrow: 默认为当前 utc 时间
+        @return:
+        """
+        if now_arrow is None:
+            now_arrow = arrow.utcnow()
+        is_ok: bool = self.ensure_by_dt(now_arrow)
+        is_next_ok: bool = self.ensure_by_dt(now_arrow.shift(years=1))
+        is_summary_ok: bool = self.ensure_summary_tab()
+        return is_ok and is_next_ok and is_summary_ok
+
+    def ensure_summary_tab(self) -> bool:
+        """
+            + 24-06-17 确保站点增水汇总表(station_surge_summary)及站点最新状态表(station_latest)存在
+            + 24-06-19 同时确保发布时次入库版本表(issue_versions)存在
+        @return:
+        """
+        is_ok: bool = True
+        for tab in (StationSurgeSummaryModel.__table__, StationLatestSurgeModel.__table__,
+                    IssueVersionModel.__table__):
+            if tab.name in self._exist_tabs:
+                continue
+            try:
+                tab.create(self.engine, checkfirst=True)
+                self._exist_tabs.add(tab.name)
+            except Exception as ex:
+                print(f'[!]创建{tab.name}出错:{ex.args}')
+                is_ok = False
+        return is_ok
+
+    def touch_issue_version(self, issue_ts: int):
+        """
+            + 24-06-19 更新指定发布时次的入库版本(version_ts=当前时间)
+            - 24-06-30 同一 issue 的 version_ts 严格递增(取 max(原版本+1, 当前时间))，
+                       同一秒内重复入库时版本也会变化，api 轮询时不会遗漏
+            api 轮询 issue_versions 后使该 issue 的响应缓存失效，因此每次写入(覆盖)站点或栅格产品后都需要调用
+            写入失败只打印日志，不影响入库流程
+        @param issue_ts:
+        @return:
+        """
+        tab: Table = IssueVersionModel.__table__
+        now_utc: Arrow = arrow.utcnow()
+        stmt = mysql_insert(tab).values(issue_ts=issue_ts, version_ts=now_utc.int_timestamp,
+                                        gmt_create_time=now_utc.datetime, gmt_modify_time=now_utc.datetime)
+        stmt = stmt.on_duplicate_key_update(version_ts=func.greatest(tab.c.version_ts + 1, stmt.inserted.version_ts),
+                                            gmt_modify_time=stmt.inserted.gmt_modify_time)
+        try:
+            self.ensure_summary_tab()
+            with self.engine.begin() as conn:
+                conn.execute(stmt)
+        except Exception as ex:
+            print(f'[!]更新issue:{issue_ts}入库版本出错:{ex.args}')
+
+    def get_split_tab_names(self) -> List[str]:
+        """
+            + 24-06-08 获取库中已存在的全部 station_realdata_YYYY 分表
+        @return:
+        """
+        list_sql = text("SELECT table_name FROM information_schema.tables "
+                        "WHERE table_schema=DATABASE() AND table_name LIKE :tab_pattern")
+        tab_pattern: str = f'{StationForecastRealDataModel.table_name_base}\\_%'
+        with self.engine.connect() as conn:
+            tab_names: List[str] = [row[0] for row in conn.execute(list_sql, {'tab_pattern': tab_pattern})]
+        return [name for name in tab_names if name != StationForecastRealDataModel.__tablename__]
+
+    def migrate_all(self) -> bool:
+        """
+            + 24-06-08 对已存在的全部分表补建唯一键、复合索引及整点生成列
+        @return:
+        """
+        is_ok: bool = True
+        for tab_name in self.get_split_tab_names():
+            if self._migrate_tab(tab_name):
+                self._exist_tabs.add(tab_name)
+            else:
+                is_ok = False
+        return is_ok
+
+    def is_migrated(self, tab_name: str) -> bool:
+        """
+            + 24-06-28 判断已存在的分表是否包含唯一键、复合索引及整点生成列(只读取 information_schema，不执行 DDL)
+        @param tab_name:
+        @return:
+        """
+        check_sql = text("SELECT "
+                         "(SELECT COUNT(DISTINCT index_name) FROM information_schema.statistics "
+                         "WHERE table_schema=DATABASE() AND table_name=:tab_name "
+                         "AND index_name IN (:unique_key, :query_index)) + "
+                         "(SELECT COUNT(1) FROM information_schema.columns "
+                         "WHERE table_schema=DATABASE() AND table_name=:tab_name AND column_name=:column_name)")
+        with self.engine.connect() as conn:
+            count: int = conn.execute(check_sql, {'tab_name': tab_name, 'unique_key': REALDATA_UNIQUE_KEY,
+                                                  'query_index': REALDATA_QUERY_INDEX,
+                                                  'column_name': REALDATA_HOURLY_COLUMN}).scalar()
+        return count == 3
+
+    def _create_tab(self, tab_name: str) -> bool:
+        is_ok = False
+        meta_data = MetaData()
+        now_utc: Arrow = arrow.utcnow()
+        Table(tab_name, meta_data, Column('id', Integer, primary_key=True),
+              Column('is_del', TINYINT(1), nullable=False, server_default=text("'0'"), default=0),
+              Column('station_code', VARCHAR(200), nullable=False, index=True),
+              Column('surge', Float, nullable=False),
+              Column('task_id', VARCHAR(8), nullable=False, index=True),
+              Column('forecast_ts', Integer, nullable=False, default=now_utc.int_timestamp),
+              Column('issue_ts', Integer, nullable=False, default=now_utc.int_timestamp),
+              Column('forecast_dt', DATETIME(fsp=6), default=now_utc.datetime),
+              Column('issue_dt', DATETIME(fsp=6), default=now_utc.datetime),
+              Column(REALDATA_HOURLY_COLUMN, TINYINT(1), Computed(REALDATA_HOURLY_EXPR, persisted=True)),
+              UniqueConstraint('station_code', 'forecast_ts', 'issue_ts', name=REALDATA_UNIQUE_KEY),
+              Index(REALDATA_QUERY_INDEX, 'issue_ts', 'station_code', 'forecast_ts'))
+        try:
+            # checkfirst: 多进程同时创建时不会重复建表
+            meta_data.create_all(self.engine, checkfirst=True)
+            is_ok = True
+        except Exception as ex:
+            print(f'[!]创建分表{tab_name}出错:{ex.args}')
+        return is_ok
+
+    def _migrate_tab(self, tab_name: str) -> bool:
+        """
+            判断已存在的分表是否包含批量 upsert 所需的唯一键、查询使用的复合索引及整点生成列，若不存在则补建
+            注意: 若表中已存在重复的 (station_code, forecast_ts, issue_ts) 记录，需先手动去重
+        @param tab_name:
+        @return:
+        """
+        is_ok = False
+        check_index_sql = text("SELECT COUNT(1) FROM information_schema.statistics "
+                               "WHERE table_schema=DATABASE() AND table_name=:tab_name AND index_name=:index_name")
+        check_column_sql = text("SELECT COUNT(1) FROM information_schema.columns "
+                                "WHERE table_schema=DATABASE() AND table_name=:tab_name AND column_name=:column_name")
+        try:
+            with self.engine.begin() as conn:
+                if conn.execute(check_index_sql, {'tab_name': tab_name, 'index_name': REALDATA_UNIQUE_KEY}).scalar() == 0:
+                    conn.execute(text(f'ALTER TABLE {tab_name} ADD UNIQUE INDEX {REALDATA_UNIQUE_KEY} '
+                                      f'(station_code, forecast_ts, issue_ts)'))
+                if conn.execute(check_index_sql,
+                                {'tab_name': tab_name, 'index_name': REALDATA_QUERY_INDEX}).scalar() == 0:
+                    conn.execute(text(f'ALTER TABLE {tab_name} ADD INDEX {REALDATA_QUERY_INDEX} '
+                                      f'(issue_ts, station_code, forecast_ts)'))
+                if conn.execute(check_column_sql,
+                                {'tab_name': tab_name, 'column_name': REALDATA_HOURLY_COLUMN}).scalar() == 0:
+                    conn.execute(text(f'ALTER TABLE {tab_name} ADD COLUMN {REALDATA_HOURLY_COLUMN} TINYINT(1) '
+                                      f'AS ({REALDATA_HOURLY_EXPR}) STORED'))
+            is_ok = True
+        except Exception as ex:
+            print(f'[!]迁移分表{tab_name}出错:{ex.args}')
+        return is_ok
+
+
+station_tab_registry = StationRealDataTableRegistry()
@@ -0,0 +1,105 @@
+"""
+    + 24-06-28 最大增水场(maxSurge)标准化 Dataset 的一致性及耗时对比
+    原方式: pd.read_csv(sep='\s+') -> 转置 -> DataFrame 过滤 999.0 -> xr.DataArray -> sortby('lat')
+    现方式: CoverageData.stand_2_dataset(CoverageFile.get_max_surge_grid 读取为 float32 二维数组)
+    使用生成的 220(lon) * 250(lat) maxSurge 文件，在 proj 目录下执行(不写入 task 记录):
+        python scripts/bench_max_surge_dataset.py
+"""
+import os
+import sys
+import pathlib
+import tempfile
+import timeit
+
+import arrow
+import numpy as np
+import pandas as pd
+import xarray as xr
+import rioxarray
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.data import CoverageData
+from core.files import MAX_SURGE_LATS, MAX_SURGE_LONS, MAX_SURGE_INVALID_VAL
+from util.util import get_relative_path
+
+REPEAT: int = 5
+NUMBER: int = 5
+# float32 的相对精度
+FLOAT32_RTOL: float = 1e-6
+
+
+def make_max_surge_file(full_path: str):
+    """
+        生成 maxSurge 文件: 每行为同一经度的各纬度值，陆地为 999.0
+    """
+    rng = np.random.default_rng(0)
+    vals: np.ndarray = rng.uniform(-50, 300, size=(len(MAX_SURGE_LONS), len(MAX_SURGE_LATS)))
+    vals[rng.random(vals.shape) < 0.3] = MAX_SURGE_INVALID_VAL
+    pathlib.Path(full_path).parent.mkdir(parents=True, exist_ok=True)
+    np.savetxt(full_path, vals, fmt='%.3f', delimiter=' ')
+
+
+def stand_2_dataset_baseline(full_path: str) -> xr.Dataset:
+    """
+        原 CoverageData.stand_2_dataset 的读取方式
+    """
+    with open(full_path, 'rb') as f:
+        data: pd.DataFrame = pd.read_csv(f, encoding='gbk', sep='\s+', header=None,
+                                         infer_datetime_format=False)
+        data_T: pd.DataFrame = data.transpose()
+        data_T = data_T[data_T != 999.0]
+        lon = np.arange(105, 127, 0.1)
+        lat = np.arange(41, 16, -0.1)
+        da = xr.DataArray(data_T, coords=[lat, lon], dims=['lat', 'lon'])
+        ds: xr.Dataset = xr.Dataset({'max_surge': da})
+        ds_sorted_y: xr.Dataset = ds.sortby('lat', ascending=False)
+        ds_sorted_y['lat'].attrs['axis'] = 'Y'
+        ds_sorted_y['lat'].attrs['units'] = 'degrees_north'
+        ds_sorted_y['lat'].attrs['long_name'] = 'latitude'
+        ds_sorted_y['lat'].attrs['standard_name'] = 'latitude'
+        ds_sorted_y['lon'].attrs['axis'] = 'X'
+        ds_sorted_y['lon'].attrs['units'] = 'degrees_east'
+        ds_sorted_y['lon'].attrs['long_name'] = 'longitude'
+        ds_sorted_y['lon'].attrs['standard_name'] = 'longitude'
+        ds_sorted_y = ds_sorted_y.rio.write_crs("epsg:4326", inplace=True)
+        return ds_sorted_y
+
+
+def stand_2_dataset_new(coverage_data: CoverageData, dir_path: str) -> xr.Dataset:
+    # 跳过 decorator_job(不写入 task job 记录)
+    return coverage_data.stand_2_dataset.__wrapped__(dir_path, key=0)
+
+
+def check_parity(ds_baseline: xr.Dataset, ds_new: xr.Dataset):
+    assert ds_new['max_surge'].dims == ds_baseline['max_surge'].dims, '维度不一致'
+    assert ds_new['max_surge'].dtype == np.float32, f'数据类型错误:{ds_new["max_surge"].dtype}'
+    for name in ('lat', 'lon'):
+        np.testing.assert_allclose(ds_new[name].values, ds_baseline[name].values, rtol=FLOAT32_RTOL, err_msg=name)
+        assert ds_new[name].attrs == ds_baseline[name].attrs, f'{name} attrs 不一致'
+    np.testing.assert_allclose(ds_new['max_surge'].values, ds_baseline['max_surge'].values, rtol=FLOAT32_RTOL,
+                               equal_nan=True, err_msg='max_surge')
+    assert ds_new.rio.crs == ds_baseline.rio.crs, 'crs 不一致'
+
+
+def main():
+    coverage_data = CoverageData(arrow.utcnow())
+    with tempfile.TemporaryDirectory() as dir_path:
+        relative_path: str = get_relative_path(coverage_data.get_nearly_forecast_dt())
+        full_path: str = str(pathlib.Path(dir_path) / relative_path / coverage_data.get_file_name('txt'))
+        make_max_surge_file(full_path)
+        ds_baseline: xr.Dataset = stand_2_dataset_baseline(full_path)
+        ds_new: xr.Dataset = stand_2_dataset_new(coverage_data, dir_path)
+        check_parity(ds_baseline, ds_new)
+        baseline_time: float = min(
+            timeit.repeat(lambda: stand_2_dataset_baseline(full_path), repeat=REPEAT, number=NUMBER))
+        new_time: float = min(
+            timeit.repeat(lambda: stand_2_dataset_new(coverage_data, dir_path), repeat=REPEAT, number=NUMBER))
+        print(f'[-]maxSurge: lat:{len(MAX_SURGE_LATS)} lon:{len(MAX_SURGE_LONS)} 结果一致(rtol={FLOAT32_RTOL})')
+        print(f'    read_csv+transpose:{baseline_time / NUMBER * 1000:.2f}ms  '
+              f'get_max_surge_grid:{new_time / NUMBER * 1000:.2f}ms  '
+              f'speedup:{baseline_time / new_time:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
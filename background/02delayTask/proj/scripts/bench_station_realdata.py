@@ -0,0 +1,117 @@
+"""
+    + 24-06-28 站点增水(staSurge)读取的一致性及耗时对比
+    原方式: pd.read_table(sep='\s+', encoding='gbk') 逐列生成 Series
+    现方式: StationRealDataFile.get_station_realdata_matrix(np.fromstring 整体解析，含无法解析字符时回退至 pd.read_csv)
+    使用生成的 192 时次 * 100 站点的 staSurge 文件，在 proj 目录下执行:
+        python scripts/bench_station_realdata.py
+"""
+import os
+import sys
+import tempfile
+import timeit
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import Series, DataFrame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.comm_dicts import station_code_dicts
+from core.files import StationRealDataFile
+
+STEPS: int = 192
+STATIONS: int = 100
+REPEAT: int = 5
+NUMBER: int = 10
+FILE_NAME: str = 'NMF_TRN_OSTZSS_CSDT_2023051612_168h_SS_staSurge.txt'
+# 缺测标识(np.fromstring 无法解析，触发回退)
+MISSING_VAL: str = '-'
+
+
+def get_station_names(count: int) -> List[str]:
+    """
+        从 station_code_dicts 中取 count 个 code 不重复的站点名称
+    """
+    names: List[str] = []
+    codes = set()
+    for name, code in station_code_dicts.items():
+        if code in codes:
+            continue
+        codes.add(code)
+        names.append(name)
+        if len(names) == count:
+            break
+    return names
+
+
+def make_sta_surge_file(dir_path: str, names: List[str], with_missing: bool = False) -> str:
+    """
+        生成 staSurge 文件: 首行为 gbk 编码的站点名称，之后每行为 行号 + 各站点增水
+    """
+    rng = np.random.default_rng(0)
+    vals: np.ndarray = rng.uniform(-150, 250, size=(STEPS, len(names)))
+    rows: List[str] = []
+    for step in range(STEPS):
+        row_vals: List[str] = [f'{val:.2f}' for val in vals[step]]
+        if with_missing and step % 17 == 0:
+            row_vals[step % len(names)] = MISSING_VAL
+        rows.append(' '.join([str(step)] + row_vals))
+    full_path: str = os.path.join(dir_path, FILE_NAME)
+    with open(full_path, 'wb') as f:
+        f.write((' '.join(names) + '\n').encode('gbk'))
+        f.write(('\n'.join(rows) + '\n').encode('ascii'))
+    return full_path
+
+
+def read_baseline(full_path: str) -> Dict[str, Series]:
+    """
+        原 StationRealDataFile.get_station_realdata_list 的读取方式
+    """
+    dict_station = {}
+    with open(full_path, 'rb') as f:
+        df: DataFrame = pd.read_table(f, encoding='gbk', sep='\s+',
+                                      header=0, infer_datetime_format=False)
+        for temp_row in df.columns:
+            temp_code = station_code_dicts.get(temp_row)
+            if temp_code is None:
+                continue
+            dict_station[temp_code] = df[temp_row]
+    return dict_station
+
+
+def read_new(dir_path: str) -> Tuple[List[str], np.ndarray]:
+    return StationRealDataFile(dir_path, '', FILE_NAME).get_station_realdata_matrix()
+
+
+def check_parity(dir_path: str, full_path: str):
+    dict_baseline: Dict[str, Series] = read_baseline(full_path)
+    codes, matrix = read_new(dir_path)
+    assert codes == list(dict_baseline.keys()), '站点 code 不一致'
+    assert matrix.dtype == np.float32 and matrix.shape == (STEPS, len(codes)), f'数组形状错误:{matrix.shape}'
+    for index, code in enumerate(codes):
+        # 原方式中含缺测标识的列为 object，入库前同样需要转换为数值
+        expected: np.ndarray = pd.to_numeric(dict_baseline[code], errors='coerce').to_numpy(dtype=np.float64)
+        np.testing.assert_allclose(matrix[:, index], expected, rtol=1e-6, atol=1e-4, err_msg=code)
+
+
+def run_case(title: str, with_missing: bool):
+    names: List[str] = get_station_names(STATIONS)
+    with tempfile.TemporaryDirectory() as dir_path:
+        full_path: str = make_sta_surge_file(dir_path, names, with_missing)
+        check_parity(dir_path, full_path)
+        baseline_time: float = min(timeit.repeat(lambda: read_baseline(full_path), repeat=REPEAT, number=NUMBER))
+        new_time: float = min(timeit.repeat(lambda: read_new(dir_path), repeat=REPEAT, number=NUMBER))
+        print(f'[-]{title}: 站点:{len(names)} 时次:{STEPS} 结果一致')
+        print(f'    read_table:{baseline_time / NUMBER * 1000:.2f}ms  '
+              f'fromstring:{new_time / NUMBER * 1000:.2f}ms  '
+              f'speedup:{baseline_time / new_time:.1f}x')
+
+
+def main():
+    run_case('np.fromstring', with_missing=False)
+    run_case('回退 pd.read_csv(含缺测标识)', with_missing=True)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,111 +1,150 @@
-import uuid
-from typing import List
-
-import arrow
-import ftplib
-import os
-
-
-def generate_key():
-    """
-        根据 uuid4 生成数据库唯一主键
-    @return:
-    """
-    return str(uuid.uuid4().hex)[:8]
-
-
-def get_relative_path(now: arrow.Arrow) -> str:
-    """
-        根据传入时间获取相对路径
-        root/relative_path/file_name
-        对于 utc 31d 12h
-    @param now:
-    @return:
-    """
-    year_str: str = now.format('YYYY')
-    month_str: str = now.format('MM')
-    return f'{year_str}/{month_str}'
-
-
-class FtpFactory:
-    """
-        + 23-09-20 ftp下载工厂类
-    """
-    encoding = 'gbk'
-    ftp = ftplib.FTP()
-
-    def __init__(self, host: str, port=21):
-        self.ftp.connect(host, port)
-        self.ftp.encoding = self.encoding
-
-    def login(self, user, passwd):
-        self.ftp.login(user, passwd)
-        print(self.ftp.welcome)
-
-    def down_load_file(self, local_full_path: str, remote_file_name: str):
-        """
-
-
-        @param local_full_path: 本地存储全路径(含文件名),
-        @param remote_file_name: 远端文件名
-        @return:
-        """
-        file_handler = open(local_full_path, 'wb')
-        # print(file_handler)
-        # self.ftp.retrbinary("RETR %s" % (RemoteFile), file_handler.write)#接收服务器上文件并写入本地文件
-        self.ftp.retrbinary('RETR ' + remote_file_name, file_handler.write)
-        file_handler.close()
-        return True
-
-    def down_load_file_bycwd(self, local_full_path: str, remote_path: str, file_name: str) -> bool:
-        is_ok: bool = False
-        file_handler = open(local_full_path, 'wb')
-        # print(file_handler)
-        # self.ftp.retrbinary("RETR %s" % (RemoteFile), file_handler.write)#接收服务器上文件并写入本地文件
-        # 进入到 remote_path 路径下
-        self.ftp.cwd(remote_path)
-        files_list: List[str] = self.ftp.nlst()
-        # TODO:[-] 23-09-26 修改 ftp 缓冲区为 250KB
-        BUFSIZE: int = 262144
-        if file_name in files_list:
-            now_str: str = arrow.Arrow.utcnow().format('YYYY-MM-DD|HH:mm:ss')
-            print(f'')
-            print(f'{now_str}[*]下载指定文件:{file_name}ing')
-            self.ftp.retrbinary('RETR ' + file_name, file_handler.write, BUFSIZE)
-            is_ok = True
-            load_over_time: str = arrow.Arrow.utcnow().format('YYYY-MM-DD|HH:mm:ss')
-            print(f'{load_over_time}[-]下载指定文件:{file_name}成功')
-            file_handler.close()
-        return is_ok
-
-    def down_load_file_tree(self, local_path: str, remote_path: str, cover_path: str = None):
-        """
-            下载整个目录下的文件
-        @param local_path:
-        @param remote_path:
-        @param cover_path:
-        @return:
-        """
-        print("远程文件夹remoteDir:", remote_path)
-        if not os.path.exists(local_path):
-            os.makedirs(local_path)
-        # 进入到 remote_path 路径下
-        self.ftp.cwd(remote_path)
-        remote_name_list = self.ftp.nlst()
-        print("远程文件目录：", remote_name_list)
-        # ['EU_high_res_wind_2023082012.nc']
-        for file in remote_name_list:
-            # 'E:\\05DATA\\06wind\\2022_EU_high'
-            Local = os.path.join(local_path, file)
-            print("正在下载", self.ftp.nlst(file))
-            if file.find(".") == -1:
-                if not os.path.exists(Local):
-                    os.makedirs(Local)
-                self.down_load_file_tree(Local, file)
-            else:
-                self.down_load_file(Local, file)
-        self.ftp.cwd("..")
-        return
-
-    def close(self):
-        self.ftp.quit()
+import uuid
+from typing import List, Dict, Any, Optional
+
+import arrow
+import ftplib
+import os
+import sys
+
+try:
+    # 只在 unix 下可用
+    import resource
+except ImportError:
+    resource = None
+
+
+def generate_key():
+    """
+        根据 uuid4 生成数据库唯一主键
+    @return:
+    """
+    return str(uuid.uuid4().hex)[:8]
+
+
+def get_relative_path(now: arrow.Arrow) -> str:
+    """
+        根据传入时间获取相对路径
+        root/relative_path/file_name
+        对于 utc 31d 12h
+    @param now:
+    @return:
+    """
+    year_str: str = now.format('YYYY')
+    month_str: str = now.format('MM')
+    return f'{year_str}/{month_str}'
+
+
+def get_nc_encoding(ds, nc_options: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    """
+        + 24-06-25 根据配置生成 to_netcdf 使用的各变量压缩及分块(chunk)参数
+    @param ds: xr.Dataset
+    @param nc_options: COVERAGE_WRITE_OPTIONS['NC']
+    @return: {var_name: {'zlib','complevel','shuffle','chunksizes'}}
+    """
+    chunk_sizes: Dict[str, int] = nc_options.get('chunk_sizes', {})
+    encoding: Dict[str, Dict[str, Any]] = {}
+    for var_name, var in ds.data_vars.items():
+        # 源文件为连续存储时 encoding 中会保留 contiguous=True，与压缩不兼容
+        var_encoding: Dict[str, Any] = {'zlib': nc_options.get('zlib'), 'complevel': nc_options.get('complevel'),
+                                        'shuffle': nc_options.get('shuffle'), 'contiguous': False}
+        if var.ndim > 0:
+            var_encoding['chunksizes'] = tuple(
+                min(chunk_sizes.get(dim, size), size) for dim, size in zip(var.dims, var.shape))
+        encoding[var_name] = var_encoding
+    return encoding
+
+
+def get_peak_rss_mb() -> Optional[float]:
+    """
+        + 24-06-27 获取当前进程的峰值常驻内存(MB)，不支持的平台返回 None
+    @return:
+    """
+    if resource is None:
+        return None
+    max_rss: int = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux 下单位为 KB，macos 下为 B
+    return max_rss / 1024 / 1024 if sys.platform == 'darwin' else max_rss / 1024
+
+
+class FtpFactory:
+    """
+        + 23-09-20 ftp下载工厂类
+    """
+    encoding = 'gbk'
+    ftp = ftplib.FTP()
+
+    def __init__(self, host: str, port=21):
+        self.ftp.connect(host, port)
+        self.ftp.encoding = self.encoding
+
+    def login(self, user, passwd):
+        self.ftp.login(user, passwd)
+        print(self.ftp.welcome)
+
+    def down_load_file(self, local_full_path: str, remote_file_name: str):
+        """
+
+
+        @param local_full_path: 本地存储全路径(含文件名),
+        @param remote_file_name: 远端文件名
+        @return:
+        """
+        file_handler = open(local_full_path, 'wb')
+        # print(file_handler)
+        # self.ftp.retrbinary("RETR %s" % (RemoteFile), file_handler.write)#接收服务器上文件并写入本地文件
+        self.ftp.retrbinary('RETR ' + remote_file_name, file_handler.write)
+        file_handler.close()
+        return True
+
+    def down_load_file_bycwd(self, local_full_path: str, remote_path: str, file_name: str) -> bool:
+        is_ok: bool = False
+        file_handler = open(local_full_path, 'wb')
+        # print(file_handler)
+        # self.ftp.retrbinary("RETR %s" % (RemoteFile), file_handler.write)#接收服务器上文件并写入本地文件
+        # 进入到 remote_path 路径下
+        self.ftp.cwd(remote_path)
+        files_list: List[str] = self.ftp.nlst()
+        # TODO:[-] 23-09-26 修改 ftp 缓冲区为 250KB
+        BUFSIZE: int = 262144
+        if file_name in files_list:
+            now_str: str = arrow.Arrow.utcnow().format('YYYY-MM-DD|HH:mm:ss')
+            print(f'')
+            print(f'{now_str}[*]下载指定文件:{file_name}ing')
+            self.ftp.retrbinary('RETR ' + file_name, file_handler.write, BUFSIZE)
+            is_ok = True
+            load_over_time: str = arrow.Arrow.utcnow().format('YYYY-MM-DD|HH:mm:ss')
+            print(f'{load_over_time}[-]下载指定文件:{file_name}成功')
+            file_handler.close()
+        return is_ok
+
+    def down_load_file_tree(self, local_path: str, remote_path: str, cover_path: str = None):
+        """
+            下载整个目录下的文件
+        @param local_path:
+        @param remote_path:
+        @param cover_path:
+        @return:
+        """
+        print("远程文件夹remoteDir:", remote_path)
+        if not os.path.exists(local_path):
+            os.makedirs(local_path)
+        # 进入到 remote_path 路径下
+        self.ftp.cwd(remote_path)
+        remote_name_list = self.ftp.nlst()
+        print("远程文件目录：", remote_name_list)
+        # ['EU_high_res_wind_2023082012.nc']
+        for file in remote_name_list:
+            # 'E:\\05DATA\\06wind\\2022_EU_high'
+            Local = os.path.join(local_path, file)
+            print("正在下载", self.ftp.nlst(file))
+            if file.find(".") == -1:
+                if not os.path.exists(Local):
+                    os.makedirs(Local)
+                self.down_load_file_tree(Local, file)
+            else:
+                self.down_load_file(Local, file)
+        self.ftp.cwd("..")
+        return
+
+    def close(self):
+        self.ftp.quit()
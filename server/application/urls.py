@@ -1,8 +1,10 @@
-# from controller import *
-from controller.coverage import app as coverage_app
-from controller.station import app as station_app
-
-urlpatterns = [
-    {"ApiRouter": coverage_app, "prefix": "/coverage", "tags": ["geo coverage"]},
-    {"ApiRouter": station_app, "prefix": "/station", "tags": ["station"]},
-]
+# from controller import *
+from controller.coverage import app as coverage_app
+from controller.station import app as station_app
+from controller.admin import app as admin_app
+
+urlpatterns = [
+    {"ApiRouter": coverage_app, "prefix": "/coverage", "tags": ["geo coverage"]},
+    {"ApiRouter": station_app, "prefix": "/station", "tags": ["station"]},
+    {"ApiRouter": admin_app, "prefix": "/admin", "tags": ["admin"]},
+]
@@ -0,0 +1,35 @@
+# + 24-06-12 进程内缓存配置(单位:s)
+CACHE_OPTIONS = {
+    # 站点基础信息及警戒潮位等远程参考数据(约每月更新一次)
+    'STATION_BASE': {
+        'TTL': 60 * 60,
+        'STALE_TTL': 24 * 60 * 60,
+        'REFRESH_INTERVAL': 30 * 60
+    },
+    # + 24-06-19 已发布预报产品(按 issue_ts 不再变化)的响应缓存(LRU)
+    'RESPONSE': {
+        'MAX_ENTRIES': 2000,
+        'MAX_BYTES': 256 * 1024 * 1024,
+        # 轮询 issue_versions 表的间隔，后台重新入库某个 issue 后最迟在该间隔内使对应缓存失效
+        'VERSION_POLL_INTERVAL': 30,
+        # + 24-06-30 轮询时向前回看的时长: 同一 issue 的版本严格递增(可能略超前于当前时间)，
+        #   以及入库事务晚于轮询提交时，回看窗口内的版本变化均不会遗漏
+        'VERSION_LOOKBACK': 5 * 60,
+        'PATHS': [
+            '/station/surge/list',
+            '/station/surge/max/list',
+            # + 24-06-28 多站点逐时增水(codes 为多值参数，排序后作为缓存 key)
+            '/station/stations/surge/list',
+            '/station/dist/stations/totalsurge',
+            '/coverage/one/url/ts',
+            '/coverage/forecast/point/list',
+            '/coverage/forecast/point/columns',
+            '/coverage/forecast/points/wind',
+            '/coverage/forecast/points/maxsurge',
+        ]
+    },
+    # + 24-06-20 已打开的风场及最大增水场 nc dataset(LRU，按文件路径+mtime 缓存，淘汰时关闭文件句柄)
+    'DATASET': {
+        'MAX_SIZE': 16
+    }
+}
@@ -1,17 +1,26 @@
-from util.consul_client import ConsulAgentClient
-from util.consul_util import ConsulConfigClient
-
-# onsul 配置
-CONSUL_OPTIONS = {
-    'CONSUL_SERVER': {
-        'HOST': '128.5.9.79',
-        'PORT': 8500,
-        'MAX_TRY_COUNT': 5
-    }
-}
-
-CONSUL_HOST: str = CONSUL_OPTIONS.get('CONSUL_SERVER').get('HOST')
-CONSUL_PORT: int = CONSUL_OPTIONS.get('CONSUL_SERVER').get('PORT')
-
-CONSUL_MAX_TRY_COUNT: int = CONSUL_OPTIONS.get('CONSUL_SERVER').get('MAX_TRY_COUNT')
-consul_config = ConsulConfigClient(CONSUL_HOST, CONSUL_PORT)
+from util.consul_client import ConsulAgentClient
+from util.consul_util import ConsulConfigClient
+
+# onsul 配置
+CONSUL_OPTIONS = {
+    'CONSUL_SERVER': {
+        'HOST': '128.5.9.79',
+        'PORT': 8500,
+        'MAX_TRY_COUNT': 5
+    },
+    # + 24-06-28 服务发现缓存
+    'DISCOVERY': {
+        # blocking query 最长等待时间
+        'WAIT': '55s',
+        # consul 请求出错后的重试间隔(s)
+        'RETRY_INTERVAL': 5,
+        # (服务, dc) 独立监听线程的上限，超出的由目录监听线程刷新
+        'MAX_WATCHERS': 8
+    }
+}
+
+CONSUL_HOST: str = CONSUL_OPTIONS.get('CONSUL_SERVER').get('HOST')
+CONSUL_PORT: int = CONSUL_OPTIONS.get('CONSUL_SERVER').get('PORT')
+
+CONSUL_MAX_TRY_COUNT: int = CONSUL_OPTIONS.get('CONSUL_SERVER').get('MAX_TRY_COUNT')
+consul_config = ConsulConfigClient(CONSUL_HOST, CONSUL_PORT)
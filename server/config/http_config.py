@@ -0,0 +1,17 @@
+# + 24-06-14 调用远程服务(station-base 等)使用的异步 http 客户端配置
+HTTP_CLIENT_OPTIONS = {
+    'REMOTE': {
+        # 连接池最大连接数(目前远程服务均为 station-base，即单个 host 的连接上限)
+        'MAX_CONNECTIONS': 20,
+        'MAX_KEEPALIVE_CONNECTIONS': 10,
+        # keep-alive 连接空闲多久后关闭(s)
+        'KEEPALIVE_EXPIRY': 30,
+        'CONNECT_TIMEOUT': 3,
+        'READ_TIMEOUT': 15
+    },
+    # + 24-06-15 批量并发获取多个站点数据时的并发上限及单次请求超时时间(s)
+    'FAN_OUT': {
+        'CONCURRENCY': 8,
+        'TIMEOUT': 10
+    }
+}
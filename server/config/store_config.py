@@ -1,20 +1,30 @@
-import consul
-
-STORE_OPTIONS = {
-    'NWP': {
-        'STORE_ROOT_PATH': '/data/local_wind_nwp'
-    }
-}
-
-
-class StoreConfig:
-    # ip = 'http://192.168.0.104:82'
-    ip = 'http://128.5.9.79:82'
-
-    @classmethod
-    def get_ip(cls):
-        """
-            获取存储动态ip
-        @return:
-        """
-        return cls.ip
+import consul
+
+STORE_OPTIONS = {
+    'NWP': {
+        'STORE_ROOT_PATH': '/data/local_wind_nwp'
+    },
+    # + 24-06-22 后台生成的最大增水场 nc(批量提取多点最大增水时读取)
+    'SURGE': {
+        'STORE_ROOT_PATH': '/data/local_surge'
+    },
+    # + 24-06-16 本地天文潮存储(预先拉取未来 WINDOW_DAYS 天所有站点的逐时天文潮，每 REFRESH_INTERVAL(s) 重建一次)
+    'TIDE': {
+        'STORE_ROOT_PATH': '/data/local_tide',
+        'WINDOW_DAYS': 30,
+        'REFRESH_INTERVAL': 12 * 60 * 60
+    }
+}
+
+
+class StoreConfig:
+    # ip = 'http://192.168.0.104:82'
+    ip = 'http://128.5.9.79:82'
+
+    @classmethod
+    def get_ip(cls):
+        """
+            获取存储动态ip
+        @return:
+        """
+        return cls.ip
@@ -1 +1 @@
-# from controller.station_status import app as station_status_app
+# from controller.station_status import app as station_status_app
@@ -0,0 +1,100 @@
+from typing import Dict, Optional
+from fastapi import APIRouter
+
+from db.db_factory import get_pool_status
+from dao.station import station_base_cache
+from dao.task import response_cache
+from dao.vector import dataset_cache
+
+app = APIRouter()
+
+
+@app.get('/db/pool/status', response_model=Dict, summary="获取数据库连接池状态(用于评估连接池大小)")
+def get_db_pool_status():
+    """
+        + 24-06-05 获取数据库连接池状态
+    @return: {
+        "pool_size": 5,
+        "checked_in": 4,
+        "checked_out": 1,
+        "overflow": -4,
+        "checkout_count": 120,
+        "avg_wait": 0.0012,
+        "max_wait": 0.035
+    }
+    """
+    return get_pool_status()
+
+
+@app.get('/cache/station/status', response_model=Dict, summary="获取站点基础信息等参考数据缓存状态")
+def get_station_cache_status():
+    """
+        + 24-06-12 获取站点基础信息等参考数据缓存状态
+    @return: {
+        "ttl": 3600,
+        "stale_ttl": 86400,
+        "hits": 120,
+        "stale_hits": 2,
+        "misses": 3,
+        "ages": {"dist_station_list": 35.2}
+    }
+    """
+    return station_base_cache.stats()
+
+
+@app.post('/cache/station/invalidate', response_model=Dict, summary="使站点基础信息等参考数据缓存失效")
+def invalidate_station_cache(key: Optional[str] = None):
+    """
+        + 24-06-12 使站点基础信息等参考数据缓存失效(下次请求时重新加载)
+    @param key: 缓存 key(eg: dist_station_list, dist_station_alert)，为空时清空全部
+    @return:
+    """
+    station_base_cache.invalidate(key)
+    return station_base_cache.stats()
+
+
+@app.get('/cache/response/status', response_model=Dict, summary="获取预报产品响应缓存状态")
+def get_response_cache_status():
+    """
+        + 24-06-19 获取预报产品响应缓存状态
+    @return: {
+        "entries": 120,
+        "bytes": 3145728,
+        "max_entries": 2000,
+        "max_bytes": 268435456,
+        "hits": 860,
+        "misses": 120,
+        "evictions": 0,
+        "issues": [1687953600]
+    }
+    """
+    return response_cache.stats()
+
+
+@app.post('/cache/response/invalidate', response_model=Dict, summary="使预报产品响应缓存失效")
+def invalidate_response_cache(issue_ts: Optional[int] = None):
+    """
+        + 24-06-19 使指定发布时次的响应缓存失效(后台重新入库后也会通过 issue_versions 自动失效)
+    @param issue_ts: 为空时清空全部
+    @return:
+    """
+    if issue_ts is None:
+        response_cache.clear()
+    else:
+        response_cache.invalidate_issue(issue_ts)
+    return response_cache.stats()
+
+
+@app.get('/cache/dataset/status', response_model=Dict, summary="获取已打开的风场 nc dataset 缓存状态")
+def get_dataset_cache_status():
+    """
+        + 24-06-20 获取已打开的风场 nc dataset 缓存状态
+    @return: {
+        "size": 2,
+        "max_size": 16,
+        "hits": 56,
+        "misses": 2,
+        "paths": ["/data/local_wind_nwp/2024/06/nwp_high_res_wind_2024061912_output.nc"]
+    }
+    """
+    return dataset_cache.stats()
@@ -1,84 +1,185 @@
-from typing import List, Type, Any, Optional, Dict
-from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request
-
-from common.default import DEFAULT_TS
-from common.enums import CoverageTypeEnum
-from dao.vector import NWPVectorDao
-from schema.coverage import CoverageFileUrlSchema, CoverageFileInfoSchema, WindVectorSchema
-from models.coverage import GeoCoverageFileModel
-from dao.coverage import CoverageDao
-
-app = APIRouter()
-
-
-@app.get('/one/url/ts', response_model=CoverageFileUrlSchema,
-         summary="获取对应的 tif|nc 文件的远程url", )
-def get_coverage_url(issue_ts: int, coverage_type: int = CoverageTypeEnum.CONVERT_TIF_FILE.value,
-                     forecast_ts: int = DEFAULT_TS) -> Dict[str, str]:
-    """
-        获取所属当前pid的全部region集合
-    @param issue_ts: 发布时间戳
-    @param coverage_type:  栅格种类
-    @param forecast_ts: 预报时间戳
-    @return:
-    """
-    url: str = ''
-    coverage_type_enum: CoverageTypeEnum = CoverageTypeEnum(coverage_type)
-    url = CoverageDao().get_tif_file_url(issue_ts=issue_ts, coverage_type=coverage_type_enum, forecast_ts=forecast_ts)
-    res = {'remote_url': url}
-    return res
-
-
-@app.get('/one/info/ts', response_model=CoverageFileInfoSchema,
-         response_model_include=['forecast_ts', 'issue_ts', 'task_id', 'relative_path', 'file_name', 'coverage_type'],
-         summary="获取对应的 tif|nc 文件的info", )
-def get_coverage_info(issue_ts: int) -> Optional[GeoCoverageFileModel]:
-    """
-        获取所属当前pid的全部region集合
-    @param pid:
-    @return:{
-    "forecast_ts": 1685620800,
-    "issue_ts": 1685620800,
-    "task_id": 39268281,
-    "relative_path": "2023/06",
-    "file_name": "NMF_TRN_OSTZSS_CSDT_2023060112_168h_SS_maxSurge.nc",
-    "coverage_type": 2102
-}
-    """
-    coverage_info = None
-    coverage_info = CoverageDao().get_coveage_file(issue_ts=issue_ts)
-    # TODO:[*] 23-06-01 需要将: GeoCoverageFileModel. relative_path+file_name -> remote_url
-    return coverage_info
-
-
-@app.get('/dist/ts', summary="获取 geo_coverage_file 的不同 issue_ts 并以集合的方式返回,返回最近的10个时间戳", )
-def get_dist_ts(limit: int = 10) -> List[int]:
-    """
-        获取 geo_coverage_file 的不同 issue_ts 并以集合的方式返回
-    @param limit:
-    @return:
-    """
-    list_dist_ts: List[int] = CoverageDao().get_dist_ts()
-    return list_dist_ts
-
-
-@app.get('/forecast/point/list', summary="获取 geo_coverage_file 的不同 issue_ts 并以集合的方式返回,返回最近的10个时间戳", )
-def get_forecast_list(lat: float, lon: float, issue_ts: int) -> List[WindVectorSchema]:
-    """
-        step1:根据 issue_ts 获取对应的栅格文件的路径
-        step2: 根据指定栅格文件的路径，根据临近算法获取对应点的时序值
-    @param lat:
-    @param lon:
-    @param issue_ts:
-    @return:
-    """
-    # step1: 获取指定nc文件路径
-    coverage_file: Optional[GeoCoverageFileModel] = CoverageDao().get_coveage_file(issue_ts=issue_ts,
-                                                                                   coverage_type=CoverageTypeEnum.NWP_SPLIT_COVERAGE_FILE)
-    nwp_forecast_vals: List[WindVectorSchema] = []
-    # step2: 加载指定nc文件并根据邻近算法获取对应的时序数据
-    if coverage_file is not None:
-        nwp_forecast_vals = NWPVectorDao(coverage_file).read_forecast_list(lat=lat, lon=lon)
-        # nwp_forecast_vals = [WindVectorSchema(forecast_ts=1, wd=None, ws=None)]
-    return nwp_forecast_vals
+from typing import List, Type, Any, Optional, Dict
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Request, Query
+from fastapi.responses import JSONResponse
+from sqlalchemy.orm import Session
+
+from common.default import DEFAULT_TS
+from common.enums import CoverageTypeEnum
+from dao.vector import NWPVectorDao, MaxSurgeVectorDao
+from schema.coverage import CoverageFileUrlSchema, CoverageFileInfoSchema, WindVectorSchema, WindVectorColumnSchema, \
+    WindVectorPointsSchema, MaxSurgePointsSchema
+from models.coverage import GeoCoverageFileModel
+from dao.coverage import CoverageDao
+from db.db_factory import get_db
+
+app = APIRouter()
+
+
+@app.get('/one/url/ts', response_model=CoverageFileUrlSchema,
+         summary="获取对应的 tif|nc 文件的远程url", )
+def get_coverage_url(issue_ts: int, coverage_type: int = CoverageTypeEnum.CONVERT_TIF_FILE.value,
+                     forecast_ts: int = DEFAULT_TS, session: Session = Depends(get_db)) -> Dict[str, str]:
+    """
+        获取所属当前pid的全部region集合
+    @param issue_ts: 发布时间戳
+    @param coverage_type:  栅格种类
+    @param forecast_ts: 预报时间戳
+    @return:
+    """
+    url: str = ''
+    coverage_type_enum: CoverageTypeEnum = CoverageTypeEnum(coverage_type)
+    url = CoverageDao(session).get_tif_file_url(issue_ts=issue_ts, coverage_type=coverage_type_enum, forecast_ts=forecast_ts)
+    res = {'remote_url': url}
+    return res
+
+
+@app.get('/one/info/ts', response_model=CoverageFileInfoSchema,
+         response_model_include=['forecast_ts', 'issue_ts', 'task_id', 'relative_path', 'file_name', 'coverage_type'],
+         summary="获取对应的 tif|nc 文件的info", )
+def get_coverage_info(issue_ts: int, session: Session = Depends(get_db)) -> Optional[GeoCoverageFileModel]:
+    """
+        获取所属当前pid的全部region集合
+    @param pid:
+    @return:{
+    "forecast_ts": 1685620800,
+    "issue_ts": 1685620800,
+    "task_id": 39268281,
+    "relative_path": "2023/06",
+    "file_name": "NMF_TRN_OSTZSS_CSDT_2023060112_168h_SS_maxSurge.nc",
+    "coverage_type": 2102
+}
+    """
+    coverage_info = None
+    coverage_info = CoverageDao(session).get_coveage_file(issue_ts=issue_ts)
+    # TODO:[*] 23-06-01 需要将: GeoCoverageFileModel. relative_path+file_name -> remote_url
+    return coverage_info
+
+
+@app.get('/dist/ts', summary="获取 geo_coverage_file 的不同 issue_ts 并以集合的方式返回,返回最近的10个时间戳", )
+def get_dist_ts(limit: int = 10, session: Session = Depends(get_db)) -> List[int]:
+    """
+        获取 geo_coverage_file 的不同 issue_ts 并以集合的方式返回
+    @param limit:
+    @return:
+    """
+    list_dist_ts: List[int] = CoverageDao(session).get_dist_ts()
+    return list_dist_ts
+
+
+@app.get('/forecast/point/list', summary="获取 geo_coverage_file 的不同 issue_ts 并以集合的方式返回,返回最近的10个时间戳", )
+def get_forecast_list(lat: float, lon: float, issue_ts: int, session: Session = Depends(get_db)) -> List[WindVectorSchema]:
+    """
+        step1:根据 issue_ts 获取对应的栅格文件的路径
+        step2: 根据指定栅格文件的路径，根据临近算法获取对应点的时序值
+    @param lat:
+    @param lon:
+    @param issue_ts:
+    @return:
+    """
+    # step1: 获取指定nc文件路径
+    coverage_file: Optional[GeoCoverageFileModel] = CoverageDao(session).get_coveage_file(issue_ts=issue_ts,
+                                                                                          coverage_type=CoverageTypeEnum.NWP_SPLIT_COVERAGE_FILE)
+    nwp_forecast_vals: List[WindVectorSchema] = []
+    # step2: 加载指定nc文件并根据邻近算法获取对应的时序数据
+    if coverage_file is not None:
+        nwp_forecast_vals = NWPVectorDao(coverage_file, session).read_forecast_list(lat=lat, lon=lon)
+        # nwp_forecast_vals = [WindVectorSchema(forecast_ts=1, wd=None, ws=None)]
+    return nwp_forecast_vals
+
+
+@app.get('/forecast/point/columns', response_model=WindVectorColumnSchema,
+         summary="获取指定经纬度的风场时序数据(列式)", )
+def get_forecast_columns(lat: float, lon: float, issue_ts: int, session: Session = Depends(get_db)):
+    """
+        + 24-06-21 与 /forecast/point/list 相同，以列式返回(不再逐项生成 WindVectorSchema 并校验)
+    @param lat:
+    @param lon:
+    @param issue_ts:
+    @return: {
+        "ts": [1718798400, 1718802000],
+        "ws": [5.2, null],
+        "wd": [132.5, null]
+    }
+    """
+    coverage_file: Optional[GeoCoverageFileModel] = CoverageDao(session).get_coveage_file(issue_ts=issue_ts,
+                                                                                          coverage_type=CoverageTypeEnum.NWP_SPLIT_COVERAGE_FILE)
+    columns: Optional[Dict[str, List]] = None
+    if coverage_file is not None:
+        columns = NWPVectorDao(coverage_file, session).read_forecast_columns(lat=lat, lon=lon)
+    if columns is None:
+        columns = {'ts': [], 'ws': [], 'wd': []}
+    # 直接返回 JSONResponse，跳过 response_model 的逐项校验及 jsonable_encoder
+    return JSONResponse(content=columns)
+
+
+def check_points(lats: List[float], lons: List[float]):
+    """
+        + 24-06-22 校验多点查询的经纬度参数
+    @param lats:
+    @param lons:
+    @return:
+    """
+    if len(lats) != len(lons):
+        raise HTTPException(status_code=422, detail='lats 与 lons 的数量不一致')
+
+
+@app.get('/forecast/points/wind', response_model=WindVectorPointsSchema,
+         summary="批量获取多点(或沿折线)的风场时序数据", )
+def get_forecast_points_wind(issue_ts: int, lats: List[float] = Query(...), lons: List[float] = Query(...),
+                             is_polyline: bool = False, step: Optional[float] = None,
+                             session: Session = Depends(get_db)):
+    """
+        + 24-06-22 批量获取多点(或沿折线)的风场时序数据，只读取一次风场 nc
+        eg: /coverage/forecast/points/wind?issue_ts=1718798400&lats=30.1&lons=122.3&lats=30.5&lons=122.6
+    @param issue_ts:
+    @param lats:
+    @param lons:
+    @param is_polyline: 是否将 lats,lons 作为折线顶点(沿折线采样)
+    @param step: 折线采样间隔(°)，默认为网格分辨率
+    @return: {
+        "ts": [1718798400, 1718802000],
+        "lat": [30.1, 30.5],
+        "lon": [122.3, 122.6],
+        "ws": [[5.2, 5.6], [6.1, null]],
+        "wd": [[132.5, 130.1], [128.4, null]]
+    }
+    """
+    check_points(lats, lons)
+    coverage_file: Optional[GeoCoverageFileModel] = CoverageDao(session).get_coveage_file(issue_ts=issue_ts,
+                                                                                          coverage_type=CoverageTypeEnum.NWP_SPLIT_COVERAGE_FILE)
+    columns: Optional[Dict[str, List]] = None
+    if coverage_file is not None:
+        columns = NWPVectorDao(coverage_file, session).read_points_columns(lats, lons, is_polyline, step)
+    if columns is None:
+        columns = {'ts': [], 'lat': [], 'lon': [], 'ws': [], 'wd': []}
+    return JSONResponse(content=columns)
+
+
+@app.get('/forecast/points/maxsurge', response_model=MaxSurgePointsSchema,
+         summary="批量获取多点(或沿折线)的最大增水", )
+def get_forecast_points_maxsurge(issue_ts: int, lats: List[float] = Query(...), lons: List[float] = Query(...),
+                                 is_polyline: bool = False, step: Optional[float] = None,
+                                 session: Session = Depends(get_db)):
+    """
+        + 24-06-22 批量获取多点(或沿折线)的最大增水，只读取一次最大增水场 nc
+    @param issue_ts:
+    @param lats:
+    @param lons:
+    @param is_polyline: 是否将 lats,lons 作为折线顶点(沿折线采样)
+    @param step: 折线采样间隔(°)，默认为网格分辨率
+    @return: {
+        "lat": [30.1, 30.5],
+        "lon": [122.3, 122.6],
+        "max_surge": [52.3, null]
+    }
+    """
+    check_points(lats, lons)
+    coverage_file: Optional[GeoCoverageFileModel] = CoverageDao(session).get_coveage_file(issue_ts=issue_ts,
+                                                                                          coverage_type=CoverageTypeEnum.CONVERT_COVERAGE_FILE)
+    columns: Optional[Dict[str, List]] = None
+    if coverage_file is not None:
+        columns = MaxSurgeVectorDao(coverage_file, session).read_points_columns(lats, lons, is_polyline, step)
+    if columns is None:
+        columns = {'lat': [], 'lon': [], 'max_surge': []}
+    return JSONResponse(content=columns)
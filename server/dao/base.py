@@ -1,10 +1,16 @@
-from db.db_factory import DBFactory
-
-
-class BaseDao:
-    """
-        + 23-03-09 基础 dao 类
-    """
-
-    def __init__(self):
-        self.db = DBFactory()
+from sqlalchemy.orm import Session
+
+from db.db_factory import DBFactory
+
+
+class BaseDao:
+    """
+        + 23-03-09 基础 dao 类
+    """
+
+    def __init__(self, session: Session = None):
+        """
+
+        @param session: + 24-06-05 通过 Depends(get_db) 注入的 request 级别 session
+        """
+        self.db = DBFactory(session)
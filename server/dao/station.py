@@ -1,546 +1,742 @@
-import json
-import requests
-from typing import List, Optional, Any, Dict
-
-from sqlalchemy import distinct, select, func, and_, text
-from sqlalchemy.orm import aliased
-from sqlalchemy import select, within_group, distinct
-import arrow
-from common.utils import get_remote_url, get_target_ts_year
-from config.store_config import StoreConfig
-from models.station import StationForecastRealDataModel
-from schema.station import StationRegionSchema
-from schema.station_surge import SurgeRealDataSchema, AstronomicTideSchema, StationTotalSurgeSchema, \
-    DistStationTotalSurgeSchema, StationSurgeListSchema, DistStationSurgeListSchema, DistStationTideListSchema
-from dao.base import BaseDao
-from common.enums import CoverageTypeEnum, ForecastProductTypeEnum
-from util.consul_util import ConsulExtractClient
-
-CONSUL_SERVICE_NAME = 'station-base'
-consul_client = ConsulExtractClient(CONSUL_SERVICE_NAME)
-
-
-def get_remote_service(uri: str, params: dict):
-    return consul_client.get(uri, params=params)
-
-
-class StationSurgeDao(BaseDao):
-    def get_station_last_surge(self, **kwargs) -> Optional[List[SurgeRealDataSchema]]:
-        """
-            获取各个站点最后时刻的潮位数据及发布时间
-        @param kwargs:
-        @return:
-        """
-        session = self.db.session
-        now_arrow: arrow.Arrow = arrow.utcnow()
-        # 加入动态修改 tb
-        StationForecastRealDataModel.set_split_tab_name(now_arrow)
-        # StationForecastRealDataModel.__table__.name = 'station_realdata_2023'
-        # 执行查询操作
-        subquery = session.query(
-            StationForecastRealDataModel.station_code,
-            func.max(StationForecastRealDataModel.forecast_dt).label('min_forecast')
-        ).group_by(StationForecastRealDataModel.station_code).subquery()
-
-        query = session.query(
-            StationForecastRealDataModel.station_code.label('station_code'),
-            StationForecastRealDataModel.forecast_dt.label('forecast_dt'),
-            StationForecastRealDataModel.forecast_ts.label('forecast_ts'),
-            StationForecastRealDataModel.issue_ts.label('issue_ts'),
-            StationForecastRealDataModel.issue_dt.label('issue_dt'),
-            StationForecastRealDataModel.surge.label('surge')
-        ).join(
-            subquery,
-            and_(
-                StationForecastRealDataModel.station_code == subquery.c.station_code,
-                StationForecastRealDataModel.forecast_dt == subquery.c.min_forecast
-            )
-        )
-
-        result = query.all()
-        schema_list: List[SurgeRealDataSchema] = [
-            SurgeRealDataSchema(station_code=temp[0], forecast_dt=temp[1], forecast_ts=temp[2], issue_ts=temp[3],
-                                issue_dt=temp[4], surge=temp[5]) for temp in result]
-        return schema_list
-
-    def get_station_max_surge_byissuets(self, issue_ts: int, **kwargs) -> Optional[List[Dict]]:
-        """
-            + TODO:[*] 23-07-12
-              获取所有站点的72小时内的最大增水(issue_ts)
-              根据 发布时间获取该发布时间的 max surge集合
-        @param issue_ts:
-        @param kwargs:
-        @return:
-        """
-        session = self.db.session
-        now_arrow: arrow.Arrow = arrow.get(issue_ts)
-        # 加入动态修改 tb
-        StationForecastRealDataModel.set_split_tab_name(now_arrow)
-        #
-        #    SELECT MAX(surge),station_code
-        #    FROM station_realdata_2023
-        #    WHERE issue_ts=1687953600
-        #    GROUP BY station_code
-        # -----------
-        # SELECT station_realdata_2023.station_code, max(station_realdata_2023.surge) AS max_1
-        # FROM station_realdata_2023
-        # WHERE station_realdata_2023.issue_ts = :issue_ts_1 GROUP BY station_realdata_2023.station_code
-        # surge_max_cls = aliased(func.max(StationForecastRealDataModel.surge), name='surge_max')
-        stmt = select(StationForecastRealDataModel.station_code, func.max(StationForecastRealDataModel.surge)).where(
-            StationForecastRealDataModel.issue_ts == issue_ts).group_by(StationForecastRealDataModel.station_code)
-        # stmt = select(StationForecastRealDataModel.station_code, StationForecastRealDataModel.surge).where(
-        #     StationForecastRealDataModel.issue_ts == issue_ts).group_by(StationForecastRealDataModel.station_code)
-        # stmt = select(StationForecastRealDataModel.station_code, StationForecastRealDataModel.surge).where(
-        #     StationForecastRealDataModel.issue_ts == issue_ts)
-        # query = session.execute(stmt)
-        # # ERROR: sqlalchemy.exc.ResourceClosedError: This result object is closed.
-        # res = query.scalars().all()
-        # 只有 staiton_code
-        # 以下两种写法一致
-        # res = session.execute(stmt).scalars().all()
-        # res = session.scalars(stmt).all()
-        res = session.execute(stmt)
-        # surge 保留两位有效数字
-        res_list: List[Dict] = [{'code': row[0], 'surge': round(row[1], 2)} for row in res]
-        # for temp in res:
-        #     print(temp)
-        return res_list
-        pass
-
-    def get_station_surge_list(self, station_code: str, issue_ts: int, start_ts: int, end_ts: int, **kwargs) -> \
-            Optional[List[StationForecastRealDataModel]]:
-        """
-            根据 code 与 发布时间 issue_ts 获取制定时间范围内的 start_ts end_ts 潮位预报数据
-        @param station_code:
-        @param issue_ts:
-        @param start_ts:
-        @param end_ts:
-        @param kwargs:
-        @return:
-        """
-        session = self.db.session
-        issue_arrow: arrow.Arrow = arrow.get(issue_ts)
-        # 加入动态修改 tb
-        StationForecastRealDataModel.set_split_tab_name(issue_arrow)
-        # StationForecastRealDataModel.__table__.name = 'station_realdata_2023'
-        query = session.query(StationForecastRealDataModel).filter(StationForecastRealDataModel.issue_ts == issue_ts,
-                                                                   StationForecastRealDataModel.station_code == station_code).filter(
-            StationForecastRealDataModel.forecast_ts >= start_ts, StationForecastRealDataModel.forecast_ts <= end_ts)
-        res = query.all()
-        return res
-
-    def get_stations_hourly_surge_list(self, codes: List[str], issue_ts: int, start_ts: int, end_ts: int, **kwargs):
-        """
-            獲取指定 codes 的天文潮小時數據集合
-        @param codes:
-        @param issue_ts:
-        @param start_ts:
-        @param end_ts:
-        @param kwargs:
-        @return:
-        """
-        list_res: List[dict] = []
-        for code in codes:
-            temp_res = self.get_station_hourly_surge_list(code, issue_ts, start_ts, end_ts)
-            list_res.append({'code': code, 'surge_list': temp_res})
-        return list_res
-
-    def get_station_hourly_surge_list(self, station_code: str, issue_ts: int, start_ts: int, end_ts: int, **kwargs) -> \
-            Optional[List[StationForecastRealDataModel]]:
-        """
-            获取 站点指定时间范围内的整点数据
-            [-] 23-08-14 改善通过 group_by + group_contact 的方式改善了效率
-            TODO:[-] 23-12-21 加入了按照起止时间判断是否跨年，需要分表读取
-        @param station_code:
-        @param issue_ts:
-        @param start_ts:
-        @param end_ts:
-        @param kwargs:
-        @return:
-        """
-
-        # 获取整点的查询语句
-        # """
-        #     SELECT *
-        #     FROM station_realdata_2023
-        #     WHERE issue_ts=1687953600 AND station_code='BHI' AND DATE_FORMAT(forecast_dt,'%i:%s')='00:00'
-        #     ORDER BY issue_ts
-        #     LIMIT 72
-        # """
-        session = self.db.session
-        limit_count: int = 168
-        sql_str: str = ''
-        """sql查询语句"""
-        # 获取整点数据
-        # TODO:[-] 23-08-14 此处需要修改为动态获取库表名称
-        # TODO:[-] 23-12-21 注意此处若涉及到跨年的情况，需要跨表查询
-        # 若出现跨年的情况，则需要拼接两张表
-        if get_target_ts_year(start_ts) != get_target_ts_year(end_ts):
-
-            start_year_str: str = get_target_ts_year(start_ts)
-            """起止时间年 str"""
-
-            end_year_str: str = get_target_ts_year(end_ts)
-            """结束时间年 str"""
-
-            start_tab_name: str = f'station_realdata_{start_year_str}'
-            """起始时间对应的表名: year """
-            end_tab_name: str = f'station_realdata_{end_year_str}'
-            """结束时间对应的表名: year """
-
-            # TODO:[*] 23-12-21 跨年后请测试此处是否有错误
-            sql_str = text(
-                f"SELECT * FROM {start_tab_name} WHERE issue_ts={issue_ts} AND station_code='{station_code}' AND forecast_ts>={start_ts} AND forecast_ts<={end_ts} AND DATE_FORMAT(forecast_dt,'%i:%s')='00:00' UNION SELECT * FROM {end_tab_name} WHERE issue_ts={issue_ts} AND station_code='{station_code}' AND forecast_ts>={start_ts} AND forecast_ts<={end_ts} AND DATE_FORMAT(forecast_dt,'%i:%s')='00:00' ORDER BY issue_ts LIMIT {limit_count}")
-            pass
-        else:
-            year_str: str = get_target_ts_year(start_ts)
-            tab_name: str = f'station_realdata_{year_str}'
-            sql_str = text(
-                f"SELECT * FROM {tab_name} WHERE issue_ts={issue_ts} AND station_code='{station_code}' AND forecast_ts>={start_ts} AND forecast_ts<={end_ts} AND DATE_FORMAT(forecast_dt,'%i:%s')='00:00' ORDER BY issue_ts LIMIT {limit_count}")
-
-        res = session.execute(sql_str)
-        res = res.fetchall()
-        return res
-
-    def get_dist_stations_hourly_surge_list(self, issue_ts: int, start_ts: int, end_ts: int, **kwargs) -> \
-            Optional[List[StationForecastRealDataModel]]:
-        """
-            获取 站点指定时间范围内的整点数据
-            [-] 23-08-14 改善通过 group_by + group_contact 的方式改善了效率
-            TODO:[-] 23-12-21 加入了跨表查询的查询逻辑
-        @param issue_ts:
-        @param start_ts:
-        @param end_ts:
-        @param kwargs:
-        @return:[{
-            'station_code',
-            'surge_list',
-            'forecast_ts_list',
-            'issue_ts'
-        }]
-        """
-
-        # 获取整点的查询语句
-        # """
-        #     SELECT *
-        #     FROM station_realdata_2023
-        #     WHERE issue_ts=1687953600 AND station_code='BHI' AND DATE_FORMAT(forecast_dt,'%i:%s')='00:00'
-        #     ORDER BY issue_ts
-        #     LIMIT 72
-        # """
-        session = self.db.session
-        limit_count: int = 72
-        # 获取整点数据
-        # TODO:[-] 23-08-14 暂时去掉 整点的条件，因为增水结果均为整点数据
-        # sql_str: str = text(
-        #     f"SELECT * FROM station_realdata_2023 WHERE issue_ts={issue_ts} AND station_code='{station_code}' AND forecast_ts>={start_ts} AND forecast_ts<={end_ts} AND DATE_FORMAT(forecast_dt,'%i:%s')='00:00' ORDER BY issue_ts LIMIT {limit_count}")
-        # TODO:[-] 23-08-14 此处需要修改为动态获取库表名称
-        # TODO:[*] 23-12-21 涉及到跨年的情况，需要修改为动态获取库表名称
-        # tab_name: str = 'station_realdata_2023'
-        sql_str: str = ''
-        """sql查询语句"""
-        if get_target_ts_year(start_ts) != get_target_ts_year(end_ts):
-            start_year_str: str = get_target_ts_year(start_ts)
-            """起止时间年 str"""
-
-            end_year_str: str = get_target_ts_year(end_ts)
-            """结束时间年 str"""
-
-            start_tab_name: str = f'station_realdata_{start_year_str}'
-            """起始时间对应的表名: year """
-            end_tab_name: str = f'station_realdata_{end_year_str}'
-            """结束时间对应的表名: year """
-            # TODO:[*] 23-12-21 跨年后请测试此处是否有错误
-            sql_str = text(
-                f"SELECT station_code,group_concat(surge) as 'surge_list',group_concat(forecast_ts) as 'forecast_ts_list',issue_ts FROM {start_tab_name} WHERE issue_ts={issue_ts} AND forecast_ts>={start_ts} AND forecast_ts<={end_ts} GROUP BY station_code order by forecast_ts_list UNION SELECT station_code,group_concat(surge) as 'surge_list',group_concat(forecast_ts) as 'forecast_ts_list',issue_ts FROM {end_tab_name} WHERE issue_ts={issue_ts} AND forecast_ts>={start_ts} AND forecast_ts<={end_ts} GROUP BY station_code order by forecast_ts_list")
-            pass
-        else:
-            year_str: str = get_target_ts_year(start_ts)
-            tab_name: str = f'station_realdata_{year_str}'
-            # TODO:[*] 23-12-21 应加入 order by 控制拼接后的时间与对应的surge的顺序
-            sql_str = text(
-                f"SELECT station_code,group_concat(surge) as 'surge_list',group_concat(forecast_ts) as 'forecast_ts_list',issue_ts FROM {tab_name} WHERE issue_ts={issue_ts} AND forecast_ts>={start_ts} AND forecast_ts<={end_ts} GROUP BY station_code")
-        res = session.execute(sql_str)
-        res = res.fetchall()
-        return res
-
-    def get_station_last_issue_ts(self, station_code: str) -> int:
-        session = self.db.session
-        now_arrow: arrow.Arrow = arrow.utcnow()
-        # 加入动态修改 tb
-        StationForecastRealDataModel.set_split_tab_name(now_arrow)
-        # StationForecastRealDataModel.__table__.name = 'station_realdata_2023'
-        query = session.query(func.max(StationForecastRealDataModel.issue_ts)).filter(
-            StationForecastRealDataModel.station_code == station_code)
-        return query.scalar()
-
-    def get_last_issue_ts(self) -> int:
-        """
-            + 23-07-12
-            获取最近的一个发布时间
-        @return:
-        """
-        session = self.db.session
-        now_arrow: arrow.Arrow = arrow.utcnow()
-        # 加入动态修改 tb
-        StationForecastRealDataModel.set_split_tab_name(now_arrow)
-        query = session.query(func.max(StationForecastRealDataModel.issue_ts))
-        return query.scalar()
-
-    def get_dist_issue_ts_limit(self, limit_count: int = 10) -> List[int]:
-        """
-            + 23-07-12
-            根据 limit_count 获取 StationForecastRealDataModel 表中最近的 limit_count 个 issue_ts
-        @param limit_count:
-        @return:
-        """
-        session = self.db.session
-        now_arrow: arrow.Arrow = arrow.utcnow()
-        # 加入动态修改 tb
-        StationForecastRealDataModel.set_split_tab_name(now_arrow)
-        # TODO:[*] 23-07-12 此处未测试
-        # 参考2.0特性: https://docs.sqlalchemy.org/en/20/orm/quickstart.html#simple-select
-        # https://wiki.masantu.com/sqlalchemy-tutorial/#crud-2
-        stmt = (select(StationForecastRealDataModel.issue_ts).group_by(
-            StationForecastRealDataModel.issue_ts).order_by(
-            StationForecastRealDataModel.issue_ts).limit(limit_count))
-        query = session.scalar(stmt)
-
-        return query
-
-
-class StationBaseDao(BaseDao):
-    """
-        站点基础信息 dao (访问台风预报系统)
-    """
-
-    def get_dist_station_code(self, **kwargs) -> set:
-        """
-            获取不同的站点 code set
-        @param kwargs:
-        @return:
-        """
-        # 此处替换为使用 consul 获取动态服务地址并调用获取结果
-        # target_url: str = f'http://128.5.10.21:8000/station/station/all/list'
-        # res = requests.get(target_url)
-        # res_content: str = res.content.decode('utf-8')
-        res_content = get_remote_service('/station/all/list', {})
-
-        # [{'id': 4, 'code': 'SHW', 'name': '汕尾', 'lat': 22.7564, 'lon': 115.3572, 'is_abs': False, 'sort': -1,
-        #  'is_in_common_use': True}]
-        list_region_dict: List[Dict] = json.loads(res_content)
-        list_region: List[StationRegionSchema] = []
-        for region_dict in list_region_dict:
-            list_region.append(StationRegionSchema.parse_obj(region_dict))
-        # 针对code 进行去重操作
-        list_codes: List[str] = [station.code for station in list_region]
-        return set(list_codes)
-
-    def get_dist_station_list(self, **kwargs) -> List[Dict]:
-        """
-            + 23-11-17 获取所有站点基础信息字典集合
-        @param kwargs:
-        @return:
-        """
-        res_content = get_remote_service('/station/all/list', {})
-        return json.loads(res_content)
-
-    def get_dist_region(self, **kwargs) -> List[str]:
-        """
-            获取不同的行政区划 code
-        @param kwargs:
-        @return:
-        """
-
-    def get_target_astronomictide(self, code: str, start_ts: int, end_ts: int) -> List[AstronomicTideSchema]:
-        """
-            获取指定站点的天文潮
-            step1: 获取指定站点的 [start,end] 范围内的天文潮集合(间隔1h)
-        @param code: 站点
-        @param start_ts: 起始时间戳
-        @param end_ts: 结束时间戳
-        @return:
-        """
-        # target_url: str = f'http://128.5.10.21:8000/station/station/astronomictide/list'
-        start_arrow: arrow.Arrow = arrow.get(start_ts)
-        end_arrow: arrow.Arrow = arrow.get(end_ts)
-        start_dt_str: str = f"{start_arrow.format('YYYY-MM-DDTHH:mm:ss')}Z"
-        end_dt_str: str = f"{end_arrow.format('YYYY-MM-DDTHH:mm:ss')}Z"
-        # 注意时间格式 2023-07-31T16:00:00Z
-        # res = requests.get(target_url,
-        #                    data={'station_code': code, 'start_dt': start_dt_str, 'end_dt': end_dt_str})
-        # res = requests.get(target_url,
-        #                    params={'station_code': code, 'start_dt': start_dt_str, 'end_dt': end_dt_str})
-        # res_content: str = res.content.decode('utf-8')
-        # TODO:*] 23-11-17 加载指定站点的天文潮集合
-        res_content: str = get_remote_service('/station/astronomictide/list',
-                                              params={'station_code': code, 'start_dt': start_dt_str,
-                                                      'end_dt': end_dt_str})
-        # {'station_code': 'CGM', 'forecast_dt': '2023-07-31T17:00:00Z', 'surge': 441.0}
-        # 天文潮字典集合
-        list_tide_dict: List[Dict] = json.loads(res_content)
-        # 天文潮 schema 集合
-        list_tide: List[AstronomicTideSchema] = []
-        for tide_dict in list_tide_dict:
-            list_tide.append(AstronomicTideSchema.parse_obj(tide_dict))
-        return list_tide
-
-    def get_dist_station_tide_list(self, start_ts: int, end_ts: int) -> List[DistStationTideListSchema]:
-        """
-            + 23-08-16
-            获取所有站点 [start,end] 范围内的 天文潮+时间 集合
-        @param start_ts:
-        @param end_ts:
-        @return:
-        """
-        target_url: str = f'http://128.5.10.21:8000/station/station/dist/astronomictide/list'
-        start_arrow: arrow.Arrow = arrow.get(start_ts)
-        end_arrow: arrow.Arrow = arrow.get(end_ts)
-        start_dt_str: str = f"{start_arrow.format('YYYY-MM-DDTHH:mm:ss')}Z"
-        end_dt_str: str = f"{end_arrow.format('YYYY-MM-DDTHH:mm:ss')}Z"
-        # 注意时间格式 2023-07-31T16:00:00Z
-        # res = requests.get(target_url,
-        #                    data={'station_code': code, 'start_dt': start_dt_str, 'end_dt': end_dt_str})
-        # TODO:[*] 23-10-24 此接口在高频请求后总会出现无法返回的bug
-
-        # res = requests.get(target_url,
-        #                    params={'start_dt': start_dt_str, 'end_dt': end_dt_str})
-        # res_content: str = res.content.decode('utf-8')
-        # TODO:[*] 23-11-17 修改为通过服务发现调用接口
-        res_content: str = get_remote_service('/station/dist/astronomictide/list',
-                                              params={'start_dt': start_dt_str, 'end_dt': end_dt_str})
-        # {'station_code': 'CGM', 'forecast_dt': '2023-07-31T17:00:00Z', 'surge': 441.0}
-        # 天文潮字典集合
-        list_tide_dict: List[Dict] = json.loads(res_content)
-        list_tide: List[DistStationTideListSchema] = []
-        for temp in list_tide_dict:
-            list_tide.append(DistStationTideListSchema.parse_obj(temp))
-        return list_tide
-
-
-class AlertBaseDao(BaseDao):
-    def get_target_station_alert(self, station_code: str) -> List[Dict]:
-        """
-            获取指定站点的警戒潮位集合
-        @param station_code:
-        @return:
-        """
-        # target_url: str = f'http://128.5.10.21:8000/station/station/alert?station_code={station_code}'
-        # res = requests.get(target_url)
-        # res_content: str = res.content.decode('utf-8')
-        res_content: str = get_remote_service('/station/alert',
-                                              params={'station_code': station_code, })
-        list_region: List[Dict] = json.loads(res_content)
-
-        return list_region
-
-    def get_dist_station_alert(self) -> List[Dict]:
-        """
-            获取所有站点的警戒潮位集合
-        @return:
-        """
-        res_content: str = get_remote_service('/station/dist/alert',
-                                              params={})
-        list_region: List[Dict] = json.loads(res_content)
-
-        return list_region
-
-
-class StationMixInDao(StationBaseDao, StationSurgeDao):
-    def get_station_hourly_totalsurge(self, station_code: str, issue_ts: int, start_ts: int, end_ts: int, **kwargs) -> \
-            Optional[List[StationTotalSurgeSchema]]:
-        """
-            获取总潮位集合
-            [*] 获取
-        @param station_code:
-        @param issue_ts:
-        @param start_ts:
-        @param end_ts:
-        @param kwargs:
-        @return:
-        """
-        # TODO:[*] 23-08-13 目前出现的问题是 tide_list 与 surge_list 长度不一致
-
-        # step1: 分別获取憎水 与 天文潮 集合
-        # 每小时的增水集合
-        # [(81500, 0, 'HZO', 6.79, 'dbdbe2af', 1690819200, 1690804800, datetime.datetime(2023, 7, 31, 16, 0), datetime.datetime(2023, 7, 31, 12, 0))]
-        surge_list: Optional[List[StationForecastRealDataModel]] = self.get_station_hourly_surge_list(station_code,
-                                                                                                      issue_ts,
-                                                                                                      start_ts, end_ts)
-        # 每小时的天文潮位
-        # [station_code='HZO' forecast_dt='2023-07-31T16:00:00Z' surge=202.0]
-        tide_list = self.get_target_astronomictide(station_code, start_ts, end_ts)
-        # step2: 按照 station_code 与 forecast_dt 进行拼接
-        # 判断 tide_list 与 surge_list 长度是否相同
-        total_surge_list: Optional[List[StationTotalSurgeSchema]] = []
-        if len(tide_list) == len(surge_list):
-            for index, surge in enumerate(surge_list):
-                #
-                # 0 -(81500,
-                # 1 - 0,
-                # 2 - 'HZO',
-                # 3 - 6.79,
-                # 4 - 'dbdbe2af',
-                # 5 - 1690819200,
-                # 6 - 1690804800,
-                # datetime.datetime(2023, 7, 31, 16, 0),
-                # datetime.datetime(2023, 7, 31, 12, 0))
-                temp_surge = surge
-                temp_tide = tide_list[index]
-                # 合成的总潮位 shcema
-                temp_total_surge: StationTotalSurgeSchema = StationTotalSurgeSchema(station_code=temp_tide.station_code,
-                                                                                    forecast_dt=temp_tide.forecast_dt,
-                                                                                    forecast_ts=temp_surge[5],
-                                                                                    issue_ts=temp_surge[6],
-                                                                                    surge=temp_surge[3],
-                                                                                    tide=temp_tide.surge,
-                                                                                    total_surge=temp_surge[
-                                                                                                    3] + temp_tide.surge)
-                total_surge_list.append(temp_total_surge)
-        return total_surge_list
-
-    def get_dist_stations_surge_list(self, issue_ts: int, start_ts: int, end_ts: int,
-                                     **kwargs) -> Optional[List[DistStationSurgeListSchema]]:
-        """
-            获取所有站点 [start,end] 范围内的 增水集合
-        @param issue_ts:
-        @param start_ts:
-        @param end_ts:
-        @param kwargs:
-        @return:
-        """
-        dist_stations_totalsurge_list: Optional[List[DistStationSurgeListSchema]] = []
-        # TODO:[-] 23-08-14 此种方法效率较差，已弃用
-        # for code in station_codes:
-        #     temp_station_totalsurge_schema: Optional[
-        #         List[StationTotalSurgeSchema]] = self.get_station_hourly_totalsurge(code, issue_ts, start_ts, end_ts)
-        #     temp_dist_station_schema: DistStationTotalSurgeSchema = DistStationTotalSurgeSchema(station_code=code,
-        #                                                                                         station_total_schema=temp_station_totalsurge_schema)
-        #     dist_stations_totalsurge_list.append(temp_dist_station_schema)
-        dist_station_surge_res = self.get_dist_stations_hourly_surge_list(issue_ts, start_ts, end_ts)
-        for temp in dist_station_surge_res:
-            # ('DGG', '-1.86,...', '1690819200,...', 1690804800)
-            temp_code: str = temp[0]
-            temp_surge_str_list: List[str] = temp[1].split(',')
-            temp_surge_list: List[float] = []
-            # TODO:[*] 23-08-21 动态 时间戳 此处会有转换的bug
-            # ValueError: could not convert string to float:
-            for surge_str in temp_surge_str_list:
-                # ValueError: could not convert string to float: '-'
-                # 逻辑错了，应该改为 and
-                if surge_str != '' and surge_str != '-':
-                    temp_surge_list.append(float(surge_str))
-            temp_forecast_ts_str_list: List[str] = temp[2].split(',')
-            temp_forecast_ts_list: List[int] = []
-            for ts_str in temp_forecast_ts_str_list:
-                if ts_str != '' or ts_str != '-':
-                    temp_forecast_ts_list.append(int(ts_str))
-            temp_issue_ts: int = temp[3]
-            # print(temp)
-            station_surge_list_schema: StationSurgeListSchema = StationSurgeListSchema(
-                forecast_ts_list=temp_forecast_ts_list, surge_list=temp_surge_list)
-            dist_station_surge_list_schema: DistStationSurgeListSchema = DistStationSurgeListSchema(
-                station_code=temp_code, issue_ts=temp_issue_ts, surge_list_schema=station_surge_list_schema)
-            dist_stations_totalsurge_list.append(dist_station_surge_list_schema)
-
-        return dist_stations_totalsurge_list
+import json
+import asyncio
+import threading
+import requests
+from typing import List, Optional, Any, Dict
+
+from sqlalchemy import distinct, select, func, and_, text, bindparam
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.elements import TextClause
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import select, within_group, distinct
+import arrow
+import numpy as np
+from common.utils import get_remote_url, get_target_ts_year
+from config.store_config import StoreConfig, STORE_OPTIONS
+from models.station import StationForecastRealDataModel, StationSurgeSummaryModel, StationLatestSurgeModel
+from schema.station import StationRegionSchema
+from schema.station_surge import SurgeRealDataSchema, AstronomicTideSchema, StationTotalSurgeSchema, \
+    DistStationTotalSurgeSchema, StationSurgeListSchema, DistStationSurgeListSchema, DistStationTideListSchema, \
+    StationAstronomicTideResultSchema
+from dao.base import BaseDao
+from db.db_factory import run_db_in_threadpool
+from common.enums import CoverageTypeEnum, ForecastProductTypeEnum
+from util.consul_util import ConsulExtractClient
+from util.cache import TTLCache
+from util.tide_store import AstronomicTideStore
+from config.cache_config import CACHE_OPTIONS
+from config.http_config import HTTP_CLIENT_OPTIONS
+
+CONSUL_SERVICE_NAME = 'station-base'
+consul_client = ConsulExtractClient(CONSUL_SERVICE_NAME)
+
+# + 24-06-12 站点基础信息及警戒潮位等远程参考数据的进程内缓存
+STATION_BASE_CACHE_OPTIONS: Dict = CACHE_OPTIONS.get('STATION_BASE')
+station_base_cache = TTLCache(STATION_BASE_CACHE_OPTIONS.get('TTL'), STATION_BASE_CACHE_OPTIONS.get('STALE_TTL'))
+
+# + 24-06-16 本地天文潮存储
+TIDE_STORE_OPTIONS: Dict = STORE_OPTIONS.get('TIDE')
+tide_store = AstronomicTideStore(TIDE_STORE_OPTIONS.get('STORE_ROOT_PATH'))
+_tide_store_task: Optional[asyncio.Task] = None
+
+
+def get_remote_service(uri: str, params: dict):
+    return consul_client.get(uri, params=params)
+
+
+async def get_remote_service_async(uri: str, params: dict) -> str:
+    """
+        + 24-06-14 通过共享的异步 http 客户端调用远程服务
+    @param uri:
+    @param params:
+    @return:
+    """
+    return await consul_client.async_get(uri, params=params)
+
+
+def load_dist_station_list() -> List[Dict]:
+    """
+        + 24-06-12 从 station-base 服务加载所有站点基础信息字典集合
+    @return:
+    """
+    res_content = get_remote_service('/station/all/list', {})
+    return json.loads(res_content)
+
+
+def load_dist_station_alert() -> List[Dict]:
+    """
+        + 24-06-12 从 station-base 服务加载所有站点的警戒潮位集合
+    @return:
+    """
+    res_content: str = get_remote_service('/station/dist/alert', params={})
+    return json.loads(res_content)
+
+
+station_base_cache.register('dist_station_list', load_dist_station_list)
+station_base_cache.register('dist_station_alert', load_dist_station_alert)
+
+
+def start_station_base_cache():
+    """
+        + 24-06-12 启动参考数据缓存的后台刷新(fastapi startup)
+    @return:
+    """
+    station_base_cache.start_refresh(STATION_BASE_CACHE_OPTIONS.get('REFRESH_INTERVAL'))
+
+
+def stop_station_base_cache():
+    station_base_cache.stop_refresh()
+
+
+def to_tide_dt_str(ts: int) -> str:
+    """
+        + 24-06-16 时间戳转换为天文潮服务返回的时间格式(2023-07-31T16:00:00Z)
+    @param ts:
+    @return:
+    """
+    return f"{arrow.get(ts).format('YYYY-MM-DDTHH:mm:ss')}Z"
+
+
+async def fetch_dist_station_tide_list(start_ts: int, end_ts: int) -> List[DistStationTideListSchema]:
+    """
+        + 24-06-16 从 station-base 服务获取所有站点 [start,end] 范围内的 天文潮+时间 集合
+    @param start_ts:
+    @param end_ts:
+    @return:
+    """
+    # 注意时间格式 2023-07-31T16:00:00Z
+    # TODO:[*] 23-10-24 此接口在高频请求后总会出现无法返回的bug
+    # TODO:[-] 24-06-14 修改为通过共享的异步 http 客户端请求
+    res_content: str = await get_remote_service_async('/station/dist/astronomictide/list',
+                                                      params={'start_dt': to_tide_dt_str(start_ts),
+                                                              'end_dt': to_tide_dt_str(end_ts)})
+    # 天文潮字典集合
+    list_tide_dict: List[Dict] = json.loads(res_content)
+    list_tide: List[DistStationTideListSchema] = []
+    for temp in list_tide_dict:
+        list_tide.append(DistStationTideListSchema.parse_obj(temp))
+    return list_tide
+
+
+async def prefill_tide_store() -> bool:
+    """
+        + 24-06-16 批量拉取所有站点 [当前时刻-1d, 当前时刻+WINDOW_DAYS] 的逐时天文潮并重建本地存储
+    @return:
+    """
+    start_arrow: arrow.Arrow = arrow.utcnow().floor('hour').shift(days=-1)
+    end_arrow: arrow.Arrow = start_arrow.shift(days=TIDE_STORE_OPTIONS.get('WINDOW_DAYS') + 1)
+    hours: int = (end_arrow.int_timestamp - start_arrow.int_timestamp) // 3600 + 1
+    list_tide: List[DistStationTideListSchema] = await fetch_dist_station_tide_list(start_arrow.int_timestamp,
+                                                                                    end_arrow.int_timestamp)
+    dict_series: Dict = {temp.station_code: (temp.forecast_ts_list, temp.tide_list) for temp in list_tide}
+    if len(dict_series) == 0:
+        return False
+    await run_in_threadpool(tide_store.save, start_arrow.int_timestamp, hours, dict_series)
+    print(f'[-]重建本地天文潮存储:{start_arrow}~{end_arrow},共{len(dict_series)}个站点')
+    return True
+
+
+async def start_tide_store():
+    """
+        + 24-06-16 加载本地天文潮存储，并启动定时重建任务(fastapi startup)
+    @return:
+    """
+    global _tide_store_task
+    tide_store.load()
+
+    async def run():
+        while True:
+            try:
+                await prefill_tide_store()
+            except Exception as ex:
+                print(f'[!]重建本地天文潮存储出错:{ex.args}')
+            await asyncio.sleep(TIDE_STORE_OPTIONS.get('REFRESH_INTERVAL'))
+
+    if _tide_store_task is None:
+        _tide_store_task = asyncio.ensure_future(run())
+
+
+async def stop_tide_store():
+    global _tide_store_task
+    if _tide_store_task is not None:
+        _tide_store_task.cancel()
+    _tide_store_task = None
+
+
+# + 24-06-28 单站逐时增水查询的列(不使用 SELECT *)
+STATION_HOURLY_SURGE_COLUMNS: List[str] = ['station_code', 'forecast_dt', 'issue_dt', 'surge', 'forecast_ts',
+                                           'issue_ts']
+
+
+# + 24-06-30 分表是否已包含存储生成列 is_hourly(未执行 MIGRATE_SPLIT_TAB 的旧分表没有该列)
+REALDATA_HOURLY_COLUMN: str = 'is_hourly'
+REALDATA_HOURLY_EXPR: str = 'forecast_ts % 3600 = 0'
+_hourly_column_tabs: Dict[str, bool] = {}
+_hourly_column_lock = threading.Lock()
+
+
+def get_hourly_condition(session, tab_name: str) -> str:
+    """
+        + 24-06-30 获取指定分表的整点过滤条件
+        分表包含 is_hourly 列时使用 is_hourly=1，否则回退为 forecast_ts % 3600 = 0
+        检查结果按分表在进程内缓存(分表迁移后需重启服务才会改用 is_hourly)
+    @param session:
+    @param tab_name:
+    @return:
+    """
+    has_column: Optional[bool] = _hourly_column_tabs.get(tab_name)
+    if has_column is None:
+        count: int = session.execute(text("SELECT COUNT(1) FROM information_schema.columns "
+                                          "WHERE table_schema=DATABASE() AND table_name=:tab_name "
+                                          "AND column_name=:column_name"),
+                                     {'tab_name': tab_name, 'column_name': REALDATA_HOURLY_COLUMN}).scalar()
+        has_column = count > 0
+        with _hourly_column_lock:
+            _hourly_column_tabs[tab_name] = has_column
+        if not has_column:
+            print(f'[!]分表{tab_name}缺少{REALDATA_HOURLY_COLUMN}列，整点过滤回退为:{REALDATA_HOURLY_EXPR}')
+    return f'{REALDATA_HOURLY_COLUMN}=1' if has_column else REALDATA_HOURLY_EXPR
+
+
+def get_station_hourly_surge_sql(session, start_ts: int, end_ts: int) -> TextClause:
+    """
+        + 24-06-28 获取单站整点增水的查询语句(绑定参数: issue_ts,station_code,start_ts,end_ts,limit_count)
+        若起止时间跨年则按年拼接两张分表，分表名由时间戳生成
+        - 24-06-30 整点条件按分表是否包含 is_hourly 列确定(见 get_hourly_condition)
+    @param session:
+    @param start_ts:
+    @param end_ts:
+    @return:
+    """
+    tab_names: List[str] = sorted({f'station_realdata_{get_target_ts_year(start_ts)}',
+                                   f'station_realdata_{get_target_ts_year(end_ts)}'})
+    columns_str: str = ','.join(STATION_HOURLY_SURGE_COLUMNS)
+    sub_sql_list: List[str] = [
+        f"SELECT {columns_str} FROM {tab_name} WHERE issue_ts=:issue_ts AND station_code=:station_code "
+        f"AND forecast_ts>=:start_ts AND forecast_ts<=:end_ts AND {get_hourly_condition(session, tab_name)}"
+        for tab_name in tab_names]
+    return text(' UNION ALL '.join(sub_sql_list) + ' ORDER BY forecast_ts LIMIT :limit_count')
+
+
+def to_dist_station_surge_list(rows: List[Any]) -> List[DistStationSurgeListSchema]:
+    """
+        + 24-06-10 将按 (station_code, forecast_ts) 排序的逐行数据通过 numpy 按站点切分为数组
+    @param rows: [(station_code, forecast_ts, surge, issue_ts)]
+    @return:
+    """
+    list_res: List[DistStationSurgeListSchema] = []
+    if len(rows) == 0:
+        return list_res
+    codes, forecast_ts_arr, surge_arr, issue_ts_arr = (np.asarray(col) for col in zip(*rows))
+    forecast_ts_arr = forecast_ts_arr.astype(np.int64)
+    surge_arr = surge_arr.astype(np.float64)
+    # 每个站点在有序结果中的起始位置
+    split_index: np.ndarray = np.flatnonzero(codes[1:] != codes[:-1]) + 1
+    starts: List[int] = [0] + split_index.tolist()
+    ends: List[int] = split_index.tolist() + [len(codes)]
+    for start, end in zip(starts, ends):
+        # 去掉原始数据中的 nan
+        valid = ~np.isnan(surge_arr[start:end])
+        surge_list_schema: StationSurgeListSchema = StationSurgeListSchema.construct(
+            forecast_ts_list=forecast_ts_arr[start:end][valid].tolist(),
+            surge_list=surge_arr[start:end][valid].tolist())
+        list_res.append(DistStationSurgeListSchema.construct(station_code=str(codes[start]),
+                                                             issue_ts=int(issue_ts_arr[start]),
+                                                             surge_list_schema=surge_list_schema))
+    return list_res
+
+
+class StationSurgeDao(BaseDao):
+    def get_station_last_surge(self, **kwargs) -> Optional[List[SurgeRealDataSchema]]:
+        """
+            获取各个站点最后时刻的潮位数据及发布时间
+            TODO:[-] 24-06-18 读取入库时更新的站点最新状态表(station_latest，每个站点一行)，
+                              不再对整年的分表进行 group by + max；station_latest 无数据时再查询分表
+        @param kwargs:
+        @return:
+        """
+        session = self.db.session
+        latest_list: List[StationLatestSurgeModel] = session.scalars(select(StationLatestSurgeModel)).all()
+        if len(latest_list) > 0:
+            return [SurgeRealDataSchema.from_orm(temp) for temp in latest_list]
+
+        now_arrow: arrow.Arrow = arrow.utcnow()
+        # TODO:[-] 24-06-07 根据时间获取对应分表的 orm 实体，不再修改全局 __table__.name
+        tab_model = StationForecastRealDataModel.get_split_model(now_arrow)
+        # 执行查询操作
+        subquery = session.query(
+            tab_model.station_code,
+            func.max(tab_model.forecast_dt).label('min_forecast')
+        ).group_by(tab_model.station_code).subquery()
+
+        query = session.query(
+            tab_model.station_code.label('station_code'),
+            tab_model.forecast_dt.label('forecast_dt'),
+            tab_model.forecast_ts.label('forecast_ts'),
+            tab_model.issue_ts.label('issue_ts'),
+            tab_model.issue_dt.label('issue_dt'),
+            tab_model.surge.label('surge')
+        ).join(
+            subquery,
+            and_(
+                tab_model.station_code == subquery.c.station_code,
+                tab_model.forecast_dt == subquery.c.min_forecast
+            )
+        )
+
+        result = query.all()
+        schema_list: List[SurgeRealDataSchema] = [
+            SurgeRealDataSchema(station_code=temp[0], forecast_dt=temp[1], forecast_ts=temp[2], issue_ts=temp[3],
+                                issue_dt=temp[4], surge=temp[5]) for temp in result]
+        return schema_list
+
+    def get_station_max_surge_byissuets(self, issue_ts: int, **kwargs) -> Optional[List[Dict]]:
+        """
+            + TODO:[*] 23-07-12
+              获取所有站点的72小时内的最大增水(issue_ts)
+              根据 发布时间获取该发布时间的 max surge集合
+            TODO:[-] 24-06-17 优先读取入库时生成的汇总表(station_surge_summary)，汇总表中无该 issue 时再查询分表
+        @param issue_ts:
+        @param kwargs:
+        @return:
+        """
+        session = self.db.session
+        summary_stmt = select(StationSurgeSummaryModel.station_code, StationSurgeSummaryModel.max_surge).where(
+            StationSurgeSummaryModel.issue_ts == issue_ts)
+        summary_list: List[Dict] = [{'code': row[0], 'surge': round(row[1], 2)} for row in
+                                    session.execute(summary_stmt)]
+        if len(summary_list) > 0:
+            return summary_list
+        now_arrow: arrow.Arrow = arrow.get(issue_ts)
+        # TODO:[-] 24-06-07 根据时间获取对应分表的 orm 实体，不再修改全局 __table__.name
+        tab_model = StationForecastRealDataModel.get_split_model(now_arrow)
+        #
+        #    SELECT MAX(surge),station_code
+        #    FROM station_realdata_2023
+        #    WHERE issue_ts=1687953600
+        #    GROUP BY station_code
+        # -----------
+        # SELECT station_realdata_2023.station_code, max(station_realdata_2023.surge) AS max_1
+        # FROM station_realdata_2023
+        # WHERE station_realdata_2023.issue_ts = :issue_ts_1 GROUP BY station_realdata_2023.station_code
+        # surge_max_cls = aliased(func.max(StationForecastRealDataModel.surge), name='surge_max')
+        stmt = select(tab_model.station_code, func.max(tab_model.surge)).where(
+            tab_model.issue_ts == issue_ts).group_by(tab_model.station_code)
+        # stmt = select(StationForecastRealDataModel.station_code, StationForecastRealDataModel.surge).where(
+        #     StationForecastRealDataModel.issue_ts == issue_ts).group_by(StationForecastRealDataModel.station_code)
+        # stmt = select(StationForecastRealDataModel.station_code, StationForecastRealDataModel.surge).where(
+        #     StationForecastRealDataModel.issue_ts == issue_ts)
+        # query = session.execute(stmt)
+        # # ERROR: sqlalchemy.exc.ResourceClosedError: This result object is closed.
+        # res = query.scalars().all()
+        # 只有 staiton_code
+        # 以下两种写法一致
+        # res = session.execute(stmt).scalars().all()
+        # res = session.scalars(stmt).all()
+        res = session.execute(stmt)
+        # surge 保留两位有效数字
+        res_list: List[Dict] = [{'code': row[0], 'surge': round(row[1], 2)} for row in res]
+        # for temp in res:
+        #     print(temp)
+        return res_list
+        pass
+
+    def get_station_surge_list(self, station_code: str, issue_ts: int, start_ts: int, end_ts: int, **kwargs) -> \
+            Optional[List[StationForecastRealDataModel]]:
+        """
+            根据 code 与 发布时间 issue_ts 获取制定时间范围内的 start_ts end_ts 潮位预报数据
+        @param station_code:
+        @param issue_ts:
+        @param start_ts:
+        @param end_ts:
+        @param kwargs:
+        @return:
+        """
+        session = self.db.session
+        issue_arrow: arrow.Arrow = arrow.get(issue_ts)
+        # TODO:[-] 24-06-07 根据时间获取对应分表的 orm 实体，不再修改全局 __table__.name
+        tab_model = StationForecastRealDataModel.get_split_model(issue_arrow)
+        query = session.query(tab_model).filter(tab_model.issue_ts == issue_ts,
+                                                tab_model.station_code == station_code).filter(
+            tab_model.forecast_ts >= start_ts, tab_model.forecast_ts <= end_ts)
+        res = query.all()
+        return res
+
+    def get_stations_hourly_surge_list(self, codes: List[str], issue_ts: int, start_ts: int, end_ts: int,
+                                       **kwargs) -> List[DistStationSurgeListSchema]:
+        """
+            獲取指定 codes 的逐时增水集合
+            TODO:[-] 24-06-09 由逐站点查询(N+1)修改为一次 IN (...) 查询，按 station_code 分组后返回
+        @param codes: 站点 code 集合
+        @param issue_ts:
+        @param start_ts:
+        @param end_ts:
+        @param kwargs:
+        @return: [{
+            'station_code',
+            'issue_ts',
+            'surge_list_schema': {'forecast_ts_list', 'surge_list'}
+        }]
+        """
+        list_res: List[DistStationSurgeListSchema] = []
+        if len(codes) == 0:
+            return list_res
+        session = self.db.session
+        # 若跨年则按年拼接多张分表
+        tab_names: List[str] = sorted({f'station_realdata_{get_target_ts_year(start_ts)}',
+                                       f'station_realdata_{get_target_ts_year(end_ts)}'})
+        sub_sql_list: List[str] = [
+            f"SELECT station_code,forecast_ts,surge,issue_ts FROM {tab_name} WHERE issue_ts=:issue_ts "
+            f"AND station_code IN :codes AND forecast_ts>=:start_ts AND forecast_ts<=:end_ts "
+            f"AND {get_hourly_condition(session, tab_name)}"
+            for tab_name in tab_names]
+        sql_str = text(' UNION ALL '.join(sub_sql_list) + ' ORDER BY station_code,forecast_ts').bindparams(
+            bindparam('codes', expanding=True))
+        rows = session.execute(sql_str, {'issue_ts': issue_ts, 'codes': list(codes), 'start_ts': start_ts,
+                                         'end_ts': end_ts}).fetchall()
+        list_res = to_dist_station_surge_list(rows)
+        return list_res
+
+    def get_station_hourly_surge_list(self, station_code: str, issue_ts: int, start_ts: int, end_ts: int, **kwargs) -> \
+            Optional[List[StationForecastRealDataModel]]:
+        """
+            获取 站点指定时间范围内的整点数据
+            [-] 23-08-14 改善通过 group_by + group_contact 的方式改善了效率
+            TODO:[-] 23-12-21 加入了按照起止时间判断是否跨年，需要分表读取
+        @param station_code:
+        @param issue_ts:
+        @param start_ts:
+        @param end_ts:
+        @param kwargs:
+        @return:
+        """
+
+        # 获取整点的查询语句
+        # """
+        #     SELECT *
+        #     FROM station_realdata_2023
+        #     WHERE issue_ts=1687953600 AND station_code='BHI' AND DATE_FORMAT(forecast_dt,'%i:%s')='00:00'
+        #     ORDER BY issue_ts
+        #     LIMIT 72
+        # """
+        # TODO:[-] 23-08-14 此处需要修改为动态获取库表名称
+        # TODO:[-] 23-12-21 注意此处若涉及到跨年的情况，需要跨表查询(按年拼接两张分表)
+        # TODO:[-] 24-06-08 DATE_FORMAT(forecast_dt,'%i:%s')='00:00' 无法使用索引，
+        #                   修改为使用存储生成列 is_hourly(forecast_ts % 3600 = 0)，
+        #                   配合复合索引 (issue_ts, station_code, forecast_ts) 进行范围查询
+        # TODO:[-] 24-06-28 改为绑定参数 + 显式列(不再 SELECT *)，按 forecast_ts 排序
+        session = self.db.session
+        limit_count: int = 168
+        sql_str = get_station_hourly_surge_sql(session, start_ts, end_ts)
+        """sql查询语句"""
+        res = session.execute(sql_str, {'issue_ts': issue_ts, 'station_code': station_code, 'start_ts': start_ts,
+                                        'end_ts': end_ts, 'limit_count': limit_count})
+        res = res.fetchall()
+        return res
+
+    def get_dist_stations_hourly_surge_list(self, issue_ts: int, start_ts: int, end_ts: int, **kwargs) -> List[Any]:
+        """
+            获取 站点指定时间范围内的整点数据
+            [-] 23-08-14 改善通过 group_by + group_contact 的方式改善了效率
+            TODO:[-] 23-12-21 加入了跨表查询的查询逻辑
+            TODO:[-] 24-06-10 去掉 group_concat(受 group_concat_max_len 截断且顺序无法保证)，
+                              修改为返回按 (station_code, forecast_ts) 排序的逐行数据
+        @param issue_ts:
+        @param start_ts:
+        @param end_ts:
+        @param kwargs:
+        @return:[(
+            'station_code',
+            'forecast_ts',
+            'surge',
+            'issue_ts'
+        )]
+        """
+        session = self.db.session
+        # TODO:[-] 23-08-14 暂时去掉 整点的条件，因为增水结果均为整点数据
+        # 若跨年则按年拼接多张分表
+        tab_names: List[str] = sorted({f'station_realdata_{get_target_ts_year(start_ts)}',
+                                       f'station_realdata_{get_target_ts_year(end_ts)}'})
+        sub_sql_list: List[str] = [
+            f"SELECT station_code,forecast_ts,surge,issue_ts FROM {tab_name} WHERE issue_ts=:issue_ts "
+            f"AND forecast_ts>=:start_ts AND forecast_ts<=:end_ts"
+            for tab_name in tab_names]
+        sql_str = text(' UNION ALL '.join(sub_sql_list) + ' ORDER BY station_code,forecast_ts')
+        res = session.execute(sql_str, {'issue_ts': issue_ts, 'start_ts': start_ts, 'end_ts': end_ts})
+        res = res.fetchall()
+        return res
+
+    def get_station_last_issue_ts(self, station_code: str) -> int:
+        session = self.db.session
+        now_arrow: arrow.Arrow = arrow.utcnow()
+        # TODO:[-] 24-06-07 根据时间获取对应分表的 orm 实体，不再修改全局 __table__.name
+        tab_model = StationForecastRealDataModel.get_split_model(now_arrow)
+        query = session.query(func.max(tab_model.issue_ts)).filter(
+            tab_model.station_code == station_code)
+        return query.scalar()
+
+    def get_last_issue_ts(self) -> int:
+        """
+            + 23-07-12
+            获取最近的一个发布时间
+        @return:
+        """
+        session = self.db.session
+        now_arrow: arrow.Arrow = arrow.utcnow()
+        # TODO:[-] 24-06-07 根据时间获取对应分表的 orm 实体，不再修改全局 __table__.name
+        tab_model = StationForecastRealDataModel.get_split_model(now_arrow)
+        query = session.query(func.max(tab_model.issue_ts))
+        return query.scalar()
+
+    def get_dist_issue_ts_limit(self, limit_count: int = 10) -> List[int]:
+        """
+            + 23-07-12
+            根据 limit_count 获取 StationForecastRealDataModel 表中最近的 limit_count 个 issue_ts
+        @param limit_count:
+        @return:
+        """
+        session = self.db.session
+        now_arrow: arrow.Arrow = arrow.utcnow()
+        # TODO:[-] 24-06-07 根据时间获取对应分表的 orm 实体，不再修改全局 __table__.name
+        tab_model = StationForecastRealDataModel.get_split_model(now_arrow)
+        # TODO:[*] 23-07-12 此处未测试
+        # 参考2.0特性: https://docs.sqlalchemy.org/en/20/orm/quickstart.html#simple-select
+        # https://wiki.masantu.com/sqlalchemy-tutorial/#crud-2
+        stmt = (select(tab_model.issue_ts).group_by(
+            tab_model.issue_ts).order_by(
+            tab_model.issue_ts).limit(limit_count))
+        query = session.scalar(stmt)
+
+        return query
+
+
+class StationBaseDao(BaseDao):
+    """
+        站点基础信息 dao (访问台风预报系统)
+    """
+
+    async def get_dist_station_code(self, **kwargs) -> set:
+        """
+            获取不同的站点 code set
+        @param kwargs:
+        @return:
+        """
+        # 此处替换为使用 consul 获取动态服务地址并调用获取结果
+        # target_url: str = f'http://128.5.10.21:8000/station/station/all/list'
+        # res = requests.get(target_url)
+        # res_content: str = res.content.decode('utf-8')
+        # TODO:[-] 24-06-12 修改为读取进程内缓存
+        # [{'id': 4, 'code': 'SHW', 'name': '汕尾', 'lat': 22.7564, 'lon': 115.3572, 'is_abs': False, 'sort': -1,
+        #  'is_in_common_use': True}]
+        list_region_dict: List[Dict] = await self.get_dist_station_list()
+        list_region: List[StationRegionSchema] = []
+        for region_dict in list_region_dict:
+            list_region.append(StationRegionSchema.parse_obj(region_dict))
+        # 针对code 进行去重操作
+        list_codes: List[str] = [station.code for station in list_region]
+        return set(list_codes)
+
+    async def get_dist_station_list(self, **kwargs) -> List[Dict]:
+        """
+            + 23-11-17 获取所有站点基础信息字典集合
+            TODO:[-] 24-06-12 修改为读取进程内缓存(station_base_cache)
+        @param kwargs:
+        @return:
+        """
+        return await station_base_cache.aget('dist_station_list')
+
+    def get_dist_region(self, **kwargs) -> List[str]:
+        """
+            获取不同的行政区划 code
+        @param kwargs:
+        @return:
+        """
+
+    async def get_target_astronomictide(self, code: str, start_ts: int, end_ts: int) -> List[AstronomicTideSchema]:
+        """
+            获取指定站点的天文潮
+            step1: 获取指定站点的 [start,end] 范围内的天文潮集合(间隔1h)
+        @param code: 站点
+        @param start_ts: 起始时间戳
+        @param end_ts: 结束时间戳
+        @return:
+        """
+        # target_url: str = f'http://128.5.10.21:8000/station/station/astronomictide/list'
+        start_arrow: arrow.Arrow = arrow.get(start_ts)
+        end_arrow: arrow.Arrow = arrow.get(end_ts)
+        start_dt_str: str = f"{start_arrow.format('YYYY-MM-DDTHH:mm:ss')}Z"
+        end_dt_str: str = f"{end_arrow.format('YYYY-MM-DDTHH:mm:ss')}Z"
+        # 注意时间格式 2023-07-31T16:00:00Z
+        # res = requests.get(target_url,
+        #                    data={'station_code': code, 'start_dt': start_dt_str, 'end_dt': end_dt_str})
+        # res = requests.get(target_url,
+        #                    params={'station_code': code, 'start_dt': start_dt_str, 'end_dt': end_dt_str})
+        # res_content: str = res.content.decode('utf-8')
+        # TODO:[-] 24-06-16 优先读取本地天文潮存储，未覆盖的时间范围再请求远程服务
+        local_res = tide_store.get_station(code, start_ts, end_ts)
+        if local_res is not None:
+            ts_arr, tide_arr = local_res
+            return [AstronomicTideSchema(station_code=code, forecast_dt=to_tide_dt_str(ts), surge=tide)
+                    for ts, tide in zip(ts_arr.tolist(), tide_arr.tolist())]
+        # TODO:*] 23-11-17 加载指定站点的天文潮集合
+        # TODO:[-] 24-06-14 修改为通过共享的异步 http 客户端请求
+        res_content: str = await get_remote_service_async('/station/astronomictide/list',
+                                                          params={'station_code': code, 'start_dt': start_dt_str,
+                                                                  'end_dt': end_dt_str})
+        # {'station_code': 'CGM', 'forecast_dt': '2023-07-31T17:00:00Z', 'surge': 441.0}
+        # 天文潮字典集合
+        list_tide_dict: List[Dict] = json.loads(res_content)
+        # 天文潮 schema 集合
+        list_tide: List[AstronomicTideSchema] = []
+        for tide_dict in list_tide_dict:
+            list_tide.append(AstronomicTideSchema.parse_obj(tide_dict))
+        return list_tide
+
+    async def get_stations_astronomictide(self, codes: List[str], start_ts: int, end_ts: int,
+                                          concurrency: int = None, timeout: float = None) -> \
+            List[StationAstronomicTideResultSchema]:
+        """
+            + 24-06-15 并发获取多个站点的天文潮
+            同时进行的请求数不超过 concurrency，单个站点超时或出错时只记录该站点的 error，不影响其他站点
+        @param codes: 站点 code 集合
+        @param start_ts: 起始时间戳
+        @param end_ts: 结束时间戳
+        @param concurrency: 并发上限，默认为 HTTP_CLIENT_OPTIONS['FAN_OUT']['CONCURRENCY']
+        @param timeout: 单个站点的超时时间(s)，默认为 HTTP_CLIENT_OPTIONS['FAN_OUT']['TIMEOUT']
+        @return: 与 codes 顺序一致的结果集合
+        """
+        fan_out_options: Dict = HTTP_CLIENT_OPTIONS.get('FAN_OUT')
+        if concurrency is None:
+            concurrency = fan_out_options.get('CONCURRENCY')
+        if timeout is None:
+            timeout = fan_out_options.get('TIMEOUT')
+        semaphore = asyncio.Semaphore(max(concurrency, 1))
+
+        async def fetch(code: str) -> StationAstronomicTideResultSchema:
+            async with semaphore:
+                try:
+                    tide_list: List[AstronomicTideSchema] = await asyncio.wait_for(
+                        self.get_target_astronomictide(code, start_ts, end_ts), timeout)
+                    return StationAstronomicTideResultSchema(station_code=code, tide_list=tide_list)
+                except asyncio.TimeoutError:
+                    return StationAstronomicTideResultSchema(station_code=code, error=f'timeout after {timeout}s')
+                except Exception as ex:
+                    return StationAstronomicTideResultSchema(station_code=code, error=str(ex))
+
+        return list(await asyncio.gather(*[fetch(code) for code in codes]))
+
+    async def get_dist_station_tide_list(self, start_ts: int, end_ts: int) -> List[DistStationTideListSchema]:
+        """
+            + 23-08-16
+            获取所有站点 [start,end] 范围内的 天文潮+时间 集合
+            TODO:[-] 24-06-16 优先读取本地天文潮存储，未覆盖的时间范围再请求远程服务
+        @param start_ts:
+        @param end_ts:
+        @return:
+        """
+        dict_local = tide_store.get_dist(start_ts, end_ts)
+        if dict_local is not None:
+            return [DistStationTideListSchema.construct(station_code=code, forecast_ts_list=ts_arr.tolist(),
+                                                        tide_list=tide_arr.tolist())
+                    for code, (ts_arr, tide_arr) in dict_local.items()]
+        return await fetch_dist_station_tide_list(start_ts, end_ts)
+
+
+class AlertBaseDao(BaseDao):
+    async def get_target_station_alert(self, station_code: str) -> List[Dict]:
+        """
+            获取指定站点的警戒潮位集合
+            TODO:[-] 24-06-12 修改为读取进程内缓存(station_base_cache)
+        @param station_code:
+        @return:
+        """
+        # target_url: str = f'http://128.5.10.21:8000/station/station/alert?station_code={station_code}'
+        # res = requests.get(target_url)
+        # res_content: str = res.content.decode('utf-8')
+
+        def load_station_alert() -> List[Dict]:
+            res_content: str = get_remote_service('/station/alert',
+                                                  params={'station_code': station_code, })
+            return json.loads(res_content)
+
+        list_region: List[Dict] = await station_base_cache.aget(f'station_alert:{station_code}', load_station_alert)
+
+        return list_region
+
+    async def get_dist_station_alert(self) -> List[Dict]:
+        """
+            获取所有站点的警戒潮位集合
+            TODO:[-] 24-06-12 修改为读取进程内缓存(station_base_cache)
+        @return:
+        """
+        list_region: List[Dict] = await station_base_cache.aget('dist_station_alert')
+
+        return list_region
+
+
+class StationMixInDao(StationBaseDao, StationSurgeDao):
+    async def get_station_hourly_totalsurge(self, station_code: str, issue_ts: int, start_ts: int, end_ts: int,
+                                            **kwargs) -> Optional[List[StationTotalSurgeSchema]]:
+        """
+            获取总潮位集合
+            [*] 获取
+            TODO:[-] 24-06-14 增水(mysql)与天文潮(远程服务)并发获取
+        @param station_code:
+        @param issue_ts:
+        @param start_ts:
+        @param end_ts:
+        @param kwargs:
+        @return:
+        """
+        # TODO:[*] 23-08-13 目前出现的问题是 tide_list 与 surge_list 长度不一致
+
+        # step1: 分別获取憎水 与 天文潮 集合
+        # 每小时的增水集合
+        # [(81500, 0, 'HZO', 6.79, 'dbdbe2af', 1690819200, 1690804800, datetime.datetime(2023, 7, 31, 16, 0), datetime.datetime(2023, 7, 31, 12, 0))]
+        # 每小时的天文潮位
+        # [station_code='HZO' forecast_dt='2023-07-31T16:00:00Z' surge=202.0]
+        surge_list, tide_list = await asyncio.gather(
+            run_db_in_threadpool(self.db.session, self.get_station_hourly_surge_list, station_code, issue_ts, start_ts,
+                                 end_ts),
+            self.get_target_astronomictide(station_code, start_ts, end_ts))
+        # step2: 按照 station_code 与 forecast_dt 进行拼接
+        # 判断 tide_list 与 surge_list 长度是否相同
+        total_surge_list: Optional[List[StationTotalSurgeSchema]] = []
+        if len(tide_list) == len(surge_list):
+            for index, surge in enumerate(surge_list):
+                # TODO:[-] 24-06-28 按列名读取(station_code,forecast_dt,issue_dt,surge,forecast_ts,issue_ts)
+                temp_surge = surge
+                temp_tide = tide_list[index]
+                # 合成的总潮位 shcema
+                temp_total_surge: StationTotalSurgeSchema = StationTotalSurgeSchema(station_code=temp_tide.station_code,
+                                                                                    forecast_dt=temp_tide.forecast_dt,
+                                                                                    forecast_ts=temp_surge.forecast_ts,
+                                                                                    issue_ts=temp_surge.issue_ts,
+                                                                                    surge=temp_surge.surge,
+                                                                                    tide=temp_tide.surge,
+                                                                                    total_surge=temp_surge.surge + temp_tide.surge)
+                total_surge_list.append(temp_total_surge)
+        return total_surge_list
+
+    def get_dist_stations_surge_list(self, issue_ts: int, start_ts: int, end_ts: int,
+                                     **kwargs) -> Optional[List[DistStationSurgeListSchema]]:
+        """
+            获取所有站点 [start,end] 范围内的 增水集合
+        @param issue_ts:
+        @param start_ts:
+        @param end_ts:
+        @param kwargs:
+        @return:
+        """
+        dist_stations_totalsurge_list: Optional[List[DistStationSurgeListSchema]] = []
+        # TODO:[-] 23-08-14 此种方法效率较差，已弃用
+        # for code in station_codes:
+        #     temp_station_totalsurge_schema: Optional[
+        #         List[StationTotalSurgeSchema]] = self.get_station_hourly_totalsurge(code, issue_ts, start_ts, end_ts)
+        #     temp_dist_station_schema: DistStationTotalSurgeSchema = DistStationTotalSurgeSchema(station_code=code,
+        #                                                                                         station_total_schema=temp_station_totalsurge_schema)
+        #     dist_stations_totalsurge_list.append(temp_dist_station_schema)
+        # TODO:[-] 24-06-10 不再拆分 group_concat 拼接的字符串，直接由有序的逐行数据通过 numpy 转换为各站点的数组
+        dist_station_surge_res = self.get_dist_stations_hourly_surge_list(issue_ts, start_ts, end_ts)
+        dist_stations_totalsurge_list = to_dist_station_surge_list(dist_station_surge_res)
+        return dist_stations_totalsurge_list
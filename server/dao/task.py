@@ -0,0 +1,85 @@
+import asyncio
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select, func
+from fastapi.concurrency import run_in_threadpool
+
+from models.task import IssueVersionModel
+from dao.base import BaseDao
+from util.response_cache import ResponseCache
+from config.cache_config import CACHE_OPTIONS
+
+# + 24-06-19 已发布预报产品的响应缓存
+RESPONSE_CACHE_OPTIONS: Dict = CACHE_OPTIONS.get('RESPONSE')
+response_cache = ResponseCache(RESPONSE_CACHE_OPTIONS.get('MAX_ENTRIES'), RESPONSE_CACHE_OPTIONS.get('MAX_BYTES'))
+_issue_version_task: Optional[asyncio.Task] = None
+
+
+class IssueVersionDao(BaseDao):
+
+    def get_max_version_ts(self) -> int:
+        """
+            + 24-06-19 获取最近一次入库的时间戳
+        @return:
+        """
+        session = self.db.session
+        max_version_ts: Optional[int] = session.execute(select(func.max(IssueVersionModel.version_ts))).scalar()
+        return max_version_ts if max_version_ts is not None else 0
+
+    def get_changed_list(self, since_ts: int) -> List[Tuple[int, int]]:
+        """
+            + 24-06-19 获取 version_ts >= since_ts 的发布时次
+        @param since_ts:
+        @return: [(issue_ts, version_ts)]
+        """
+        session = self.db.session
+        stmt = select(IssueVersionModel.issue_ts, IssueVersionModel.version_ts).where(
+            IssueVersionModel.version_ts >= since_ts)
+        return [(row[0], row[1]) for row in session.execute(stmt).fetchall()]
+
+
+async def start_issue_version_watch():
+    """
+        + 24-06-19 定时轮询 issue_versions 表，后台重新入库(覆盖)某个 issue 后使其响应缓存失效(fastapi startup)
+        - 24-06-30 同一 issue 的 version_ts 严格递增(后台写入时取 max(原版本+1, 当前时间))，
+                   记录已处理的 {issue_ts: version_ts}，版本大于已记录版本(或新出现的 issue)时使缓存失效;
+                   按 version_ts >= 最大版本 - VERSION_LOOKBACK 查询，避免超前的版本或晚提交的入库被遗漏
+    @return:
+    """
+    global _issue_version_task
+    lookback: int = RESPONSE_CACHE_OPTIONS.get('VERSION_LOOKBACK')
+
+    async def run():
+        since_ts: Optional[int] = None
+        # {issue_ts: version_ts}
+        known: Dict[int, int] = {}
+        while True:
+            try:
+                if since_ts is None:
+                    # 启动时缓存为空，只记录当前的版本
+                    max_version_ts: int = await run_in_threadpool(IssueVersionDao().get_max_version_ts)
+                    since_ts = max_version_ts - lookback
+                    known = dict(await run_in_threadpool(IssueVersionDao().get_changed_list, since_ts))
+                else:
+                    changed: List[Tuple[int, int]] = await run_in_threadpool(
+                        IssueVersionDao().get_changed_list, since_ts)
+                    for issue_ts, version_ts in changed:
+                        if version_ts > known.get(issue_ts, -1):
+                            count: int = response_cache.invalidate_issue(issue_ts)
+                            print(f'[-]issue:{issue_ts}重新入库，使{count}条响应缓存失效')
+                    if len(changed) > 0:
+                        since_ts = max(since_ts, max(version_ts for _, version_ts in changed) - lookback)
+                        known = {issue_ts: version_ts for issue_ts, version_ts in changed if version_ts >= since_ts}
+            except Exception as ex:
+                print(f'[!]轮询issue_versions出错:{ex.args}')
+            await asyncio.sleep(RESPONSE_CACHE_OPTIONS.get('VERSION_POLL_INTERVAL'))
+
+    if _issue_version_task is None:
+        _issue_version_task = asyncio.ensure_future(run())
+
+
+async def stop_issue_version_watch():
+    global _issue_version_task
+    if _issue_version_task is not None:
+        _issue_version_task.cancel()
+    _issue_version_task = None
@@ -1,72 +1,216 @@
-import pathlib
-from typing import List
-import xarray as xar
-import numpy as np
-import pandas as pd
-import arrow
-from numpy import nan
-
-from config.store_config import STORE_OPTIONS
-from dao.base import BaseDao
-from models.coverage import GeoCoverageFileModel
-from schema.coverage import WindVectorSchema
-
-
-class BaseVectorDao(BaseDao):
-    def __init__(self, coverage_file: GeoCoverageFileModel):
-        """
-
-        @param coverage_file:
-        """
-
-        # 矢量待读取的栅格文件(nc)
-        super(BaseVectorDao, self).__init__()
-        self.coverage_file = coverage_file
-        pass
-
-    def get_readfile_path(self) -> str:
-        root_path: str = STORE_OPTIONS.get('NWP').get('STORE_ROOT_PATH')
-        readfile_path: str = f'{root_path}/{self.coverage_file.relative_path}/{self.coverage_file.file_name}'
-        return readfile_path
-
-
-class NWPVectorDao(BaseVectorDao):
-    def read_forecast_list(self, lat: float, lon: float) -> List[WindVectorSchema]:
-        """
-            获取指定经纬度的 风速 | 风向 时序数据
-        @param lat:
-        @param lon:
-        @return:
-        """
-        # TODO:[*] 23-12-01 重新挂载新的物理硬盘后，读取出错
-        # '/data/local_wind_nwp/2023/11/nwp_high_res_wind_2023113012_output.nc'
-        readfile_path: str = self.get_readfile_path()
-        # TODO:[-] 24-05-27 调试，修改为本地路径
-        # readfile_path: str = r'E:\05DATA\99test\WIND\nwp_high_res_wind_2024052612_output.nc'
-
-        field_name = 'ws'
-
-        field_time_name: str = 'time'
-        list_vals: List[WindVectorSchema] = []
-        if pathlib.Path(readfile_path).is_file():
-            ds: xar.Dataset = xar.open_dataset(readfile_path)
-            # 通过临近算法获取与当前 lat,lng 最接近的点
-            ds = ds.sel(lat=lat, lon=lon, method='nearest')
-            # 去掉 'record'
-            # ds = ds.isel(record=0)[field_name]
-            # target_fields_vals: List[float] = ds.isel(record=0)[field_name].values
-            ws_vals: List[float] = ds['ws'].values
-            wd_vals: List[float] = ds['wd'].values
-            dt64_list: List[np.datetime64] = ds[field_time_name].values
-            for index, val in enumerate(ws_vals):
-                temp_dt64 = dt64_list[index]
-                temp_ts64 = pd.Timestamp(temp_dt64)
-                temp_pydt = temp_ts64.to_pydatetime()
-                temp_arrow = arrow.get(temp_pydt)
-                # TODO:[-] 24-05-27 注意此处的 ws 与 wd 有可能存在为nan的情况，需要加入判断。此处判断不可通过 val== np.nan 或 val is np.nan 的方式进行判断；建议采用 np.isnan(val)
-                ws_temp = None if np.isnan(val) else val
-                wd_temp = None if np.isnan(wd_vals[index]) else wd_vals[index]
-                temp_pydt_utc: arrow.Arrow = temp_arrow.datetime
-
-                list_vals.append(WindVectorSchema(forecast_ts=temp_arrow.int_timestamp, wd=wd_temp, ws=ws_temp))
-        return list_vals
+import pathlib
+from typing import List, Optional, Dict, Any
+import xarray as xar
+import numpy as np
+import pandas as pd
+import arrow
+from numpy import nan
+from sqlalchemy.orm import Session
+
+from config.store_config import STORE_OPTIONS
+from config.cache_config import CACHE_OPTIONS
+from dao.base import BaseDao
+from models.coverage import GeoCoverageFileModel
+from schema.coverage import WindVectorSchema
+from util.dataset_cache import DatasetCache
+
+# + 24-06-20 已打开的风场(及最大增水场) nc dataset 缓存(同一 issue 的多次点选直接从内存读取)
+dataset_cache = DatasetCache(CACHE_OPTIONS.get('DATASET').get('MAX_SIZE'))
+
+
+class BaseVectorDao(BaseDao):
+    def __init__(self, coverage_file: GeoCoverageFileModel, session: Session = None):
+        """
+
+        @param coverage_file:
+        @param session:
+        """
+
+        # 矢量待读取的栅格文件(nc)
+        super(BaseVectorDao, self).__init__(session)
+        self.coverage_file = coverage_file
+        pass
+
+    # 栅格文件所在的存储(STORE_OPTIONS 中的 key)
+    store_key: str = 'NWP'
+
+    def get_readfile_path(self) -> str:
+        root_path: str = STORE_OPTIONS.get(self.store_key).get('STORE_ROOT_PATH')
+        readfile_path: str = f'{root_path}/{self.coverage_file.relative_path}/{self.coverage_file.file_name}'
+        return readfile_path
+
+    def read_points(self, lats: List[float], lons: List[float], field_names: List[str], is_polyline: bool = False,
+                    step: Optional[float] = None, time_name: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+            + 24-06-22 批量获取多个点(或沿折线)最临近格点的值
+            所有点的格点下标一次性计算，再通过 isel 的向量化(逐点)索引一次读取各字段
+        @param lats:
+        @param lons:
+        @param field_names: 读取的字段
+        @param is_polyline: 是否将 lats,lons 作为折线(按 step 采样，并去掉相邻重复的格点)
+        @param step: 折线采样间隔(°)，默认为网格分辨率
+        @param time_name: + 24-06-28 不为空时同时返回该时间坐标的时间戳数组(ts)，无需再次获取 dataset
+        @return: {'lat': [格点lat], 'lon': [格点lon], field_name: ndarray(..., point)[, 'ts': ndarray]}，
+                 文件不存在时返回 None
+        """
+        # TODO:[-] 24-06-28 读取期间持有 dataset 的引用，避免被重新打开或淘汰时关闭
+        with dataset_cache.open(self.get_readfile_path()) as cache_item:
+            if cache_item is None:
+                return None
+            lat_arr: np.ndarray = np.asarray(lats, dtype=np.float64)
+            lon_arr: np.ndarray = np.asarray(lons, dtype=np.float64)
+            if is_polyline:
+                if step is None or step <= 0:
+                    step = float(np.abs(np.diff(cache_item.coords['lat'])).min())
+                lat_arr, lon_arr = densify_polyline(lat_arr, lon_arr, step)
+            lat_index: np.ndarray = cache_item.get_nearest_indexes('lat', lat_arr)
+            lon_index: np.ndarray = cache_item.get_nearest_indexes('lon', lon_arr)
+            if is_polyline and len(lat_index) > 1:
+                # 折线上相邻的采样点可能落在同一格点
+                is_new: np.ndarray = np.ones(len(lat_index), dtype=bool)
+                is_new[1:] = (np.diff(lat_index) != 0) | (np.diff(lon_index) != 0)
+                lat_index, lon_index = lat_index[is_new], lon_index[is_new]
+            index_dict: Dict[str, xar.DataArray] = {'lat': xar.DataArray(lat_index, dims='point'),
+                                                    'lon': xar.DataArray(lon_index, dims='point')}
+            dict_res: Dict[str, Any] = {'lat': cache_item.coords['lat'][lat_index].tolist(),
+                                        'lon': cache_item.coords['lon'][lon_index].tolist()}
+            ds: xar.Dataset = cache_item.ds
+            for field_name in field_names:
+                dict_res[field_name] = ds[field_name].isel(index_dict).transpose(..., 'point').values
+            if time_name is not None:
+                dict_res['ts'] = cache_item.get_ts(time_name)
+            return dict_res
+
+
+def densify_polyline(lats: np.ndarray, lons: np.ndarray, step: float):
+    """
+        + 24-06-22 沿折线按 step 等间距采样(包含各顶点)
+    @param lats:
+    @param lons:
+    @param step: 采样间隔(°)
+    @return: (lat 数组, lon 数组)
+    """
+    if len(lats) < 2:
+        return lats, lons
+    seg_lens: np.ndarray = np.hypot(np.diff(lats), np.diff(lons))
+    # 各线段的采样数(不含线段终点)
+    seg_counts: np.ndarray = np.maximum(np.ceil(seg_lens / step).astype(np.int64), 1)
+    seg_index: np.ndarray = np.repeat(np.arange(len(seg_lens)), seg_counts)
+    # 各采样点在所属线段上的比例 [0,1)
+    ratio: np.ndarray = (np.arange(seg_counts.sum()) - np.repeat(np.cumsum(seg_counts) - seg_counts,
+                                                                 seg_counts)) / seg_counts[seg_index]
+    dense_lats: np.ndarray = lats[seg_index] + (lats[seg_index + 1] - lats[seg_index]) * ratio
+    dense_lons: np.ndarray = lons[seg_index] + (lons[seg_index + 1] - lons[seg_index]) * ratio
+    return np.append(dense_lats, lats[-1]), np.append(dense_lons, lons[-1])
+
+
+def to_nullable_list(vals: np.ndarray) -> List[Optional[float]]:
+    """
+        + 24-06-21 整体将 nan 替换为 None 后转换为 list(json 中为 null)
+    @param vals:
+    @return:
+    """
+    vals = vals.astype(np.float64)
+    nan_mask: np.ndarray = np.isnan(vals)
+    if not nan_mask.any():
+        return vals.tolist()
+    list_vals: np.ndarray = vals.astype(object)
+    list_vals[nan_mask] = None
+    return list_vals.tolist()
+
+
+class NWPVectorDao(BaseVectorDao):
+    # 时间坐标名称
+    field_time_name: str = 'time'
+
+    def read_forecast_columns(self, lat: float, lon: float) -> Optional[Dict[str, List]]:
+        """
+            + 24-06-21 获取指定经纬度的 风速 | 风向 时序数据(列式)
+            通过缓存的坐标数组计算最临近格点下标后 isel，只读取该格点的时序数据;
+            时间轴整体转换为时间戳，nan 按数组整体替换为 None
+        @param lat:
+        @param lon:
+        @return: {'ts': [forecast_ts], 'ws': [ws|None], 'wd': [wd|None]}，文件不存在时返回 None
+        """
+        # TODO:[*] 23-12-01 重新挂载新的物理硬盘后，读取出错
+        # '/data/local_wind_nwp/2023/11/nwp_high_res_wind_2023113012_output.nc'
+        readfile_path: str = self.get_readfile_path()
+        # TODO:[-] 24-05-27 调试，修改为本地路径
+        # readfile_path: str = r'E:\05DATA\99test\WIND\nwp_high_res_wind_2024052612_output.nc'
+        # TODO:[-] 24-06-20 不再每次请求都 open_dataset(且未关闭)，改为从 dataset_cache 中获取已打开的 dataset
+        # TODO:[-] 24-06-28 读取期间持有 dataset 的引用，避免被重新打开或淘汰时关闭
+        with dataset_cache.open(readfile_path) as cache_item:
+            if cache_item is None:
+                return None
+            # 通过临近算法获取与当前 lat,lng 最接近的点
+            index_dict: Dict[str, int] = {'lat': cache_item.get_nearest_index('lat', lat),
+                                          'lon': cache_item.get_nearest_index('lon', lon)}
+            ds: xar.Dataset = cache_item.ds
+            ws_vals: np.ndarray = ds['ws'].isel(index_dict).values
+            wd_vals: np.ndarray = ds['wd'].isel(index_dict).values
+            ts_vals: np.ndarray = cache_item.get_ts(self.field_time_name)
+        return {'ts': ts_vals.tolist(), 'ws': to_nullable_list(ws_vals), 'wd': to_nullable_list(wd_vals)}
+
+    def read_points_columns(self, lats: List[float], lons: List[float], is_polyline: bool = False,
+                            step: Optional[float] = None) -> Optional[Dict[str, List]]:
+        """
+            + 24-06-22 批量获取多个点(或沿折线)的 风速 | 风向 时序数据(列式)
+        @param lats:
+        @param lons:
+        @param is_polyline:
+        @param step:
+        @return: {'ts': [forecast_ts], 'lat': [格点lat], 'lon': [格点lon], 'ws': [[ws|None]], 'wd': [[wd|None]]}
+                 ws,wd 按点排列，每个点为一条时序
+        """
+        # TODO:[-] 24-06-28 时间戳由 read_points 一并返回(不再重复获取 dataset)
+        dict_points: Optional[Dict[str, Any]] = self.read_points(lats, lons, ['ws', 'wd'], is_polyline, step,
+                                                                 time_name=self.field_time_name)
+        if dict_points is None:
+            return None
+        ts_vals: np.ndarray = dict_points['ts']
+        # (time, point) -> (point, time)
+        ws_vals: np.ndarray = dict_points['ws'].reshape(-1, len(dict_points['lat'])).T
+        wd_vals: np.ndarray = dict_points['wd'].reshape(-1, len(dict_points['lat'])).T
+        return {'ts': ts_vals.tolist(), 'lat': dict_points['lat'],
+                'lon': dict_points['lon'], 'ws': [to_nullable_list(vals) for vals in ws_vals],
+                'wd': [to_nullable_list(vals) for vals in wd_vals]}
+
+    def read_forecast_list(self, lat: float, lon: float) -> List[WindVectorSchema]:
+        """
+            获取指定经纬度的 风速 | 风向 时序数据
+            TODO:[-] 24-06-21 不再逐时次将 datetime64 -> pd.Timestamp -> datetime -> arrow 并逐个判断 nan，
+                              由 read_forecast_columns 整体转换后再生成 WindVectorSchema
+        @param lat:
+        @param lon:
+        @return:
+        """
+        list_vals: List[WindVectorSchema] = []
+        columns: Optional[Dict[str, List]] = self.read_forecast_columns(lat, lon)
+        if columns is not None:
+            list_vals = [WindVectorSchema(forecast_ts=ts, wd=wd, ws=ws) for ts, ws, wd in
+                         zip(columns['ts'], columns['ws'], columns['wd'])]
+        return list_vals
+
+
+class MaxSurgeVectorDao(BaseVectorDao):
+    """
+        + 24-06-22 最大增水场(nc)
+    """
+    store_key: str = 'SURGE'
+    field_name: str = 'max_surge'
+
+    def read_points_columns(self, lats: List[float], lons: List[float], is_polyline: bool = False,
+                            step: Optional[float] = None) -> Optional[Dict[str, List]]:
+        """
+            + 24-06-22 批量获取多个点(或沿折线)的最大增水
+        @param lats:
+        @param lons:
+        @param is_polyline:
+        @param step:
+        @return: {'lat': [格点lat], 'lon': [格点lon], 'max_surge': [max_surge|None]}
+        """
+        dict_points: Optional[Dict[str, Any]] = self.read_points(lats, lons, [self.field_name], is_polyline, step)
+        if dict_points is None:
+            return None
+        dict_points[self.field_name] = to_nullable_list(dict_points[self.field_name].reshape(-1))
+        return dict_points
@@ -1,44 +1,232 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, scoped_session, Session
-from config.db_config import DBConfig
-
-
-class DBFactory:
-    """
-        + 23-03-09 数据库工厂类
-    """
-    session: Session = None
-    default_config: DBConfig = DBConfig()
-
-    def __init__(self, config: DBConfig = None):
-        if not config:
-            config = self.default_config
-        self.session = self._create_scoped_session(config)
-
-    def __del__(self):
-        """
-            + 23-04-04 解决
-            sqlalchemy.exc.OperationalError: (MySQLdb._exceptions.OperationalError)
-             (1040, 'Too many connections')
-        :return:
-        """
-        self.session.close()
-
-    @staticmethod
-    def _create_scoped_session(config: DBConfig):
-        engine = create_engine(
-            config.get_url(),
-            pool_size=config.pool_size,
-            max_overflow=config.max_overflow,
-            pool_recycle=config.pool_recycle,
-            echo=config.echo
-        )
-
-        # TODO:[-] 23-03-10 sqlalchemy.exc.ArgumentError: autocommit=True is no longer supported
-        session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-        # scoped_session封装了两个值 Session 和 registry,registry加括号就执行了ThreadLocalRegistry的__call__方法,
-        # 如果当前本地线程中有session就返回session,没有就将session添加到了本地线程
-        # 优点:支持线程安全,为每个线程都创建一个session
-        # scoped_session 是一个支持多线程且线程安全的session
-        return scoped_session(session_factory)
+import time
+import threading
+from typing import Optional, Iterator, Dict, Callable, Any
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker, scoped_session, Session
+from fastapi.concurrency import run_in_threadpool
+from config.db_config import DBConfig
+
+# + 24-06-05 应用级共享的 engine 与 session 工厂，在 fastapi startup 时创建(init_engine)
+_engine: Optional[Engine] = None
+_session_factory: Optional[sessionmaker] = None
+_engine_lock = threading.Lock()
+
+
+class PoolWaitStats:
+    """
+        + 24-06-05 统计从连接池获取连接的等待耗时
+        - 24-06-28 等待耗时不再包含新建连接的耗时(新建连接单独统计)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count: int = 0
+        self.total_wait: float = 0.0
+        self.max_wait: float = 0.0
+        self.connect_count: int = 0
+        self.total_connect: float = 0.0
+
+    def record(self, wait: float):
+        with self._lock:
+            self.count += 1
+            self.total_wait += wait
+            self.max_wait = max(self.max_wait, wait)
+
+    def record_connect(self, elapsed: float):
+        with self._lock:
+            self.connect_count += 1
+            self.total_connect += elapsed
+
+    def to_dict(self) -> Dict:
+        with self._lock:
+            avg_wait: float = self.total_wait / self.count if self.count > 0 else 0.0
+            avg_connect: float = self.total_connect / self.connect_count if self.connect_count > 0 else 0.0
+            return {'checkout_count': self.count, 'avg_wait': avg_wait, 'max_wait': self.max_wait,
+                    'connect_count': self.connect_count, 'avg_connect': avg_connect}
+
+
+pool_wait_stats = PoolWaitStats()
+# 当前线程本次获取连接的开始时间(session 事务创建时记录)及新建连接的耗时(由 do_connect / connect 事件记录)
+_checkout_local = threading.local()
+
+
+def _on_after_transaction_create(session, transaction):
+    """
+        + 24-06-30 session 开始根事务时记录获取连接的开始时间
+        session 在首次执行 sql 时才会 autobegin 并随即在同一线程中 engine.connect()，
+        因此由 session 事件与连接池 checkout 事件统计等待耗时(不再继承 QueuePool 重写私有方法)
+    """
+    if transaction.parent is None:
+        _checkout_local.start_time = time.perf_counter()
+        _checkout_local.connect_time = 0.0
+
+
+def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+    """
+        + 24-06-30 等待耗时 = 获取连接的总耗时 - 新建连接的耗时
+    """
+    start_time: Optional[float] = getattr(_checkout_local, 'start_time', None)
+    if start_time is None:
+        return
+    _checkout_local.start_time = None
+    wait: float = time.perf_counter() - start_time - getattr(_checkout_local, 'connect_time', 0.0)
+    pool_wait_stats.record(max(wait, 0.0))
+
+
+def _on_do_connect(dialect, conn_rec, cargs, cparams):
+    conn_rec.info['connect_start'] = time.perf_counter()
+
+
+def _on_connect(dbapi_connection, connection_record):
+    start_time: Optional[float] = connection_record.info.pop('connect_start', None)
+    if start_time is None:
+        return
+    elapsed: float = time.perf_counter() - start_time
+    pool_wait_stats.record_connect(elapsed)
+    _checkout_local.connect_time = getattr(_checkout_local, 'connect_time', 0.0) + elapsed
+
+
+def init_engine(config: DBConfig = None) -> Engine:
+    """
+        + 24-06-05 创建应用级共享的 engine(连接池)
+        重复调用时直接返回已创建的 engine
+    @param config:
+    @return:
+    """
+    global _engine, _session_factory
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                if not config:
+                    config = DBFactory.default_config
+                engine = create_engine(
+                    config.get_url(),
+                    pool_size=config.pool_size,
+                    max_overflow=config.max_overflow,
+                    pool_recycle=config.pool_recycle,
+                    pool_pre_ping=True,
+                    echo=config.echo
+                )
+                # TODO:[-] 23-03-10 sqlalchemy.exc.ArgumentError: autocommit=True is no longer supported
+                # + 24-06-28 记录新建连接的耗时(从等待耗时中扣除)
+                event.listen(engine, 'do_connect', _on_do_connect)
+                event.listen(engine, 'connect', _on_connect)
+                # + 24-06-30 通过公开的事件统计获取连接的等待耗时
+                event.listen(engine, 'checkout', _on_checkout)
+                _session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+                event.listen(_session_factory, 'after_transaction_create', _on_after_transaction_create)
+                _engine = engine
+    return _engine
+
+
+def dispose_engine():
+    """
+        + 24-06-05 fastapi shutdown 时释放连接池
+    @return:
+    """
+    global _engine, _session_factory
+    with _engine_lock:
+        if _engine is not None:
+            _engine.dispose()
+        _engine = None
+        _session_factory = None
+
+
+def get_session_factory() -> sessionmaker:
+    if _session_factory is None:
+        init_engine()
+    return _session_factory
+
+
+def get_db() -> Iterator[Session]:
+    """
+        + 24-06-05 request 级别的 session，通过 Depends 注入
+        - 24-06-28 不再在请求开始时获取连接，首次执行 sql 时才从连接池获取(等待耗时由 checkout 事件记录)，
+                   请求结束后 close 并将连接归还至连接池
+    @return:
+    """
+    session: Session = get_session_factory()()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+async def run_db_in_threadpool(session: Session, func: Callable, *args, **kwargs) -> Any:
+    """
+        + 24-06-28 在线程池中执行数据库查询，完成后立即 close session 将连接归还至连接池
+        (异步接口随后 await 远程服务时不再占用连接，session 之后仍可继续使用)
+    @param session:
+    @param func:
+    @param args:
+    @param kwargs:
+    @return:
+    """
+
+    def run():
+        try:
+            return func(*args, **kwargs)
+        finally:
+            session.close()
+
+    return await run_in_threadpool(run)
+
+
+def get_pool_status() -> Dict:
+    """
+        + 24-06-05 获取连接池状态
+    @return: {
+        'pool_size': 连接池大小,
+        'checked_in': 空闲连接数,
+        'checked_out': 使用中的连接数,
+        'overflow': 溢出的连接数,
+        'checkout_count': 获取连接次数,
+        'avg_wait': 平均等待耗时(s),
+        'max_wait': 最大等待耗时(s)
+    }
+    """
+    pool = init_engine().pool
+    status: Dict = {
+        'pool_size': pool.size(),
+        'checked_in': pool.checkedin(),
+        'checked_out': pool.checkedout(),
+        'overflow': pool.overflow(),
+    }
+    status.update(pool_wait_stats.to_dict())
+    return status
+
+
+class DBFactory:
+    """
+        + 23-03-09 数据库工厂类
+        TODO:[-] 24-06-05 不再为每个实例创建 engine，统一使用应用级共享的 engine;
+                          优先使用通过 Depends(get_db) 注入的 request 级别 session
+    """
+    session: Session = None
+    default_config: DBConfig = DBConfig()
+
+    def __init__(self, session: Session = None):
+        # 是否由当前实例创建(需要由当前实例负责关闭)
+        self._is_owner: bool = session is None
+        self.session = session if session is not None else self._create_scoped_session()
+
+    def __del__(self):
+        """
+            + 23-04-04 解决
+            sqlalchemy.exc.OperationalError: (MySQLdb._exceptions.OperationalError)
+             (1040, 'Too many connections')
+            - 24-06-05 注入的 session 由 get_db 负责关闭
+        :return:
+        """
+        if self._is_owner and self.session is not None:
+            self.session.close()
+
+    @staticmethod
+    def _create_scoped_session():
+        # scoped_session封装了两个值 Session 和 registry,registry加括号就执行了ThreadLocalRegistry的__call__方法,
+        # 如果当前本地线程中有session就返回session,没有就将session添加到了本地线程
+        # 优点:支持线程安全,为每个线程都创建一个session
+        # scoped_session 是一个支持多线程且线程安全的session
+        return scoped_session(get_session_factory())
@@ -1,65 +1,93 @@
-# 这是一个示例 Python 脚本。
-
-# 按 Ctrl+F5 执行或将其替换为您的代码。
-# 按 双击 Shift 在所有地方搜索类、文件、工具窗口、操作和设置。
-from fastapi import FastAPI
-# cors
-from fastapi.middleware.cors import CORSMiddleware
-import uvicorn
-import typer
-
-# 项目文件
-from application import urls
-
-shell_app = typer.Typer()
-
-origins = [
-    "http://localhost",
-    "http://localhost:8080",
-    "http://localhost:8081",
-    "http://localhost:8081",
-    "http://0.0.0.0:8081",
-    "http://127.0.0.1:8081",
-    "http://128.5.9.79:8081",
-    "http://128.5.9.79:8087",
-]
-
-
-def init_app():
-    app = FastAPI(
-        title="wd surge system",
-        description="温带风暴潮预报业务系统.本系统通过:fastapi+sqlalchemy+typer实现",
-        version="1.0.0"
-    )
-    # - 23-03-27 加入 cores
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=origins,
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"], )
-
-    for url in urls.urlpatterns:
-        # prefix:  '/station/status'
-        # tags: ['海洋站状态']
-        app.include_router(url["ApiRouter"], prefix=url["prefix"], tags=url["tags"])
-    return app
-
-
-@shell_app.command()
-def run():
-    """
-    启动项目
-    """
-    uvicorn.run(app='main:init_app', host="0.0.0.0", port=8095)
-
-
-def main():
-    shell_app()
-
-
-# 按间距中的绿色按钮以运行脚本。
-if __name__ == '__main__':
-    main()
-
-# 访问 https://www.jetbrains.com/help/pycharm/ 获取 PyCharm 帮助
+# 这是一个示例 Python 脚本。
+
+# 按 Ctrl+F5 执行或将其替换为您的代码。
+# 按 双击 Shift 在所有地方搜索类、文件、工具窗口、操作和设置。
+from fastapi import FastAPI
+# cors
+from fastapi.middleware.cors import CORSMiddleware
+import uvicorn
+import typer
+
+# 项目文件
+from application import urls
+from db.db_factory import init_engine, dispose_engine
+from dao.station import start_station_base_cache, stop_station_base_cache, start_tide_store, stop_tide_store
+from dao.vector import dataset_cache
+from dao.task import response_cache, start_issue_version_watch, stop_issue_version_watch, RESPONSE_CACHE_OPTIONS
+from util.http_client import close_async_client
+from util.consul_util import stop_consul_discovery
+from util.response_cache import ResponseCacheMiddleware
+
+shell_app = typer.Typer()
+
+origins = [
+    "http://localhost",
+    "http://localhost:8080",
+    "http://localhost:8081",
+    "http://localhost:8081",
+    "http://0.0.0.0:8081",
+    "http://127.0.0.1:8081",
+    "http://128.5.9.79:8081",
+    "http://128.5.9.79:8087",
+]
+
+
+def init_app():
+    app = FastAPI(
+        title="wd surge system",
+        description="温带风暴潮预报业务系统.本系统通过:fastapi+sqlalchemy+typer实现",
+        version="1.0.0"
+    )
+    # + 24-06-19 已发布预报产品的响应缓存(ETag/Last-Modified)
+    #   需要在 CORSMiddleware 之前添加(位于其内层)，命中缓存的响应同样会加上跨域头
+    app.add_middleware(ResponseCacheMiddleware, cache=response_cache, paths=RESPONSE_CACHE_OPTIONS.get('PATHS'))
+    # - 23-03-27 加入 cores
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=origins,
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"], )
+
+    for url in urls.urlpatterns:
+        # prefix:  '/station/status'
+        # tags: ['海洋站状态']
+        app.include_router(url["ApiRouter"], prefix=url["prefix"], tags=url["tags"])
+    # + 24-06-05 启动时创建应用级共享的 engine(连接池)，关闭时释放
+    app.add_event_handler('startup', init_engine)
+    app.add_event_handler('shutdown', dispose_engine)
+    # + 24-06-12 启动时开启站点基础信息等参考数据缓存的后台刷新
+    app.add_event_handler('startup', start_station_base_cache)
+    app.add_event_handler('shutdown', stop_station_base_cache)
+    # + 24-06-16 加载本地天文潮存储并定时重建
+    app.add_event_handler('startup', start_tide_store)
+    app.add_event_handler('shutdown', stop_tide_store)
+    # + 24-06-14 关闭调用远程服务的异步 http 客户端连接池
+    app.add_event_handler('shutdown', close_async_client)
+    # + 24-06-28 停止 consul 服务发现的监听线程
+    app.add_event_handler('shutdown', stop_consul_discovery)
+    # + 24-06-19 轮询 issue_versions，重新入库的 issue 使其响应缓存失效
+    app.add_event_handler('startup', start_issue_version_watch)
+    app.add_event_handler('shutdown', stop_issue_version_watch)
+    # + 24-06-20 关闭缓存的风场 nc dataset 文件句柄
+    app.add_event_handler('shutdown', dataset_cache.clear)
+    return app
+
+
+@shell_app.command()
+def run():
+    """
+    启动项目
+    """
+    uvicorn.run(app='main:init_app', host="0.0.0.0", port=8095)
+
+
+def main():
+    shell_app()
+
+
+# 按间距中的绿色按钮以运行脚本。
+if __name__ == '__main__':
+    main()
+
+# 访问 https://www.jetbrains.com/help/pycharm/ 获取 PyCharm 帮助
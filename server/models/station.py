@@ -1,62 +1,129 @@
-from sqlalchemy.orm import Mapped
-from sqlalchemy.orm import mapped_column, DeclarativeBase
-from sqlalchemy import String
-from datetime import datetime
-from arrow import Arrow
-from common.default import DEFAULT_FK, UNLESS_INDEX, NONE_ID, DEFAULT_CODE, DEFAULT_PATH_TYPE, DEFAULT_PRO, \
-    UNLESS_RANGE, DEFAULT_TABLE_NAME, DEFAULT_YEAR, DEFAULT_SURGE, DEFAULT_NAME, DEFAULT_COUNTRY_INDEX
-
-from models.base_model import BaseMeta, IIdIntModel, IDel
-from models.task import ITask
-
-
-class IForecastTime(BaseMeta):
-    __abstract__ = True
-    forecast_dt: Mapped[datetime] = mapped_column(default=datetime.utcnow().date())
-    forecast_ts: Mapped[int] = mapped_column(default=Arrow.utcnow().int_timestamp)
-
-
-class IIssueTime(BaseMeta):
-    __abstract__ = True
-    issue_dt: Mapped[datetime] = mapped_column(default=datetime.utcnow().date())
-    issue_ts: Mapped[int] = mapped_column(default=Arrow.utcnow().int_timestamp)
-
-
-class IStationSurge(BaseMeta):
-    __abstract__ = True
-    station_code: Mapped[str] = mapped_column(String(10), default=DEFAULT_CODE)
-    surge: Mapped[float] = mapped_column(default=DEFAULT_SURGE)
-
-
-class StationForecastRealDataModel(IIdIntModel, IDel, IForecastTime, IIssueTime, IStationSurge, ITask):
-    """
-        海洋预报数据
-    """
-    table_name_base = 'station_realdata'
-    __tablename__ = 'station_realdata_template'
-
-    @classmethod
-    def get_split_tab_name(cls, dt_arrow: Arrow) -> str:
-        """
-            + 获取动态分表后的表名
-            按照 issue_dt 进行分表
-        @param dt_arrow: 时间 产品 issue_dt 时间
-        @return:
-        """
-
-        tab_dt_name: str = dt_arrow.format('YYYY')
-        tab_name: str = f'{cls.table_name_base}_{tab_dt_name}'
-        return tab_name
-
-    @classmethod
-    def set_split_tab_name(cls, dt_arrow: Arrow):
-        """
-            + 根据动态分表规则动态分表
-            按照 issue_dt 进行分表
-        @param dt_arrow: 时间 产品 issue_dt 时间
-        @return:
-        """
-        tab_name: str = cls.get_split_tab_name(dt_arrow)
-        cls.__table__.name = tab_name
-
-    pass
+import threading
+from typing import Dict, Any, Optional
+
+from sqlalchemy.orm import Mapped, aliased
+from sqlalchemy.orm import mapped_column, DeclarativeBase
+from sqlalchemy import String, MetaData, Table, UniqueConstraint, Index
+from datetime import datetime
+from arrow import Arrow
+from common.default import DEFAULT_FK, UNLESS_INDEX, NONE_ID, DEFAULT_CODE, DEFAULT_PATH_TYPE, DEFAULT_PRO, \
+    UNLESS_RANGE, DEFAULT_TABLE_NAME, DEFAULT_YEAR, DEFAULT_SURGE, DEFAULT_NAME, DEFAULT_COUNTRY_INDEX
+
+from models.base_model import BaseMeta, IIdIntModel, IDel
+from models.task import ITask
+
+
+class IForecastTime(BaseMeta):
+    __abstract__ = True
+    forecast_dt: Mapped[datetime] = mapped_column(default=datetime.utcnow().date())
+    forecast_ts: Mapped[int] = mapped_column(default=Arrow.utcnow().int_timestamp)
+
+
+class IIssueTime(BaseMeta):
+    __abstract__ = True
+    issue_dt: Mapped[datetime] = mapped_column(default=datetime.utcnow().date())
+    issue_ts: Mapped[int] = mapped_column(default=Arrow.utcnow().int_timestamp)
+
+
+class IStationSurge(BaseMeta):
+    __abstract__ = True
+    station_code: Mapped[str] = mapped_column(String(10), default=DEFAULT_CODE)
+    surge: Mapped[float] = mapped_column(default=DEFAULT_SURGE)
+
+
+# + 24-06-07 动态分表的 Table 及 orm 实体缓存 key: 表名
+_split_metadata = MetaData()
+_split_tables: Dict[str, Table] = {}
+_split_models: Dict[str, Any] = {}
+_split_lock = threading.Lock()
+
+
+class StationForecastRealDataModel(IIdIntModel, IDel, IForecastTime, IIssueTime, IStationSurge, ITask):
+    """
+        海洋预报数据
+    """
+    table_name_base = 'station_realdata'
+    __tablename__ = 'station_realdata_template'
+
+    @classmethod
+    def get_split_tab_name(cls, dt_arrow: Arrow) -> str:
+        """
+            + 获取动态分表后的表名
+            按照 issue_dt 进行分表
+        @param dt_arrow: 时间 产品 issue_dt 时间
+        @return:
+        """
+
+        tab_dt_name: str = dt_arrow.format('YYYY')
+        tab_name: str = f'{cls.table_name_base}_{tab_dt_name}'
+        return tab_name
+
+    @classmethod
+    def get_split_table(cls, dt_arrow: Arrow) -> Table:
+        """
+            + 24-06-07 获取动态分表对应的 Table(按表名缓存)
+            根据模板表结构复制出独立的 Table 对象，不再修改 cls.__table__.name，多线程并发查询不同年份时互不影响
+        @param dt_arrow: 时间 产品 issue_dt 时间
+        @return:
+        """
+        tab_name: str = cls.get_split_tab_name(dt_arrow)
+        tab: Optional[Table] = _split_tables.get(tab_name)
+        if tab is None:
+            with _split_lock:
+                tab = _split_tables.get(tab_name)
+                if tab is None:
+                    tab = cls.__table__.to_metadata(_split_metadata, name=tab_name)
+                    _split_tables[tab_name] = tab
+        return tab
+
+    @classmethod
+    def get_split_model(cls, dt_arrow: Arrow) -> Any:
+        """
+            + 24-06-07 获取映射至动态分表的 orm 实体(按表名缓存)
+            eg:
+                tab_model = StationForecastRealDataModel.get_split_model(issue_arrow)
+                session.query(tab_model).filter(tab_model.issue_ts == issue_ts)
+        @param dt_arrow: 时间 产品 issue_dt 时间
+        @return:
+        """
+        tab_name: str = cls.get_split_tab_name(dt_arrow)
+        tab_model = _split_models.get(tab_name)
+        if tab_model is None:
+            tab: Table = cls.get_split_table(dt_arrow)
+            with _split_lock:
+                tab_model = _split_models.get(tab_name)
+                if tab_model is None:
+                    tab_model = aliased(cls, tab, name=tab_name, adapt_on_names=True)
+                    _split_models[tab_name] = tab_model
+        return tab_model
+
+    pass
+
+
+class StationSurgeSummaryModel(IIdIntModel, IDel, IIssueTime, ITask):
+    """
+        + 24-06-17 各站点单次发布(issue)的增水汇总，入库时计算一次
+        max_surge: 最大增水  max_forecast_ts|max_forecast_dt: 最大增水出现的时刻
+        last_surge: 最后预报时刻的增水  last_forecast_ts|last_forecast_dt: 最后预报时刻
+        exceed_level: 最大增水超过的阈值个数(阈值见 SURGE_EXCEED_THRESHOLDS)，0 为未超过
+                      注意: 阈值为全部站点共用的增水阈值，并非各站点的警戒潮位
+    """
+    __tablename__ = 'station_surge_summary'
+    __table_args__ = (UniqueConstraint('station_code', 'issue_ts', name='uix_summary_station_issue'),
+                      Index('idx_summary_issue', 'issue_ts'))
+    station_code: Mapped[str] = mapped_column(String(10), default=DEFAULT_CODE)
+    max_surge: Mapped[float] = mapped_column(default=DEFAULT_SURGE)
+    max_forecast_ts: Mapped[int] = mapped_column(default=0)
+    max_forecast_dt: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    last_surge: Mapped[float] = mapped_column(default=DEFAULT_SURGE)
+    last_forecast_ts: Mapped[int] = mapped_column(default=0)
+    last_forecast_dt: Mapped[datetime] = mapped_column(default=datetime.utcnow)
+    exceed_level: Mapped[int] = mapped_column(default=0)
+
+
+class StationLatestSurgeModel(IIdIntModel, IDel, IForecastTime, IIssueTime, IStationSurge, ITask):
+    """
+        + 24-06-18 各站点最新状态(最新 issue 的最后预报时刻及增水)，每个站点一行，入库时更新
+    """
+    __tablename__ = 'station_latest'
+    __table_args__ = (UniqueConstraint('station_code', name='uix_latest_station'),)
@@ -1,50 +1,88 @@
-from typing import List, Union, Optional
-from pydantic import BaseModel, Field
-from datetime import datetime
-
-
-class CoverageFileUrlSchema(BaseModel):
-    """
-        栅格 file
-    """
-    remote_url: str
-
-    class Config:
-        orm_mode = True
-
-
-class CoverageFileInfoSchema(BaseModel):
-    """
-        栅格 file 基础信息
-    """
-    # forecast_dt: datetime
-    forecast_ts: int
-    # issue_dt: datetime
-    issue_ts: int
-    task_id: int
-    relative_path: str
-    file_name: str
-    coverage_type: int
-
-    class Config:
-        orm_mode = True
-
-
-class WindVectorSchema(BaseModel):
-    """
-        + 23-10-08
-        风场矢量数据
-    """
-    # 预报时间戳
-    forecast_ts: int
-    # # 风向
-    # wd: Union[float, None] = None
-    # # 风速
-    # ws: Union[float, None] = None
-    # 风向
-    wd: Optional[float] = Field(None)
-    # 风速
-    ws: Optional[float] = Field(None)
-
-    class Config:
-        orm_mode = False
+from typing import List, Union, Optional
+from pydantic import BaseModel, Field
+from datetime import datetime
+
+
+class CoverageFileUrlSchema(BaseModel):
+    """
+        栅格 file
+    """
+    remote_url: str
+
+    class Config:
+        orm_mode = True
+
+
+class CoverageFileInfoSchema(BaseModel):
+    """
+        栅格 file 基础信息
+    """
+    # forecast_dt: datetime
+    forecast_ts: int
+    # issue_dt: datetime
+    issue_ts: int
+    task_id: int
+    relative_path: str
+    file_name: str
+    coverage_type: int
+
+    class Config:
+        orm_mode = True
+
+
+class WindVectorSchema(BaseModel):
+    """
+        + 23-10-08
+        风场矢量数据
+    """
+    # 预报时间戳
+    forecast_ts: int
+    # # 风向
+    # wd: Union[float, None] = None
+    # # 风速
+    # ws: Union[float, None] = None
+    # 风向
+    wd: Optional[float] = Field(None)
+    # 风速
+    ws: Optional[float] = Field(None)
+
+    class Config:
+        orm_mode = False
+
+
+class WindVectorColumnSchema(BaseModel):
+    """
+        + 24-06-21
+        风场矢量时序数据(列式)，缺测为 null
+    """
+    # 预报时间戳
+    ts: List[int] = []
+    # 风速
+    ws: List[Optional[float]] = []
+    # 风向
+    wd: List[Optional[float]] = []
+
+
+class WindVectorPointsSchema(BaseModel):
+    """
+        + 24-06-22
+        多点(或沿折线)风场时序数据(列式)，ws,wd 按点排列，每个点为一条时序
+    """
+    # 预报时间戳
+    ts: List[int] = []
+    # 最临近格点的经纬度
+    lat: List[float] = []
+    lon: List[float] = []
+    ws: List[List[Optional[float]]] = []
+    wd: List[List[Optional[float]]] = []
+
+
+class MaxSurgePointsSchema(BaseModel):
+    """
+        + 24-06-22
+        多点(或沿折线)最大增水(列式)
+    """
+    # 最临近格点的经纬度
+    lat: List[float] = []
+    lon: List[float] = []
+    max_surge: List[Optional[float]] = []
@@ -0,0 +1,97 @@
+"""
+    + 24-06-28 所有站点总潮位联结(/station/dist/stations/totalsurge)的一致性及耗时对比
+    原方式: 循环内通过 list(filter(lambda)) 查找站点基础信息及天文潮(O(N²))，按列表下标对齐
+    现方式: join_dist_stations_totalsurge(按 station_code 构建字典，align_surge_tide 按 forecast_ts 对齐)
+    使用生成的 500 个站点(168 个时次)，在 server 目录下执行:
+        python scripts/bench_dist_totalsurge.py
+"""
+import os
+import sys
+import random
+import timeit
+from typing import List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from schema.station import StationRegionSchema
+from schema.station_surge import DistStationTotalSurgeSchema, DistStationSurgeListSchema, DistStationTideListSchema, \
+    StationSurgeListSchema
+from controller.station import join_dist_stations_totalsurge
+
+STATIONS: int = 500
+HOURS: int = 168
+ISSUE_TS: int = 1690804800
+REPEAT: int = 5
+NUMBER: int = 3
+
+
+def make_lists():
+    """
+        生成站点基础信息、增水、天文潮集合(三者的站点顺序不同)
+    """
+    rnd = random.Random(0)
+    codes: List[str] = [f'S{index:03d}' for index in range(STATIONS)]
+    forecast_ts_list: List[int] = [ISSUE_TS + hour * 3600 for hour in range(HOURS)]
+    list_base_info: List[StationRegionSchema] = [
+        StationRegionSchema(id=index, code=code, name=code, lat=rnd.uniform(16, 41), lon=rnd.uniform(105, 127),
+                            sort=index, is_in_common_use=True) for index, code in enumerate(codes)]
+    list_surge: List[DistStationSurgeListSchema] = [
+        DistStationSurgeListSchema(station_code=code, issue_ts=ISSUE_TS,
+                                   surge_list_schema=StationSurgeListSchema(
+                                       forecast_ts_list=forecast_ts_list,
+                                       surge_list=[round(rnd.uniform(-50, 150), 2) for _ in range(HOURS)]))
+        for code in codes]
+    list_tide: List[DistStationTideListSchema] = [
+        DistStationTideListSchema(station_code=code, forecast_ts_list=forecast_ts_list,
+                                  tide_list=[round(rnd.uniform(-300, 300), 1) for _ in range(HOURS)])
+        for code in codes]
+    rnd.shuffle(list_base_info)
+    rnd.shuffle(list_tide)
+    return list_base_info, list_surge, list_tide
+
+
+def join_baseline(list_dist_station_base_info: List[StationRegionSchema],
+                  list_dist_station_surge: List[DistStationSurgeListSchema],
+                  list_dist_station_tide: List[DistStationTideListSchema]) -> List[DistStationTotalSurgeSchema]:
+    """
+        原 get_dist_stations_totalsurge 中的联结方式
+    """
+    list_dist_station_total: List[DistStationTotalSurgeSchema] = []
+    for temp_dist_station_surge in list_dist_station_surge:
+        filter_station_base_res = list(filter(lambda x: x.code == temp_dist_station_surge.station_code,
+                                              list_dist_station_base_info))
+        filter_res: Optional[List[DistStationTideListSchema]] = list(filter(
+            lambda x: temp_dist_station_surge.station_code == x.station_code, list_dist_station_tide))
+        if len(filter_res) > 0 and len(filter_station_base_res) > 0:
+            temp_dist_station_total: DistStationTotalSurgeSchema = DistStationTotalSurgeSchema(
+                station_code=temp_dist_station_surge.station_code,
+                sort=filter_station_base_res[0].sort,
+                forecast_ts_list=temp_dist_station_surge.surge_list_schema.forecast_ts_list,
+                surge_list=temp_dist_station_surge.surge_list_schema.surge_list, tide_list=filter_res[0].tide_list)
+            list_dist_station_total.append(temp_dist_station_total)
+    return list_dist_station_total
+
+
+def check_parity(list_baseline: List[DistStationTotalSurgeSchema], list_new: List[DistStationTotalSurgeSchema]):
+    assert len(list_new) == len(list_baseline) == STATIONS, f'站点数量不一致:{len(list_baseline)},{len(list_new)}'
+    for baseline, new in zip(list_baseline, list_new):
+        assert baseline.dict() == new.dict(), f'{baseline.station_code} 结果不一致'
+
+
+def main():
+    list_base_info, list_surge, list_tide = make_lists()
+    check_parity(join_baseline(list_base_info, list_surge, list_tide),
+                 join_dist_stations_totalsurge(list_base_info, list_surge, list_tide))
+    baseline_time: float = min(timeit.repeat(lambda: join_baseline(list_base_info, list_surge, list_tide),
+                                             repeat=REPEAT, number=NUMBER))
+    new_time: float = min(
+        timeit.repeat(lambda: join_dist_stations_totalsurge(list_base_info, list_surge, list_tide),
+                      repeat=REPEAT, number=NUMBER))
+    print(f'[-]站点:{STATIONS} 时次:{HOURS} 结果一致')
+    print(f'    filter:{baseline_time / NUMBER * 1000:.2f}ms  '
+          f'hash-join:{new_time / NUMBER * 1000:.2f}ms  '
+          f'speedup:{baseline_time / new_time:.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""
+    + 24-06-28 检查单站逐时增水查询(get_station_hourly_surge_list)是否使用复合索引 idx_issue_station_forecast
+    需要在可访问数据库的环境中执行(server 目录下):
+        python scripts/explain_station_surge.py --station-code BHI --issue-ts 1687953600
+    未指定 issue_ts / station_code 时取当年分表中最近的发布时次及其中任一站点
+"""
+import os
+import sys
+import argparse
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.utils import get_target_ts_year
+from db.db_factory import init_engine, get_session_factory, dispose_engine
+from dao.station import StationSurgeDao, get_station_hourly_surge_sql
+
+REALDATA_QUERY_INDEX: str = 'idx_issue_station_forecast'
+# 与 get_station_hourly_surge_list 一致的查询范围(h)
+FORECAST_HOURS: int = 168
+
+
+def get_default_station_code(session, issue_ts: int) -> Optional[str]:
+    tab_name: str = f'station_realdata_{get_target_ts_year(issue_ts)}'
+    return session.execute(text(f'SELECT station_code FROM {tab_name} WHERE issue_ts=:issue_ts LIMIT 1'),
+                           {'issue_ts': issue_ts}).scalar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='EXPLAIN 单站逐时增水查询')
+    parser.add_argument('--station-code', type=str, default=None)
+    parser.add_argument('--issue-ts', type=int, default=None)
+    args = parser.parse_args()
+
+    init_engine()
+    session = get_session_factory()()
+    try:
+        issue_ts: Optional[int] = args.issue_ts if args.issue_ts is not None else StationSurgeDao(
+            session).get_last_issue_ts()
+        if issue_ts is None:
+            print('[!]当年分表中没有数据，请指定 --issue-ts')
+            sys.exit(1)
+        station_code: Optional[str] = args.station_code if args.station_code is not None else \
+            get_default_station_code(session, issue_ts)
+        if station_code is None:
+            print(f'[!]issue:{issue_ts}没有站点数据，请指定 --station-code')
+            sys.exit(1)
+        start_ts: int = issue_ts
+        end_ts: int = issue_ts + FORECAST_HOURS * 3600
+        sql_str = get_station_hourly_surge_sql(session, start_ts, end_ts)
+        params: Dict = {'issue_ts': issue_ts, 'station_code': station_code, 'start_ts': start_ts, 'end_ts': end_ts,
+                        'limit_count': FORECAST_HOURS}
+        rows: List[Dict] = [dict(row._mapping) for row in
+                            session.execute(text(f'EXPLAIN {sql_str.text}'), params).fetchall()]
+        print(f'[-]station:{station_code} issue:{issue_ts} sql:{sql_str.text}')
+        for row in rows:
+            print(f'[-]table:{row.get("table")} type:{row.get("type")} key:{row.get("key")} rows:{row.get("rows")} '
+                  f'extra:{row.get("Extra")}')
+        # UNION 的结果集(<union1,2>)不访问索引，只检查分表
+        tab_rows: List[Dict] = [row for row in rows if str(row.get('table')).startswith('station_realdata_')]
+        assert len(tab_rows) > 0, 'EXPLAIN 结果中没有 station_realdata 分表'
+        for row in tab_rows:
+            assert row.get('key') == REALDATA_QUERY_INDEX, f'{row.get("table")} 未使用 {REALDATA_QUERY_INDEX}:' \
+                                                           f'{row.get("key")}'
+        print(f'[-]查询使用了索引:{REALDATA_QUERY_INDEX}')
+    finally:
+        session.close()
+        dispose_engine()
+
+
+if __name__ == '__main__':
+    main()
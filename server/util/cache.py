@@ -0,0 +1,215 @@
+import time
+import asyncio
+import threading
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+
+class TTLCacheItem:
+    """
+        + 24-06-12 缓存项
+    """
+
+    def __init__(self, value: Any, loaded_at: float):
+        self.value = value
+        self.loaded_at = loaded_at
+
+
+class TTLCache:
+    """
+        + 24-06-12 进程内 TTL 缓存(stale-while-revalidate)
+        - 未过期(age < ttl): 直接返回缓存
+        - 已过期但仍在 stale_ttl 内: 返回旧值，并在后台线程中刷新
+        - 超过 stale_ttl 或不存在: 同步调用 loader 加载
+        后台刷新线程(start_refresh)会定时刷新所有已注册的 key，保持缓存常驻
+        - 24-06-28 只有通过 register 注册的 key 常驻;通过 get/aget 传入 loader 的按需 key
+                   超过 stale_ttl 未被读取时注销，不再由后台线程刷新
+    """
+
+    def __init__(self, ttl: float, stale_ttl: float):
+        """
+        @param ttl: 缓存有效时长(s)
+        @param stale_ttl: 过期后仍可返回旧值的最长时长(s)，需大于 ttl
+        """
+        self.ttl = ttl
+        self.stale_ttl = max(stale_ttl, ttl)
+        self._lock = threading.Lock()
+        self._items: Dict[str, TTLCacheItem] = {}
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+        # 正在后台刷新的 key(避免重复刷新)
+        self._refreshing: Set[str] = set()
+        # + 24-06-28 通过 register 注册的常驻 key
+        self._resident: Set[str] = set()
+        # + 24-06-28 key 最近一次被读取的时间
+        self._accessed: Dict[str, float] = {}
+        self._stop_event: Optional[threading.Event] = None
+        self.hits: int = 0
+        self.stale_hits: int = 0
+        self.misses: int = 0
+
+    def register(self, key: str, loader: Callable[[], Any]):
+        """
+            注册 key 对应的加载函数(后台刷新线程会刷新所有已注册的 key)
+        @param key:
+        @param loader:
+        @return:
+        """
+        with self._lock:
+            self._loaders[key] = loader
+            self._resident.add(key)
+
+    def get(self, key: str, loader: Callable[[], Any] = None) -> Any:
+        """
+            获取缓存，不存在或已完全过期时通过 loader 同步加载
+        @param key:
+        @param loader: 为空时使用 register 注册的加载函数
+        @return:
+        """
+        item, loader = self._get_item(key, loader)
+        if item is not None:
+            return item.value
+        return self.refresh(key, loader)
+
+    async def aget(self, key: str, loader: Callable[[], Any] = None) -> Any:
+        """
+            + 24-06-14 异步获取缓存，需要加载时在线程池中执行 loader(不阻塞事件循环)
+        @param key:
+        @param loader: 为空时使用 register 注册的加载函数
+        @return:
+        """
+        item, loader = self._get_item(key, loader)
+        if item is not None:
+            return item.value
+        return await asyncio.get_event_loop().run_in_executor(None, self.refresh, key, loader)
+
+    def _get_item(self, key: str, loader: Callable[[], Any] = None) -> Tuple[Optional[TTLCacheItem], Callable]:
+        """
+            获取可直接返回的缓存项(未过期或在 stale_ttl 内)，需要同步加载时返回 None
+        @param key:
+        @param loader:
+        @return: (缓存项, 加载函数)
+        """
+        now: float = time.monotonic()
+        is_stale: bool = False
+        # TODO:[-] 24-06-28 命中统计同样在锁内更新(多线程并发读取时 += 不是原子操作)
+        with self._lock:
+            if loader is not None:
+                self._loaders[key] = loader
+            else:
+                loader = self._loaders.get(key)
+            self._accessed[key] = now
+            item: Optional[TTLCacheItem] = self._items.get(key)
+            if item is not None:
+                age: float = now - item.loaded_at
+                if age < self.ttl:
+                    self.hits += 1
+                    return item, loader
+                if age < self.stale_ttl:
+                    self.stale_hits += 1
+                    is_stale = True
+            if not is_stale:
+                self.misses += 1
+        if is_stale:
+            self._refresh_async(key)
+            return item, loader
+        return None, loader
+
+    def refresh(self, key: str, loader: Callable[[], Any] = None) -> Any:
+        """
+            调用 loader 重新加载 key 并写入缓存
+        @param key:
+        @param loader:
+        @return:
+        """
+        if loader is None:
+            loader = self._loaders.get(key)
+        if loader is None:
+            raise KeyError(f'未注册缓存key:{key}的加载函数')
+        value = loader()
+        with self._lock:
+            self._items[key] = TTLCacheItem(value, time.monotonic())
+        return value
+
+    def refresh_all(self):
+        """
+            刷新所有已注册的 key(单个 key 加载失败时保留旧值)
+            - 24-06-28 超过 stale_ttl 未被读取的按需 key 注销(移除加载函数及缓存)，不再刷新
+        @return:
+        """
+        now: float = time.monotonic()
+        keys: List[str] = []
+        with self._lock:
+            for key in list(self._loaders.keys()):
+                if key in self._resident or now - self._accessed.get(key, now - self.stale_ttl) < self.stale_ttl:
+                    keys.append(key)
+                else:
+                    self._loaders.pop(key, None)
+                    self._items.pop(key, None)
+                    self._accessed.pop(key, None)
+        for key in keys:
+            try:
+                self.refresh(key)
+            except Exception as ex:
+                print(f'[!]刷新缓存{key}出错:{ex.args}')
+
+    def invalidate(self, key: str = None):
+        """
+            使缓存失效，key 为空时清空全部缓存
+        @param key:
+        @return:
+        """
+        with self._lock:
+            if key is None:
+                self._items.clear()
+            else:
+                self._items.pop(key, None)
+
+    def start_refresh(self, interval: float):
+        """
+            启动后台刷新线程，立即刷新一次后每隔 interval(s) 刷新所有已注册的 key
+        @param interval:
+        @return:
+        """
+        if self._stop_event is not None:
+            return
+        self._stop_event = threading.Event()
+        stop_event: threading.Event = self._stop_event
+
+        def run():
+            while not stop_event.is_set():
+                self.refresh_all()
+                stop_event.wait(interval)
+
+        threading.Thread(target=run, name='ttl-cache-refresh', daemon=True).start()
+
+    def stop_refresh(self):
+        if self._stop_event is not None:
+            self._stop_event.set()
+            self._stop_event = None
+
+    def stats(self) -> Dict:
+        """
+            获取缓存状态
+        @return:
+        """
+        now: float = time.monotonic()
+        with self._lock:
+            ages: Dict[str, float] = {key: now - item.loaded_at for key, item in self._items.items()}
+            return {'ttl': self.ttl, 'stale_ttl': self.stale_ttl, 'hits': self.hits, 'stale_hits': self.stale_hits,
+                    'misses': self.misses, 'resident': sorted(self._resident), 'ages': ages}
+
+    def _refresh_async(self, key: str):
+        with self._lock:
+            if key in self._refreshing:
+                return
+            self._refreshing.add(key)
+
+        def run():
+            try:
+                self.refresh(key)
+            except Exception as ex:
+                print(f'[!]后台刷新缓存{key}出错:{ex.args}')
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=run, name=f'ttl-cache-{key}', daemon=True).start()
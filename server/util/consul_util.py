@@ -1,274 +1,457 @@
-# coding=utf-8
-# from consulate import Consul
-import logging
-from typing import Optional, Dict
-
-import consul
-from random import randint
-import requests
-import json
-
-from config import consul_config
-
-
-class ConsulConfigClient:
-    """
-        consul 配置客户端
-    """
-
-    def __init__(self, host: str, port: int, ):
-        """
-
-        @param host: consul 服务地址
-        @param port: consul 端口
-        """
-        self.host = host
-        self.port = port
-        self._consul = None
-        self._consul = consul.Consul(host=host, port=port)
-
-    def get_consul_kv(self, key: str) -> Optional[Dict]:
-        """
-            根据key获取对应的配置字典
-        @param key: 配置 key
-        @return:
-        """
-        agent_dict = None
-        if self._consul is not None:
-            _, res = self._consul.kv.get(key)
-            val = res.get('Value')
-            val_str = val.decode('utf-8')
-            val_dict = json.loads(val_str)
-            agent_dict = val_dict
-
-        return agent_dict
-
-
-class ConsulClient:
-    """
-        # TODO:[*] 23-11-01 参考文章
-        # https://gitee.com/aichinai/consul_flask/blob/master/ConsulFlask/consulclient.py
-    """
-
-    def __init__(self, host=None, port=None, token=None):
-        """
-            consul 操作类
-        :param host:
-        :param port:
-        :param token:
-        """
-
-        self.host = host  # consul 主机
-        self.port = port  # consul 端口
-        self.token = token
-        self.consul = consul.Consul(host=host, port=port)
-
-    def register(self, name, service_id, address, port, tags, interval, httpcheck):
-        # 注册服务 注册服务的服务名  端口  以及 健康监测端口
-        self.consul.agent.service.register(name, service_id=service_id, address=address, port=port, tags=tags,
-                                           interval=interval, check=httpcheck)
-        pass
-
-    def get_service(self, name) -> str:
-        """
-            负载均衡获取服务实例
-        :param name:
-        :return:
-        """
-        # client: 'http://127.5.9.79:8500/v1/catalog/service/student-service'
-
-        # 尝试通过
-        # self.consul.agent.services()
-        # {ConnectionError}HTTPConnectionPool(host='127.5.9.79', port=8500): Max retries exceeded with url: /v1/agent/services (Caused by NewConnectionError('<urllib3.connection.HTTPConnection object at 0x000001A9CD73BE48>: Failed to establish a new connection: [WinError 10061] 由于目标计算机积极拒绝，无法连接。'))
-        url_back = 'http://' + self.host + ':' + str(self.port) + '/v1/catalog/service/' + name  # 获取 相应服务下的DataCenter
-
-        url: str = f'http://{self.host}:{self.port}/v1/catalog/service/{name}'
-        requests.adapters.DEFAULT_RETRIES = 5  # 增加重连次数
-
-        req = requests.session()
-        req.keep_alive = False  # 关闭多余连接
-
-        dataCenterResp = req.get(url)
-        if dataCenterResp.status_code != 200:
-            raise Exception('连接 consul 错误')
-        listData = json.loads(dataCenterResp.text)
-        dcset = set()  # DataCenter 集合 初始化
-        for service in listData:
-            dcset.add(service.get('Datacenter'))
-        serviceList = []  # 服务列表 初始化
-        for dc in dcset:
-            target_url: str = f'http://{self.host}:{self.port}/v1/health/service/{name}?dc={dc}&token='
-            if self.token:
-                # url = 'http://' + self.host + ':' + self.port + '/v1/health/service/' + name + '?dc=' + dc + '&token=' + self.token
-                target_url = f'{target_url}{self.token}'
-            else:
-                # TypeError: can only concatenate str (not "int") to str
-                # url = 'http://' + self.host + ':' + self.port + '/v1/health/service/' + name + '?dc=' + dc + '&token='
-                pass
-            resp = requests.get(target_url)
-            if resp.status_code != 200:
-                raise Exception('连接 consul 错误 ')
-            text = resp.text
-            serviceListData = json.loads(text)
-
-            for serv in serviceListData:
-                status = serv.get('Checks')[1].get('Status')
-                if status == 'passing':  # 选取成功的节点
-                    address = serv.get('Service').get('Address')
-                    port = serv.get('Service').get('Port')
-                    serviceList.append({'port': port, 'address': address})
-
-        # print("成功节点服务列表：", serviceList)
-        if len(serviceList) == 0:
-            raise Exception('没有服务可用')
-            # print("没有服务可用")
-        else:
-            service = serviceList[randint(0, len(serviceList) - 1)]  # 随机获取一个可用的服务实例
-            # print("返回随机选取的节点", service['address'], int(service['port']))
-            # return service['address'],int(service['port'])
-            service_url: str = f'http://{service["address"]}:{service["port"]}'
-            return service_url
-
-
-class ConsulRegisterServer:
-    """
-        与 start_up 事件绑定并触发实现注册服务
-    """
-
-    # 新建服务时，需要指定consul服务的 主机，端口，所启动的 服务的 主机 端口 以及 restful http 服务 类
-    def __init__(self, service_host, service_port, consul_host, consul_port, app_name):
-        """
-
-        :param service_host: 127.0.0.1  当前服务的实际ip地址
-        :param service_port: 8000
-        :param consul_host: 128.5.9.79   consul 地址
-        :param consul_port: 8500
-        :param app_name: 注册的服务名称
-        """
-        self.service_port = service_port
-        self.service_host = service_host
-        # self.app = appClass(host=host, port=port)
-        # self.appname = self.app.appname
-        self.app_name = app_name
-        self.consul_host = consul_host
-        self.consul_port = consul_port
-
-    def register(self):
-        """
-            基于 self.service_host:self.service_port 注册至 self.consul_host:self.consul_port
-
-        :return:
-        """
-        client = ConsulClient(host=self.consul_host, port=self.consul_port)
-        service_id = self.app_name + self.service_host + ':' + str(self.service_port)
-        # 暂时不用
-        httpcheck = 'http://' + self.service_host + ':' + str(self.service_port) + '/check'
-        # TODO:[*] 23-11-02 注意此处的 check 有错误，无法实现心跳检测
-        # 注意心跳检测 check 的 host 应为 consul 的地址，改为consul的地址
-        # consul.base.BadRequest: 400 Invalid service address
-        client.register(self.app_name, service_id=service_id, address=self.service_host, port=self.service_port,
-                        tags=['master'],
-                        interval='30s',
-                        httpcheck=consul.Check().tcp(self.consul_host, self.consul_port, '5s', '30s', '30s'))  # 注册服务
-        pass
-        # self.app.run()  # 启动服务
-        # uvicorn.run(app=app, host=self.host, port=self.port)
-
-
-class ConsulExtractClient:
-    """
-        consul 获取(客户端)类
-        # TODO:[*] 23-11-06 参考文章: https://www.jianshu.com/p/717a90211b8c
-    """
-
-    def __init__(self, project_name):
-        """初始化，连接consul服务器"""
-        # self.sr = SR(project)
-        self.project_name = project_name
-        self.consul = ConsulClient(host=consul_config.CONSUL_HOST,
-                                   port=consul_config.CONSUL_PORT)
-        self.client = requests.session()
-        self.headers = {'Content-Type': 'application/json', 'Connection': 'keep-alive',
-                        'buc-auth-token': 'default.buc-auth-token'}
-
-    def get(self, uri, decode='utf-8', is_break: bool = False, **kwargs) -> Optional[str]:
-        """
-            获取指定服务地址并返回结果
-        :param uri: 请求的服务的 /area/controller
-        :param decode: 默认: utf-8 用来将 response.content 进行解码
-        :param is_break: 默认: false 若关闭则不会进行多次请求
-        :param kwargs: 若提交需要传入参数，则通过 params:type=dict
-        :return:
-        """
-        try_count = 0
-        # 加入了多次请求的逻辑
-        #
-        address = self.consul.get_service(self.project_name)
-        # 拼接对应的服务请求地址
-        # address : http://xxx:xx/ 是对应的注册服务的地址
-        url = '{0}{1}'.format(address, uri)
-        if kwargs.get('params') is not None:
-            response = self.client.get(
-                url=url,
-                params=kwargs.get('params'),
-                headers=self.headers)
-        else:
-            response = self.client.get(
-                url=url,
-                headers=self.headers)
-        if response.status_code == 200:
-            return response.content.decode(decode)
-            # return response.content
-        else:
-            logging.warning('{0}: status_code is {1}'.format(url, response.status_code))
-        # TODO:[*] 23-11-20 此处取消多次复联的逻辑，会造成延迟较长的连接会多次请求
-        # while try_count < consul_config.CONSUL_MAX_TRY_COUNT:
-        #     address = self.consul.get_service(self.project_name)
-        #     # 拼接对应的服务请求地址
-        #     # address : http://xxx:xx/ 是对应的注册服务的地址
-        #     url = '{0}{1}'.format(address, uri)
-        #     if kwargs.get('params') is not None:
-        #         response = self.client.get(
-        #             url=url,
-        #             params=kwargs.get('params'),
-        #             headers=self.headers)
-        #     else:
-        #         response = self.client.get(
-        #             url=url,
-        #             headers=self.headers)
-        #     # if response.status_code is 200:
-        #     #     self.aiops_consul.update_weight(address, success=True)
-        #     #     return response.content
-        #     # self.aiops_consul.update_weight(address, success=False)
-        #     if response.status_code == 200:
-        #         return response.content.decode(decode)
-        #         # return response.content
-        #     else:
-        #         if is_break:
-        #             break
-        #         try_count += 1
-        #         logging.warning('{0}: status_code is {1}'.format(url, response.status_code))
-        raise Exception('service service is error')
-
-    def post(self, uri, data):
-        try_count = 0
-        while try_count < 5:
-            address = self.consul.get_service(self.project_name)
-            url = '{0}{1}'.format(address, uri)
-            response = self.client.post(
-                url=url,
-                headers=self.headers,
-                data=data)
-            # if response.status_code is 200:
-            #     self.aiops_consul.update_weight(address, success=True)
-            # return response.content
-            # self.aiops_consul.update_weight(address, success=False)
-            try_count += 1
-            logging.warning('{0}: status_code is {1}'.format(url, response.status_code))
-        raise Exception('service service is error')
-
-    def get_task(self, task_id, user):
-        return self.get('/task/get/{0}?user={1}'.format(task_id, user))
-
-    def get_and_run_task(self, task, user):
-        return self.get('/task/getAndRun/{0}?user={1}'.format(task, user))
+# coding=utf-8
+# from consulate import Consul
+import logging
+import threading
+import time
+from typing import Optional, Dict, List, Set, Tuple
+
+import consul
+from fastapi.concurrency import run_in_threadpool
+from random import choice
+import requests
+import json
+
+from config import consul_config
+from util.http_client import get_async_client
+
+
+class ConsulConfigClient:
+    """
+        consul 配置客户端
+    """
+
+    def __init__(self, host: str, port: int, ):
+        """
+
+        @param host: consul 服务地址
+        @param port: consul 端口
+        """
+        self.host = host
+        self.port = port
+        self._consul = None
+        self._consul = consul.Consul(host=host, port=port)
+
+    def get_consul_kv(self, key: str) -> Optional[Dict]:
+        """
+            根据key获取对应的配置字典
+        @param key: 配置 key
+        @return:
+        """
+        agent_dict = None
+        if self._consul is not None:
+            _, res = self._consul.kv.get(key)
+            val = res.get('Value')
+            val_str = val.decode('utf-8')
+            val_dict = json.loads(val_str)
+            agent_dict = val_dict
+
+        return agent_dict
+
+
+class ConsulDiscoveryCache:
+    """
+        + 24-06-13 服务发现缓存
+        按 service name 缓存健康的服务实例，并通过 consul blocking query(index 长轮询)在后台线程中更新，
+        获取服务实例时不再访问 consul
+        - 24-06-28 通过 catalog.services 的 blocking query 监听服务目录变化，变化后重新获取 catalog.datacenters，
+                   新增的 dc 开始监听，移除的 dc 停止监听;
+                   (服务, dc) 的独立监听线程数不超过 max_watchers，超出的由目录监听线程在每轮(最长 wait)中刷新;
+                   stop 后全部监听线程在当前 blocking query 返回后退出
+    """
+
+    def __init__(self, consul_obj: consul.Consul, token: str = None, wait: str = '55s', retry_interval: float = 5,
+                 max_watchers: int = 8):
+        """
+        @param consul_obj:
+        @param token:
+        @param wait: blocking query 最长等待时间
+        @param retry_interval: consul 请求出错后的重试间隔(s)，出错期间保留已缓存的实例
+        @param max_watchers: (服务, dc) 独立监听线程的上限
+        """
+        self.consul = consul_obj
+        self.token = token
+        self.wait = wait
+        self.retry_interval = retry_interval
+        self.max_watchers = max_watchers
+        self._lock = threading.Lock()
+        # key: service name  value: {dc: [{'address','port'}]}
+        self._instances: Dict[str, Dict[str, List[Dict]]] = {}
+        # key: service name  value: 首次加载完成的事件
+        self._ready: Dict[str, threading.Event] = {}
+        # key: (service name, dc)  value: 独立监听线程的标识(None 表示由目录监听线程刷新)
+        self._watched: Dict[Tuple[str, str], Optional[object]] = {}
+        self._watcher_count: int = 0
+        self._catalog_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+
+    def get_instances(self, name: str) -> List[Dict]:
+        """
+            获取指定服务的健康实例集合(首次调用时同步加载并启动后台监听线程)
+        @param name: 服务名称
+        @return: [{'address','port'}]
+        """
+        with self._lock:
+            ready: Optional[threading.Event] = self._ready.get(name)
+            is_owner: bool = ready is None
+            if is_owner:
+                ready = threading.Event()
+                self._ready[name] = ready
+        if is_owner:
+            try:
+                self._start_watch(name)
+            except Exception:
+                # 首次加载失败时移除，下次调用时重新加载
+                with self._lock:
+                    self._ready.pop(name, None)
+                raise
+            finally:
+                ready.set()
+        else:
+            ready.wait()
+        with self._lock:
+            dict_dc: Dict[str, List[Dict]] = self._instances.get(name, {})
+            return [instance for instances in dict_dc.values() for instance in instances]
+
+    def stop(self):
+        """
+            + 24-06-28 停止全部监听线程(fastapi shutdown)
+        @return:
+        """
+        self._stop_event.set()
+        with self._lock:
+            self._watched.clear()
+
+    def _start_watch(self, name: str):
+        with self._lock:
+            self._instances[name] = {}
+        self._sync_dcs(name, self.consul.catalog.datacenters())
+        with self._lock:
+            if self._catalog_thread is None:
+                self._catalog_thread = threading.Thread(target=self._watch_catalog, name='consul-watch-catalog',
+                                                        daemon=True)
+                self._catalog_thread.start()
+
+    def _sync_dcs(self, name: str, dcs: List[str]):
+        """
+            + 24-06-28 同步指定服务监听的 dc
+            新增的 dc 加载实例并在未超出 max_watchers 时启动独立监听线程;移除的 dc 清除缓存(对应线程随后退出);
+            没有独立监听线程的 dc 重新加载一次
+        @param name:
+        @param dcs: 当前全部 dc
+        @return:
+        """
+        with self._lock:
+            for key in [key for key in self._watched if key[0] == name and key[1] not in dcs]:
+                del self._watched[key]
+                self._instances.get(name, {}).pop(key[1], None)
+            new_dcs: Set[str] = {dc for dc in dcs if (name, dc) not in self._watched}
+            for dc in new_dcs:
+                self._watched[(name, dc)] = None
+            polled_dcs: List[str] = [dc for dc in dcs if self._watched.get((name, dc)) is None]
+        for dc in polled_dcs:
+            index: str = self._load(name, dc)
+            if dc not in new_dcs:
+                continue
+            with self._lock:
+                if self._watcher_count >= self.max_watchers or (name, dc) not in self._watched:
+                    continue
+                token = object()
+                self._watched[(name, dc)] = token
+                self._watcher_count += 1
+            threading.Thread(target=self._watch, args=(name, dc, index, token), name=f'consul-watch-{name}-{dc}',
+                             daemon=True).start()
+
+    def _load(self, name: str, dc: str, index: str = None) -> str:
+        """
+            查询指定 dc 中的健康实例(index 不为空时为 blocking query)并更新缓存
+        @param name:
+        @param dc:
+        @param index:
+        @return: 本次查询返回的 index
+        """
+        index, list_service = self.consul.health.service(name, index=index, wait=self.wait if index else None,
+                                                         passing=True, dc=dc, token=self.token)
+        instances: List[Dict] = [{'address': serv.get('Service').get('Address'),
+                                  'port': serv.get('Service').get('Port')} for serv in list_service]
+        with self._lock:
+            # 已停止监听的 dc 不再写入
+            if (name, dc) in self._watched:
+                self._instances.setdefault(name, {})[dc] = instances
+        return index
+
+    def _watch(self, name: str, dc: str, index: str, token: object):
+        try:
+            while not self._stop_event.is_set() and self._watched.get((name, dc)) is token:
+                try:
+                    index = self._load(name, dc, index)
+                except Exception as ex:
+                    logging.warning(f'consul watch {name}@{dc} error:{ex.args}')
+                    self._stop_event.wait(self.retry_interval)
+        finally:
+            with self._lock:
+                self._watcher_count -= 1
+
+    def _watch_catalog(self):
+        """
+            + 24-06-28 通过 catalog.services 的 blocking query 监听服务目录，
+            返回后(目录变化或超过 wait)重新获取 catalog.datacenters 并同步全部已缓存服务的 dc
+        @return:
+        """
+        index: Optional[str] = None
+        while not self._stop_event.is_set():
+            try:
+                index, _ = self.consul.catalog.services(index=index, wait=self.wait if index else None,
+                                                        token=self.token)
+                if self._stop_event.is_set():
+                    break
+                dcs: List[str] = self.consul.catalog.datacenters()
+                with self._lock:
+                    names: List[str] = list(self._instances.keys())
+                for name in names:
+                    self._sync_dcs(name, dcs)
+            except Exception as ex:
+                logging.warning(f'consul watch catalog error:{ex.args}')
+                self._stop_event.wait(self.retry_interval)
+
+
+# + 24-06-28 按 consul 地址共享服务发现缓存(多个 ConsulClient 不再各自启动监听线程)
+_discovery_caches: Dict[Tuple[str, int, Optional[str]], ConsulDiscoveryCache] = {}
+_discovery_lock = threading.Lock()
+
+
+def get_discovery_cache(consul_obj: consul.Consul, host: str, port: int,
+                        token: str = None) -> ConsulDiscoveryCache:
+    """
+        + 24-06-28 获取指定 consul 地址共享的服务发现缓存
+    @param consul_obj:
+    @param host:
+    @param port:
+    @param token:
+    @return:
+    """
+    key: Tuple[str, int, Optional[str]] = (host, port, token)
+    with _discovery_lock:
+        discovery: Optional[ConsulDiscoveryCache] = _discovery_caches.get(key)
+        if discovery is None:
+            options: Dict = consul_config.CONSUL_OPTIONS.get('DISCOVERY', {})
+            discovery = ConsulDiscoveryCache(consul_obj, token=token, wait=options.get('WAIT', '55s'),
+                                             retry_interval=options.get('RETRY_INTERVAL', 5),
+                                             max_watchers=options.get('MAX_WATCHERS', 8))
+            _discovery_caches[key] = discovery
+        return discovery
+
+
+def stop_consul_discovery():
+    """
+        + 24-06-28 停止全部服务发现缓存的监听线程(fastapi shutdown)
+    @return:
+    """
+    with _discovery_lock:
+        for discovery in _discovery_caches.values():
+            discovery.stop()
+        _discovery_caches.clear()
+
+
+class ConsulClient:
+    """
+        # TODO:[*] 23-11-01 参考文章
+        # https://gitee.com/aichinai/consul_flask/blob/master/ConsulFlask/consulclient.py
+    """
+
+    def __init__(self, host=None, port=None, token=None):
+        """
+            consul 操作类
+        :param host:
+        :param port:
+        :param token:
+        """
+
+        self.host = host  # consul 主机
+        self.port = port  # consul 端口
+        self.token = token
+        self.consul = consul.Consul(host=host, port=port)
+        self.discovery = get_discovery_cache(self.consul, host, port, token=token)
+
+    def register(self, name, service_id, address, port, tags, interval, httpcheck):
+        # 注册服务 注册服务的服务名  端口  以及 健康监测端口
+        self.consul.agent.service.register(name, service_id=service_id, address=address, port=port, tags=tags,
+                                           interval=interval, check=httpcheck)
+        pass
+
+    def get_service(self, name) -> str:
+        """
+            负载均衡获取服务实例
+            TODO:[-] 24-06-13 修改为从服务发现缓存中获取健康实例，不再每次请求 consul 的 catalog 及 health 接口
+        :param name:
+        :return:
+        """
+        service_list: List[Dict] = self.discovery.get_instances(name)
+        if len(service_list) == 0:
+            raise Exception('没有服务可用')
+        # 随机获取一个可用的服务实例
+        service = choice(service_list)
+        service_url: str = f'http://{service["address"]}:{service["port"]}'
+        return service_url
+
+
+class ConsulRegisterServer:
+    """
+        与 start_up 事件绑定并触发实现注册服务
+    """
+
+    # 新建服务时，需要指定consul服务的 主机，端口，所启动的 服务的 主机 端口 以及 restful http 服务 类
+    def __init__(self, service_host, service_port, consul_host, consul_port, app_name):
+        """
+
+        :param service_host: 127.0.0.1  当前服务的实际ip地址
+        :param service_port: 8000
+        :param consul_host: 128.5.9.79   consul 地址
+        :param consul_port: 8500
+        :param app_name: 注册的服务名称
+        """
+        self.service_port = service_port
+        self.service_host = service_host
+        # self.app = appClass(host=host, port=port)
+        # self.appname = self.app.appname
+        self.app_name = app_name
+        self.consul_host = consul_host
+        self.consul_port = consul_port
+
+    def register(self):
+        """
+            基于 self.service_host:self.service_port 注册至 self.consul_host:self.consul_port
+
+        :return:
+        """
+        client = ConsulClient(host=self.consul_host, port=self.consul_port)
+        service_id = self.app_name + self.service_host + ':' + str(self.service_port)
+        # 暂时不用
+        httpcheck = 'http://' + self.service_host + ':' + str(self.service_port) + '/check'
+        # TODO:[*] 23-11-02 注意此处的 check 有错误，无法实现心跳检测
+        # 注意心跳检测 check 的 host 应为 consul 的地址，改为consul的地址
+        # consul.base.BadRequest: 400 Invalid service address
+        client.register(self.app_name, service_id=service_id, address=self.service_host, port=self.service_port,
+                        tags=['master'],
+                        interval='30s',
+                        httpcheck=consul.Check().tcp(self.consul_host, self.consul_port, '5s', '30s', '30s'))  # 注册服务
+        pass
+        # self.app.run()  # 启动服务
+        # uvicorn.run(app=app, host=self.host, port=self.port)
+
+
+class ConsulExtractClient:
+    """
+        consul 获取(客户端)类
+        # TODO:[*] 23-11-06 参考文章: https://www.jianshu.com/p/717a90211b8c
+    """
+
+    def __init__(self, project_name):
+        """初始化，连接consul服务器"""
+        # self.sr = SR(project)
+        self.project_name = project_name
+        self.consul = ConsulClient(host=consul_config.CONSUL_HOST,
+                                   port=consul_config.CONSUL_PORT)
+        self.client = requests.session()
+        self.headers = {'Content-Type': 'application/json', 'Connection': 'keep-alive',
+                        'buc-auth-token': 'default.buc-auth-token'}
+
+    def get(self, uri, decode='utf-8', is_break: bool = False, **kwargs) -> Optional[str]:
+        """
+            获取指定服务地址并返回结果
+        :param uri: 请求的服务的 /area/controller
+        :param decode: 默认: utf-8 用来将 response.content 进行解码
+        :param is_break: 默认: false 若关闭则不会进行多次请求
+        :param kwargs: 若提交需要传入参数，则通过 params:type=dict
+        :return:
+        """
+        try_count = 0
+        # 加入了多次请求的逻辑
+        #
+        address = self.consul.get_service(self.project_name)
+        # 拼接对应的服务请求地址
+        # address : http://xxx:xx/ 是对应的注册服务的地址
+        url = '{0}{1}'.format(address, uri)
+        if kwargs.get('params') is not None:
+            response = self.client.get(
+                url=url,
+                params=kwargs.get('params'),
+                headers=self.headers)
+        else:
+            response = self.client.get(
+                url=url,
+                headers=self.headers)
+        if response.status_code == 200:
+            return response.content.decode(decode)
+            # return response.content
+        else:
+            logging.warning('{0}: status_code is {1}'.format(url, response.status_code))
+        # TODO:[*] 23-11-20 此处取消多次复联的逻辑，会造成延迟较长的连接会多次请求
+        # while try_count < consul_config.CONSUL_MAX_TRY_COUNT:
+        #     address = self.consul.get_service(self.project_name)
+        #     # 拼接对应的服务请求地址
+        #     # address : http://xxx:xx/ 是对应的注册服务的地址
+        #     url = '{0}{1}'.format(address, uri)
+        #     if kwargs.get('params') is not None:
+        #         response = self.client.get(
+        #             url=url,
+        #             params=kwargs.get('params'),
+        #             headers=self.headers)
+        #     else:
+        #         response = self.client.get(
+        #             url=url,
+        #             headers=self.headers)
+        #     # if response.status_code is 200:
+        #     #     self.aiops_consul.update_weight(address, success=True)
+        #     #     return response.content
+        #     # self.aiops_consul.update_weight(address, success=False)
+        #     if response.status_code == 200:
+        #         return response.content.decode(decode)
+        #         # return response.content
+        #     else:
+        #         if is_break:
+        #             break
+        #         try_count += 1
+        #         logging.warning('{0}: status_code is {1}'.format(url, response.status_code))
+        raise Exception('service service is error')
+
+    async def async_get(self, uri, decode='utf-8', **kwargs) -> Optional[str]:
+        """
+            + 24-06-14 通过共享的异步 http 客户端(连接池 + keep-alive)获取指定服务地址并返回结果
+        :param uri: 请求的服务的 /area/controller
+        :param decode: 默认: utf-8 用来将 response.content 进行解码
+        :param kwargs: 若提交需要传入参数，则通过 params:type=dict
+        :return:
+        """
+        # 服务实例从服务发现缓存中获取
+        # TODO:[-] 24-06-28 首次获取时会同步请求 consul(catalog + health)，放入线程池中执行，避免阻塞事件循环
+        address = await run_in_threadpool(self.consul.get_service, self.project_name)
+        url = '{0}{1}'.format(address, uri)
+        response = await get_async_client().get(url, params=kwargs.get('params'), headers=self.headers)
+        if response.status_code == 200:
+            return response.content.decode(decode)
+        else:
+            logging.warning('{0}: status_code is {1}'.format(url, response.status_code))
+        raise Exception('service service is error')
+
+    def post(self, uri, data):
+        try_count = 0
+        while try_count < 5:
+            address = self.consul.get_service(self.project_name)
+            url = '{0}{1}'.format(address, uri)
+            response = self.client.post(
+                url=url,
+                headers=self.headers,
+                data=data)
+            # if response.status_code is 200:
+            #     self.aiops_consul.update_weight(address, success=True)
+            # return response.content
+            # self.aiops_consul.update_weight(address, success=False)
+            try_count += 1
+            logging.warning('{0}: status_code is {1}'.format(url, response.status_code))
+        raise Exception('service service is error')
+
+    def get_task(self, task_id, user):
+        return self.get('/task/get/{0}?user={1}'.format(task_id, user))
+
+    def get_and_run_task(self, task, user):
+        return self.get('/task/getAndRun/{0}?user={1}'.format(task, user))
@@ -0,0 +1,160 @@
+import os
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional
+
+import numpy as np
+import xarray as xar
+
+
+class DatasetCacheItem:
+    """
+        + 24-06-20 已打开的 dataset 及常驻内存的坐标数组
+    """
+
+    def __init__(self, path: str, mtime: float, ds: xar.Dataset):
+        self.path = path
+        self.mtime = mtime
+        self.ds = ds
+        # 坐标数组只在打开时读取一次
+        self.coords: Dict[str, np.ndarray] = {name: np.asarray(coord.values) for name, coord in ds.coords.items()}
+        # 时间坐标(datetime64)转换后的时间戳数组
+        self._ts_coords: Dict[str, np.ndarray] = {}
+        # + 24-06-28 正在读取的请求数，及是否已从缓存中移除(由 DatasetCache 在锁内维护)
+        self.refs: int = 0
+        self.is_retired: bool = False
+
+    def get_ts(self, name: str = 'time') -> np.ndarray:
+        """
+            + 24-06-21 获取时间坐标对应的时间戳(s)数组，整体转换一次后缓存
+        @param name: 时间坐标名称
+        @return:
+        """
+        ts_arr: Optional[np.ndarray] = self._ts_coords.get(name)
+        if ts_arr is None:
+            ts_arr = self.coords[name].astype('datetime64[s]').astype(np.int64)
+            self._ts_coords[name] = ts_arr
+        return ts_arr
+
+    def get_nearest_index(self, name: str, val: float) -> int:
+        """
+            + 24-06-21 获取一维坐标上与 val 最接近的下标(等同于 sel(method='nearest'))
+        @param name: 坐标名称(lat|lon)
+        @param val:
+        @return:
+        """
+        return int(np.abs(self.coords[name] - val).argmin())
+
+    def get_nearest_indexes(self, name: str, vals: np.ndarray) -> np.ndarray:
+        """
+            + 24-06-22 批量获取一维坐标上与 vals 中各值最接近的下标
+        @param name: 坐标名称(lat|lon)
+        @param vals: 一维数组
+        @return:
+        """
+        coord: np.ndarray = self.coords[name]
+        return np.abs(coord[np.newaxis, :] - np.asarray(vals, dtype=np.float64)[:, np.newaxis]).argmin(axis=1)
+
+    def close(self):
+        try:
+            self.ds.close()
+        except Exception as ex:
+            print(f'[!]关闭{self.path}出错:{ex.args}')
+
+
+class DatasetCache:
+    """
+        + 24-06-20 已打开的 nc dataset 的进程内 LRU 缓存
+        - 以 (文件路径, mtime) 作为缓存依据，文件被重新生成(mtime 变化)后会重新打开
+        - 超出 max_size 时淘汰最久未使用的 dataset 并关闭其文件句柄
+        - 24-06-28 通过 acquire / release(或 open 上下文)引用计数，重新打开或淘汰时若仍有请求在读取，
+                   延迟到最后一个请求 release 后再关闭
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._items: 'OrderedDict[str, DatasetCacheItem]' = OrderedDict()
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def acquire(self, path: str) -> Optional[DatasetCacheItem]:
+        """
+            获取指定路径的 dataset(引用计数加一，读取完成后需要调用 release)，文件不存在时返回 None
+        @param path:
+        @return:
+        """
+        try:
+            mtime: float = os.stat(path).st_mtime
+        except OSError:
+            return None
+        with self._lock:
+            item: Optional[DatasetCacheItem] = self._items.get(path)
+            if item is not None and item.mtime == mtime:
+                self._items.move_to_end(path)
+                self.hits += 1
+                item.refs += 1
+                return item
+            self.misses += 1
+            # 打开文件时持有锁，避免并发请求同一文件时重复打开
+            if item is not None:
+                del self._items[path]
+                self._retire(item)
+            item = DatasetCacheItem(path, mtime, xar.open_dataset(path))
+            item.refs += 1
+            self._items[path] = item
+            while len(self._items) > self.max_size:
+                _, oldest_item = self._items.popitem(last=False)
+                self._retire(oldest_item)
+            return item
+
+    def release(self, item: DatasetCacheItem):
+        """
+            + 24-06-28 读取完成，引用计数减一;已从缓存中移除的 dataset 在最后一个请求 release 后关闭
+        @param item:
+        @return:
+        """
+        with self._lock:
+            item.refs -= 1
+            if item.is_retired and item.refs <= 0:
+                item.close()
+
+    @contextmanager
+    def open(self, path: str) -> Iterator[Optional[DatasetCacheItem]]:
+        """
+            + 24-06-28 在上下文中读取指定路径的 dataset(退出时自动 release)
+            eg:
+                with dataset_cache.open(path) as cache_item:
+                    if cache_item is not None:
+                        cache_item.ds[...]
+        @param path:
+        @return:
+        """
+        item: Optional[DatasetCacheItem] = self.acquire(path)
+        try:
+            yield item
+        finally:
+            if item is not None:
+                self.release(item)
+
+    def clear(self):
+        with self._lock:
+            for item in self._items.values():
+                self._retire(item)
+            self._items.clear()
+
+    def _retire(self, item: DatasetCacheItem):
+        """
+            从缓存中移除后调用(需持有锁)，没有请求在读取时立即关闭
+        @param item:
+        @return:
+        """
+        item.is_retired = True
+        if item.refs <= 0:
+            item.close()
+
+    def stats(self) -> Dict:
+        with self._lock:
+            return {'size': len(self._items), 'max_size': self.max_size, 'hits': self.hits, 'misses': self.misses,
+                    'paths': list(self._items.keys())}
@@ -0,0 +1,35 @@
+from typing import Optional, Dict
+
+import httpx
+
+from config.http_config import HTTP_CLIENT_OPTIONS
+
+# + 24-06-14 应用级共享的异步 http 客户端(连接池 + keep-alive)，在 fastapi shutdown 时关闭
+_async_client: Optional[httpx.AsyncClient] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """
+        获取共享的异步 http 客户端(首次调用时创建)
+    @return:
+    """
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        options: Dict = HTTP_CLIENT_OPTIONS.get('REMOTE')
+        limits = httpx.Limits(max_connections=options.get('MAX_CONNECTIONS'),
+                              max_keepalive_connections=options.get('MAX_KEEPALIVE_CONNECTIONS'),
+                              keepalive_expiry=options.get('KEEPALIVE_EXPIRY'))
+        timeout = httpx.Timeout(options.get('READ_TIMEOUT'), connect=options.get('CONNECT_TIMEOUT'))
+        _async_client = httpx.AsyncClient(limits=limits, timeout=timeout)
+    return _async_client
+
+
+async def close_async_client():
+    """
+        fastapi shutdown 时关闭连接池
+    @return:
+    """
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+    _async_client = None
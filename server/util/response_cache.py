@@ -0,0 +1,234 @@
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.responses import Response
+
+# 响应缓存按该查询参数归类，用于按发布时次使缓存失效
+ISSUE_PARAM: str = 'issue_ts'
+# + 24-06-30 空结果(该 issue 尚未入库)不缓存
+EMPTY_BODIES: Set[bytes] = {b'', b'[]', b'{}', b'null'}
+# + 24-06-30 保留原始响应头时排除的头(由缓存重新生成)
+EXCLUDED_HEADERS: Set[bytes] = {b'content-length', b'content-type', b'etag', b'last-modified', b'cache-control'}
+
+
+class CachedResponse:
+    """
+        + 24-06-19 缓存的响应
+    """
+
+    def __init__(self, body: bytes, media_type: str, issue_ts: int, headers: List[Tuple[bytes, bytes]] = None):
+        """
+        @param body:
+        @param media_type:
+        @param issue_ts:
+        @param headers: + 24-06-30 原始响应头(raw_headers，已排除 EXCLUDED_HEADERS)，命中缓存及 304 时原样返回
+        """
+        self.body = body
+        self.media_type = media_type
+        self.issue_ts = issue_ts
+        self.headers: List[Tuple[bytes, bytes]] = headers if headers is not None else []
+        self.etag: str = f'"{hashlib.sha1(body).hexdigest()}"'
+        self.modified_at: int = int(time.time())
+        self.last_modified: str = formatdate(self.modified_at, usegmt=True)
+
+    @property
+    def size(self) -> int:
+        return len(self.body)
+
+    @property
+    def is_empty(self) -> bool:
+        return self.body.strip() in EMPTY_BODIES
+
+
+class ResponseCache:
+    """
+        + 24-06-19 进程内响应缓存(LRU)
+        按 path + 排序后的查询参数缓存响应体，同时限制缓存条数及总字节数，超出时淘汰最久未使用的缓存;
+        缓存按 issue_ts 建立索引，某个发布时次重新入库后调用 invalidate_issue 使其全部失效
+    """
+
+    def __init__(self, max_entries: int, max_bytes: int):
+        """
+        @param max_entries: 最大缓存条数
+        @param max_bytes: 缓存响应体的最大总字节数
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._items: 'OrderedDict[str, CachedResponse]' = OrderedDict()
+        # {issue_ts: {key}}
+        self._issue_keys: Dict[int, Set[str]] = {}
+        self._size: int = 0
+        # + 24-06-28 失效代数: 每次 invalidate_issue 对应 issue 加一，clear 时全局加一
+        self._issue_generations: Dict[int, int] = {}
+        self._generation: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            item: Optional[CachedResponse] = self._items.get(key)
+            if item is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return item
+
+    def get_generation(self, issue_ts: int) -> Tuple[int, int]:
+        """
+            + 24-06-28 获取指定发布时次当前的失效代数(未命中时在执行请求前记录)
+        @param issue_ts:
+        @return: (全局代数, issue 代数)
+        """
+        with self._lock:
+            return self._generation, self._issue_generations.get(issue_ts, 0)
+
+    def set(self, key: str, item: CachedResponse, generation: Optional[Tuple[int, int]] = None):
+        """
+            写入缓存，单个响应超过 max_bytes 时不缓存
+            - 24-06-28 generation 与当前失效代数不一致时不缓存
+                       (请求执行期间该 issue 重新入库并已失效，此时的响应可能是旧数据)
+        @param key:
+        @param item:
+        @param generation: 执行请求前通过 get_generation 获取的失效代数
+        @return:
+        """
+        if item.size > self.max_bytes:
+            return
+        with self._lock:
+            if generation is not None and generation != (
+                    self._generation, self._issue_generations.get(item.issue_ts, 0)):
+                return
+            self._pop(key)
+            self._items[key] = item
+            self._issue_keys.setdefault(item.issue_ts, set()).add(key)
+            self._size += item.size
+            while len(self._items) > self.max_entries or self._size > self.max_bytes:
+                oldest_key: str = next(iter(self._items))
+                self._pop(oldest_key)
+                self.evictions += 1
+
+    def invalidate_issue(self, issue_ts: int) -> int:
+        """
+            使指定发布时次的全部缓存失效
+        @param issue_ts:
+        @return: 失效的缓存条数
+        """
+        with self._lock:
+            self._issue_generations[issue_ts] = self._issue_generations.get(issue_ts, 0) + 1
+            keys: Set[str] = self._issue_keys.get(issue_ts, set())
+            for key in list(keys):
+                self._pop(key)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._items.clear()
+            self._issue_keys.clear()
+            self._size = 0
+
+    def stats(self) -> Dict:
+        """
+            获取缓存状态
+        @return:
+        """
+        with self._lock:
+            return {'entries': len(self._items), 'bytes': self._size, 'max_entries': self.max_entries,
+                    'max_bytes': self.max_bytes, 'hits': self.hits, 'misses': self.misses,
+                    'evictions': self.evictions, 'issues': sorted(self._issue_keys.keys())}
+
+    def _pop(self, key: str):
+        item: Optional[CachedResponse] = self._items.pop(key, None)
+        if item is None:
+            return
+        self._size -= item.size
+        keys: Optional[Set[str]] = self._issue_keys.get(item.issue_ts)
+        if keys is not None:
+            keys.discard(key)
+            if len(keys) == 0:
+                del self._issue_keys[item.issue_ts]
+
+
+class ResponseCacheMiddleware(BaseHTTPMiddleware):
+    """
+        + 24-06-19 对指定的(已发布后不再变化的)预报接口缓存响应，并返回 ETag / Last-Modified
+        - 只缓存带有 issue_ts 参数且返回 200 的 GET 请求
+        - 24-06-30 不缓存空结果(issue 尚未入库时的空列表等)，缓存及 304 响应保留原始响应头
+        - 请求头 If-None-Match / If-Modified-Since 与缓存一致时返回 304
+        - Cache-Control: no-cache，浏览器每次都会带上校验头重新验证，重新入库后可立即拿到新数据
+    """
+
+    def __init__(self, app, cache: ResponseCache, paths: Iterable[str]):
+        super().__init__(app)
+        self.cache = cache
+        self.paths: Set[str] = set(paths)
+
+    async def dispatch(self, request: Request, call_next) -> Response:
+        if request.method != 'GET' or request.url.path not in self.paths:
+            return await call_next(request)
+        try:
+            issue_ts: int = int(request.query_params.get(ISSUE_PARAM))
+        except (TypeError, ValueError):
+            return await call_next(request)
+        key: str = self.get_key(request)
+        item: Optional[CachedResponse] = self.cache.get(key)
+        if item is None:
+            # 执行请求前记录失效代数，写入时若已变化则不缓存
+            generation: Tuple[int, int] = self.cache.get_generation(issue_ts)
+            response: Response = await call_next(request)
+            if response.status_code != 200:
+                return response
+            body: bytes = b''.join([chunk async for chunk in response.body_iterator])
+            raw_headers: List[Tuple[bytes, bytes]] = [(name, value) for name, value in response.raw_headers if
+                                                      name.lower() not in EXCLUDED_HEADERS]
+            item = CachedResponse(body, response.media_type or response.headers.get('content-type'), issue_ts,
+                                  raw_headers)
+            if not item.is_empty:
+                self.cache.set(key, item, generation)
+        headers: Dict[str, str] = {'ETag': item.etag, 'Last-Modified': item.last_modified,
+                                   'Cache-Control': 'no-cache'}
+        if self.is_not_modified(request, item):
+            res: Response = Response(status_code=304, headers=headers)
+        else:
+            res = Response(content=item.body, status_code=200, headers=headers, media_type=item.media_type)
+        res.raw_headers.extend(item.headers)
+        return res
+
+    @staticmethod
+    def get_key(request: Request) -> str:
+        """
+            缓存 key: path + 排序后的查询参数(参数顺序不同的请求共用同一份缓存)
+        @param request:
+        @return:
+        """
+        params: List[str] = sorted(f'{name}={value}' for name, value in request.query_params.multi_items())
+        return f'{request.url.path}?{"&".join(params)}'
+
+    @staticmethod
+    def is_not_modified(request: Request, item: CachedResponse) -> bool:
+        """
+            判断客户端缓存是否仍然有效(If-None-Match 优先于 If-Modified-Since)
+        @param request:
+        @param item:
+        @return:
+        """
+        if_none_match: Optional[str] = request.headers.get('if-none-match')
+        if if_none_match is not None:
+            etags: List[str] = [etag.strip() for etag in if_none_match.split(',')]
+            return '*' in etags or item.etag in etags or f'W/{item.etag}' in etags
+        if_modified_since: Optional[str] = request.headers.get('if-modified-since')
+        if if_modified_since is not None:
+            try:
+                return parsedate_to_datetime(if_modified_since).timestamp() >= item.modified_at
+            except (TypeError, ValueError):
+                return False
+        return False
@@ -0,0 +1,151 @@
+import os
+import json
+import pathlib
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+HOUR_SECONDS: int = 3600
+
+
+class AstronomicTideStore:
+    """
+        + 24-06-16 本地天文潮存储
+        所有站点逐时天文潮保存为 float64 二维数组 [station, hour](缺测为 nan)，
+        以 np.memmap 的方式持久化至 root_path 下，重启后可直接映射读取
+        - {name}.json: 元数据 {'start_ts','hours','codes','data_file'}
+        - {name}_{start_ts}.dat: 数据文件(每次重建写入新文件，写完后再替换元数据，读取方不会读到写了一半的文件)
+    """
+
+    def __init__(self, root_path: str, name: str = 'astronomic_tide'):
+        self.root_path = pathlib.Path(root_path)
+        self.name = name
+        self._lock = threading.Lock()
+        self.start_ts: int = 0
+        self.hours: int = 0
+        self._index: Dict[str, int] = {}
+        self._data: Optional[np.ndarray] = None
+
+    @property
+    def meta_path(self) -> pathlib.Path:
+        return self.root_path / f'{self.name}.json'
+
+    @property
+    def end_ts(self) -> int:
+        return self.start_ts + (self.hours - 1) * HOUR_SECONDS
+
+    def load(self) -> bool:
+        """
+            从本地文件映射已有的天文潮数据
+        @return: 是否加载成功
+        """
+        if not self.meta_path.is_file():
+            return False
+        try:
+            meta: Dict = json.loads(self.meta_path.read_text(encoding='utf-8'))
+            codes: List[str] = meta.get('codes')
+            hours: int = meta.get('hours')
+            data = np.memmap(self.root_path / meta.get('data_file'), dtype=np.float64, mode='r',
+                             shape=(len(codes), hours))
+        except Exception as ex:
+            print(f'[!]加载本地天文潮存储出错:{ex.args}')
+            return False
+        with self._lock:
+            self.start_ts = meta.get('start_ts')
+            self.hours = hours
+            self._index = {code: index for index, code in enumerate(codes)}
+            self._data = data
+        return True
+
+    def save(self, start_ts: int, hours: int, dict_series: Dict[str, Tuple[List[int], List[float]]]):
+        """
+            重建本地存储(写入新的数据文件后替换元数据并重新映射)
+        @param start_ts: 起始时间戳(整点)
+        @param hours: 小时数
+        @param dict_series: {station_code: (forecast_ts_list, tide_list)}
+        @return:
+        """
+        codes: List[str] = sorted(dict_series.keys())
+        if len(codes) == 0 or hours <= 0:
+            return
+        self.root_path.mkdir(parents=True, exist_ok=True)
+        data_file: str = f'{self.name}_{start_ts}.dat'
+        data = np.memmap(self.root_path / data_file, dtype=np.float64, mode='w+', shape=(len(codes), hours))
+        data[:] = np.nan
+        for row, code in enumerate(codes):
+            forecast_ts_list, tide_list = dict_series[code]
+            ts_arr: np.ndarray = np.asarray(forecast_ts_list, dtype=np.int64)
+            tide_arr: np.ndarray = np.asarray(tide_list, dtype=np.float64)
+            # 只保留落在 [start_ts, start_ts + hours) 内的整点数据
+            offset: np.ndarray = ts_arr - start_ts
+            valid: np.ndarray = (offset >= 0) & (offset % HOUR_SECONDS == 0) & (offset < hours * HOUR_SECONDS)
+            data[row, offset[valid] // HOUR_SECONDS] = tide_arr[valid]
+        data.flush()
+        del data
+        meta: Dict = {'start_ts': start_ts, 'hours': hours, 'codes': codes, 'data_file': data_file}
+        tmp_meta_path: pathlib.Path = self.root_path / f'{self.name}.json.tmp'
+        tmp_meta_path.write_text(json.dumps(meta), encoding='utf-8')
+        os.replace(str(tmp_meta_path), str(self.meta_path))
+        self.load()
+        # 删除旧的数据文件(已映射的旧数据在 linux 下仍可继续读取)
+        for old_file in self.root_path.glob(f'{self.name}_*.dat'):
+            if old_file.name != data_file:
+                old_file.unlink()
+
+    def _get_range(self, start_ts: int, end_ts: int) -> Optional[Tuple[int, int]]:
+        """
+            获取 [start_ts, end_ts] 对应的列下标范围，不在存储范围内时返回 None
+        @param start_ts:
+        @param end_ts:
+        @return: (起始下标, 结束下标(不含))
+        """
+        if self._data is None or start_ts < self.start_ts or end_ts > self.end_ts or start_ts > end_ts:
+            return None
+        start_index: int = -(-(start_ts - self.start_ts) // HOUR_SECONDS)
+        end_index: int = (end_ts - self.start_ts) // HOUR_SECONDS + 1
+        return start_index, end_index
+
+    def get_station(self, code: str, start_ts: int, end_ts: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """
+            获取指定站点 [start_ts, end_ts] 内的逐时天文潮
+        @param code:
+        @param start_ts:
+        @param end_ts:
+        @return: (forecast_ts 数组, tide 数组)，范围未完全覆盖或存在缺测时返回 None
+        """
+        with self._lock:
+            index_range = self._get_range(start_ts, end_ts)
+            row: Optional[int] = self._index.get(code)
+            if index_range is None or row is None:
+                return None
+            start_index, end_index = index_range
+            tide_arr: np.ndarray = np.array(self._data[row, start_index:end_index])
+            base_ts: int = self.start_ts
+        if np.isnan(tide_arr).any():
+            return None
+        ts_arr: np.ndarray = base_ts + np.arange(start_index, end_index, dtype=np.int64) * HOUR_SECONDS
+        return ts_arr, tide_arr
+
+    def get_dist(self, start_ts: int, end_ts: int) -> Optional[Dict[str, Tuple[np.ndarray, np.ndarray]]]:
+        """
+            获取所有站点 [start_ts, end_ts] 内的逐时天文潮(去掉缺测)
+        @param start_ts:
+        @param end_ts:
+        @return: {station_code: (forecast_ts 数组, tide 数组)}，范围未完全覆盖时返回 None
+        """
+        with self._lock:
+            index_range = self._get_range(start_ts, end_ts)
+            if index_range is None:
+                return None
+            start_index, end_index = index_range
+            block: np.ndarray = np.array(self._data[:, start_index:end_index])
+            index: Dict[str, int] = self._index
+            base_ts: int = self.start_ts
+        ts_arr: np.ndarray = base_ts + np.arange(start_index, end_index, dtype=np.int64) * HOUR_SECONDS
+        dict_res: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        for code, row in index.items():
+            valid: np.ndarray = ~np.isnan(block[row])
+            if valid.any():
+                dict_res[code] = (ts_arr[valid], block[row][valid])
+        return dict_res